@@ -1,11 +1,38 @@
-from ._create import create
-from ._decode import decode
+from ._batch import create_many, imap_create, imap_create_unordered
+from ._binary import from_bytes, from_bytes_many, to_bytes, to_bytes_many
+from ._create import (
+    create,
+    create_from_bytes,
+    create_from_file,
+    create_from_object,
+    create_from_stream,
+    create_multi,
+)
+from ._decode import decode, decode_many, validate_many
+from ._dedup import Deduplicator, DeduplicatorStats
 from ._find_matches import find_matches
+from ._fingerprint_cache import FingerprintCache
+from ._hash_registry import available_hash_functions, register_hash_function
+from ._incremental import IncrementalFingerprint
+from ._index import FingerprintIndex
+from ._json_backends import (
+    available_json_backends,
+    get_json_backend,
+    register_json_backend,
+    set_json_backend,
+)
+from ._limits import Limits
 from ._match import match
+from ._ndjson import create_from_ndjson
+from ._parallel import create_parallel
+from ._profile import CreateProfile, add_profile_hook, profile, remove_profile_hook
+from ._subtree_cache import SubtreeCache
 from .exceptions import (
     FingerprintPattern,
     FingerprintVersion,
     HashFunction,
     InputDataType,
     JSONLoad,
+    JSONPatch,
+    LimitExceeded,
 )
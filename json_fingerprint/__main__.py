@@ -0,0 +1,113 @@
+import argparse
+import sys
+import time
+from typing import IO, List, Optional, Tuple
+
+from ._batch import DEFAULT_CHUNKSIZE
+from ._binary import to_bytes
+from ._hash_registry import available_hash_functions
+from ._ndjson import DEFAULT_BUFFER_SIZE, NDJSON_ERRORS, create_from_ndjson
+from .exceptions import HashFunction, JSONLoad
+
+
+class _CountingReader:
+    """A binary stream wrapper that counts the bytes read."""
+
+    def __init__(self, stream: IO):
+        self._stream = stream
+        self.nbytes = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._stream.read(size)
+        self.nbytes += len(data)
+        return data
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m json_fingerprint",
+        description="Create JSON fingerprints of newline-delimited JSON records, and write 'line_no<TAB>fingerprint' lines.",
+    )
+    parser.add_argument("files", nargs="*", default=["-"], help="NDJSON files to read, or '-' for the standard input (default).")
+    parser.add_argument("--hash-function", default="sha256", choices=available_hash_functions(), help="The hash function (default: sha256).")
+    parser.add_argument("--errors", default="raise", choices=NDJSON_ERRORS, help="Fail on invalid records, or skip them (default: raise).")
+    parser.add_argument("--workers", type=int, default=1, help="The number of worker processes (default: 1).")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help=f"Records per chunk (default: {DEFAULT_CHUNKSIZE}).")
+    parser.add_argument("--buffer-size", type=int, default=DEFAULT_BUFFER_SIZE, help=f"Bytes read at a time (default: {DEFAULT_BUFFER_SIZE}).")
+    parser.add_argument(
+        "--binary", action="store_true", help="Write the fingerprints in the binary format, without line numbers (not with --errors skip)."
+    )
+    parser.add_argument("--report", action="store_true", help="Write a throughput report into the standard error.")
+    args = parser.parse_args(argv)
+    if args.binary and args.errors == "skip":
+        # Binary records have no line numbers, so skipped records would shift the records after them
+        parser.error("argument --binary: not allowed with argument --errors skip")
+    return args
+
+
+def _fingerprint_file(args: argparse.Namespace, stream: IO, prefix: str, output: IO) -> Tuple[int, int]:
+    """Fingerprint the records of a stream into the output, and return the numbers of valid and invalid records."""
+    valid = 0
+    invalid = 0
+    records = create_from_ndjson(
+        stream=stream,
+        hash_function=args.hash_function,
+        version=1,
+        errors=args.errors,
+        workers=args.workers,
+        chunksize=args.chunksize,
+        buffer_size=args.buffer_size,
+    )
+    for line_no, fingerprint in records:
+        if fingerprint is None:
+            invalid += 1
+            continue
+        valid += 1
+        if args.binary:
+            output.write(to_bytes(fingerprint=fingerprint))
+        else:
+            output.write(f"{prefix}{line_no}\t{fingerprint}\n".encode("ascii"))
+    return valid, invalid
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the command, and return the exit status: 0 on success, or 1 on unreadable files and on invalid records with --errors raise."""
+    args = _parse_args(argv)
+    output = sys.stdout.buffer
+    valid = 0
+    invalid = 0
+    nbytes = 0
+    start = time.perf_counter()
+    try:
+        for path in args.files:
+            # Line numbers are prefixed with the file name when there are multiple files
+            prefix = f"{path}\t" if len(args.files) > 1 else ""
+            if path == "-":
+                stream = _CountingReader(stream=sys.stdin.buffer)
+                file_valid, file_invalid = _fingerprint_file(args=args, stream=stream, prefix=prefix, output=output)
+            else:
+                with open(path, "rb") as file:
+                    stream = _CountingReader(stream=file)
+                    file_valid, file_invalid = _fingerprint_file(args=args, stream=stream, prefix=prefix, output=output)
+            valid += file_valid
+            invalid += file_invalid
+            nbytes += stream.nbytes
+    except (HashFunction, JSONLoad, OSError, ValueError) as exc:
+        output.flush()
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    output.flush()
+
+    if args.report:
+        seconds = time.perf_counter() - start
+        records = valid + invalid
+        print(
+            f"{records} records ({invalid} invalid), {nbytes} bytes in {seconds:.3f} s: "
+            f"{records / seconds if seconds else 0:.1f} records/s, {nbytes / seconds / 1e6 if seconds else 0:.2f} MB/s",
+            file=sys.stderr,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,357 @@
+import itertools
+import os
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from multiprocessing import shared_memory as _shared_memory
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from ._create import create
+from ._validators import (
+    _validate_hash_function,
+    _validate_input_type,
+    _validate_version,
+)
+
+DEFAULT_CHUNKSIZE = 256
+
+
+def _create_chunk(inputs: List[str], hash_function: str, version: int) -> List[str]:
+    """Create JSON fingerprints of a chunk of inputs in a worker process."""
+    return [create(input=input, hash_function=hash_function, version=version) for input in inputs]
+
+
+def _create_shared_chunk(segment: Tuple[str, List[int]], hash_function: str, version: int) -> List[str]:
+    """Create JSON fingerprints of a chunk of inputs in a shared memory segment in a worker process.
+
+    Each input is decoded straight from the segment into a string, so only the segment name and the input offsets are
+    pickled. The segment is attached for the chunk only, so no worker process keeps it mapped once the calling process
+    removes it.
+    """
+    name, offsets = segment
+    shared = _shared_memory.SharedMemory(name=name)
+    try:
+        fingerprints = []
+        for start, end in zip(offsets, offsets[1:]):
+            with shared.buf[start:end] as view:
+                input = str(view, "utf-8", "surrogatepass")
+            fingerprints.append(create(input=input, hash_function=hash_function, version=version))
+        return fingerprints
+    finally:
+        shared.close()
+
+
+class _SegmentPool:
+    """Shared memory segments for chunks of inputs, which are reused once their chunks are complete.
+
+    Writing into a new segment faults in each of its pages, which costs several times more than the copy itself, so the
+    segments are reused instead of creating one per chunk. A new segment is sized to a power of two, and replaces a free
+    segment that's too small, so the number of segments is bounded by the number of chunks in flight.
+    """
+
+    def __init__(self):
+        self._free: List[_shared_memory.SharedMemory] = []
+        self._segments: List[_shared_memory.SharedMemory] = []
+
+    def share(self, inputs: List[str]) -> Tuple[_shared_memory.SharedMemory, List[int]]:
+        """Copy a chunk of inputs into a segment in UTF-8, and return the segment and the input offsets."""
+        encoded = []
+        offsets = [0]
+        for input in inputs:
+            _validate_input_type(input=input)
+            data = input.encode("utf-8", "surrogatepass")
+            encoded.append(data)
+            offsets.append(offsets[-1] + len(data))
+
+        size = offsets[-1]
+        segment = next((segment for segment in self._free if segment.size >= size), None)
+        if segment is None:
+            if self._free:
+                self._remove(self._free[0])
+            # Segments can't be empty
+            segment = _shared_memory.SharedMemory(create=True, size=1 << max(size - 1, 1).bit_length())
+            self._segments.append(segment)
+        else:
+            self._free.remove(segment)
+
+        for start, end, data in zip(offsets, offsets[1:], encoded):
+            segment.buf[start:end] = data
+        return segment, offsets
+
+    def release(self, segment: _shared_memory.SharedMemory) -> None:
+        """Return the segment of a complete chunk to the pool."""
+        self._free.append(segment)
+
+    def _remove(self, segment: _shared_memory.SharedMemory) -> None:
+        self._free.remove(segment)
+        self._segments.remove(segment)
+        segment.close()
+        segment.unlink()
+
+    def close(self) -> None:
+        """Remove all segments."""
+        for segment in self._segments:
+            segment.close()
+            segment.unlink()
+        self._free = []
+        self._segments = []
+
+
+def _iter_chunks(inputs: Iterable[str], chunksize: int) -> Iterator[List[str]]:
+    iterator = iter(inputs)
+    chunk = list(itertools.islice(iterator, chunksize))
+    while chunk:
+        yield chunk
+        chunk = list(itertools.islice(iterator, chunksize))
+
+
+def _validate_batch_options(workers: Optional[int], chunksize: int, max_pending: Optional[int]):
+    if workers is not None and workers < 1:
+        raise ValueError(f"Expected a positive number of workers, instead got '{workers}'")
+    if chunksize < 1:
+        raise ValueError(f"Expected a positive chunksize, instead got '{chunksize}'")
+    if max_pending is not None and max_pending < 1:
+        raise ValueError(f"Expected a positive number of pending chunks, instead got '{max_pending}'")
+
+
+def _submit_chunk(
+    executor: Executor,
+    chunk: List[Any],
+    function: Callable[..., List[Any]],
+    args: Tuple[Any, ...],
+    segments: Optional[_SegmentPool],
+    shared_function: Optional[Callable[..., List[Any]]],
+) -> Tuple[Future, Optional[_shared_memory.SharedMemory]]:
+    """Submit a chunk to the process pool, pickled or copied into a shared memory segment, and return its future and segment."""
+    if segments is None:
+        return executor.submit(function, chunk, *args), None
+    segment, offsets = segments.share(inputs=chunk)
+    return executor.submit(shared_function, (segment.name, offsets), *args), segment
+
+
+def _imap_pool_chunks(
+    executor: Executor,
+    chunks: Iterator[Tuple[int, List[Any]]],
+    submit: Callable[[List[Any]], Tuple[Future, Optional[_shared_memory.SharedMemory]]],
+    segments: Optional[_SegmentPool],
+    max_pending: int,
+    ordered: bool,
+) -> Iterator[Tuple[int, List[Any]]]:
+    """Keep up to `max_pending` chunks in flight on the process pool, and yield (chunk index, results) pairs."""
+    # Futures of the chunks in flight, and their chunk indices and shared memory segments
+    pending = {}
+    try:
+        for index, chunk in itertools.islice(chunks, max_pending):
+            future, segment = submit(chunk)
+            pending[future] = (index, segment)
+        queue = deque(pending) if ordered else None
+        while pending:
+            done = (queue.popleft(),) if ordered else wait(pending, return_when=FIRST_COMPLETED)[0]
+            for future in done:
+                index, segment = pending.pop(future)
+                results = future.result()
+                if segment is not None:
+                    segments.release(segment)
+                yield index, results
+                for index, chunk in itertools.islice(chunks, 1):
+                    next_future, segment = submit(chunk)
+                    pending[next_future] = (index, segment)
+                    if ordered:
+                        queue.append(next_future)
+    finally:
+        # When closed early, the chunks in flight are waited for instead of being cancelled, so that the pool
+        # shuts down with no work left. On Python 3.9, cancelled futures can deadlock the pool's shutdown
+        wait(pending)
+
+
+def _imap_chunks(
+    inputs: Iterable[Any],
+    function: Callable[..., List[Any]],
+    args: Tuple[Any, ...],
+    workers: Optional[int],
+    chunksize: int,
+    max_pending: Optional[int],
+    ordered: bool,
+    shared_function: Optional[Callable[..., List[Any]]] = None,
+) -> Iterator[Tuple[int, List[Any]]]:
+    """Process inputs in chunks on a process pool with `function(chunk, *args)`, and yield (chunk index, results) pairs.
+
+    Inputs are consumed lazily, and at most `max_pending` chunks are dispatched to the workers at a time, which bounds
+    the memory held by inputs and results in flight.
+
+    With a `shared_function`, each chunk of string inputs is copied into a shared memory segment instead of pickling it,
+    and `shared_function((segment name, input offsets), *args)` is called in the worker. The segments are removed when
+    the process pool has shut down.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = enumerate(_iter_chunks(inputs=inputs, chunksize=chunksize))
+    if workers == 1:
+        # No process pool, as there's nothing to parallelize
+        for index, chunk in chunks:
+            yield index, function(chunk, *args)
+        return
+
+    segments = _SegmentPool() if shared_function is not None else None
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from _imap_pool_chunks(
+                executor=executor,
+                chunks=chunks,
+                submit=lambda chunk: _submit_chunk(
+                    executor=executor, chunk=chunk, function=function, args=args, segments=segments, shared_function=shared_function
+                ),
+                segments=segments,
+                max_pending=max_pending or 2 * workers,
+                ordered=ordered,
+            )
+    finally:
+        # The workers have exited, so no segment is in use anymore
+        if segments is not None:
+            segments.close()
+
+
+def imap_create(
+    inputs: Iterable[str],
+    hash_function: str,
+    version: int,
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    max_pending: Optional[int] = None,
+    shared_memory: bool = False,
+) -> Iterator[str]:
+    """Create JSON fingerprints of multiple inputs in parallel, and iterate over them in input order.
+
+    The inputs are consumed lazily and dispatched in chunks to a pool of worker processes. At most `max_pending` chunks
+    are in flight at a time, so arbitrarily long (or endless) input iterables can be processed with bounded memory.
+
+    Args:
+        inputs (iterable of strings):
+            JSON inputs in string format.
+        hash_function (str):
+            One of the supported hash function names in string format (options: "sha256", "sha384", "sha512",
+            "blake2b", "blake2s", or a registered hash function).
+        version (int):
+            An integer indicating the JSON fingerprint algorithm version to be used (options: 1).
+        workers (int):
+            The number of worker processes. Defaults to the number of CPUs. With 1 worker, no processes are started.
+        chunksize (int):
+            The number of inputs dispatched to a worker process at a time. 256 by default.
+        max_pending (int):
+            The maximum number of chunks in flight. Defaults to twice the number of workers.
+        shared_memory (bool):
+            Pass the inputs to the worker processes in shared memory segments instead of pickling them, which saves
+            copying big inputs through a pipe. False by default.
+
+    Returns:
+        iterator: An iterator of JSON fingerprints in string format, in the same order as the inputs.
+    """
+    _validate_version(version=version)
+    _validate_hash_function(hash_function=hash_function, version=version)
+    _validate_batch_options(workers=workers, chunksize=chunksize, max_pending=max_pending)
+    chunks = _imap_chunks(
+        inputs=inputs,
+        function=_create_chunk,
+        args=(hash_function, version),
+        workers=workers,
+        chunksize=chunksize,
+        max_pending=max_pending,
+        shared_function=_create_shared_chunk if shared_memory else None,
+        ordered=True,
+    )
+    return (fingerprint for _, fingerprints in chunks for fingerprint in fingerprints)
+
+
+def imap_create_unordered(
+    inputs: Iterable[str],
+    hash_function: str,
+    version: int,
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    max_pending: Optional[int] = None,
+    shared_memory: bool = False,
+) -> Iterator[Tuple[int, str]]:
+    """Create JSON fingerprints of multiple inputs in parallel, and iterate over them in completion order.
+
+    Works like `imap_create()`, but yields the fingerprints of each chunk as soon as it's complete, regardless of the
+    input order, along with the index of the input.
+
+    Args:
+        inputs (iterable of strings):
+            JSON inputs in string format.
+        hash_function (str):
+            One of the supported hash function names in string format (options: "sha256", "sha384", "sha512",
+            "blake2b", "blake2s", or a registered hash function).
+        version (int):
+            An integer indicating the JSON fingerprint algorithm version to be used (options: 1).
+        workers (int):
+            The number of worker processes. Defaults to the number of CPUs. With 1 worker, no processes are started.
+        chunksize (int):
+            The number of inputs dispatched to a worker process at a time. 256 by default.
+        max_pending (int):
+            The maximum number of chunks in flight. Defaults to twice the number of workers.
+        shared_memory (bool):
+            Pass the inputs to the worker processes in shared memory segments instead of pickling them, which saves
+            copying big inputs through a pipe. False by default.
+
+    Returns:
+        iterator: An iterator of (input index, JSON fingerprint) tuples.
+    """
+    _validate_version(version=version)
+    _validate_hash_function(hash_function=hash_function, version=version)
+    _validate_batch_options(workers=workers, chunksize=chunksize, max_pending=max_pending)
+    chunks = _imap_chunks(
+        inputs=inputs,
+        function=_create_chunk,
+        args=(hash_function, version),
+        workers=workers,
+        chunksize=chunksize,
+        max_pending=max_pending,
+        shared_function=_create_shared_chunk if shared_memory else None,
+        ordered=False,
+    )
+    return ((index * chunksize + i, fingerprint) for index, fingerprints in chunks for i, fingerprint in enumerate(fingerprints))
+
+
+def create_many(
+    inputs: Iterable[str],
+    hash_function: str,
+    version: int,
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    shared_memory: bool = False,
+) -> List[str]:
+    """Create JSON fingerprints of multiple inputs in parallel on a pool of worker processes.
+
+    Args:
+        inputs (iterable of strings):
+            JSON inputs in string format.
+        hash_function (str):
+            One of the supported hash function names in string format (options: "sha256", "sha384", "sha512",
+            "blake2b", "blake2s", or a registered hash function).
+        version (int):
+            An integer indicating the JSON fingerprint algorithm version to be used (options: 1).
+        workers (int):
+            The number of worker processes. Defaults to the number of CPUs. With 1 worker, no processes are started.
+        chunksize (int):
+            The number of inputs dispatched to a worker process at a time. 256 by default.
+        shared_memory (bool):
+            Pass the inputs to the worker processes in shared memory segments instead of pickling them. False by
+            default.
+
+    Returns:
+        list: A list of JSON fingerprints in string format, in the same order as the inputs.
+    """
+    fingerprints = imap_create(
+        inputs=inputs,
+        hash_function=hash_function,
+        version=version,
+        workers=workers,
+        chunksize=chunksize,
+        shared_memory=shared_memory,
+    )
+    return list(fingerprints)
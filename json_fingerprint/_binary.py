@@ -0,0 +1,136 @@
+from typing import Dict, Iterable, List, Tuple
+
+from ._decode import decode, decode_many
+from ._hash_registry import HASH_FUNCTION_IDS, _add_register_hook
+from ._validators import DIGEST_SIZES, _validate_fingerprint_bytes_type
+from .exceptions import FingerprintPattern, FingerprintVersion, HashFunction
+
+# Record formats by header (version byte and hash function id byte as a big-endian integer): (text prefix, digest size)
+_RECORD_FORMATS: Dict[int, Tuple[str, int]] = {}
+
+
+def _add_record_format(hash_function: str) -> None:
+    hash_id = HASH_FUNCTION_IDS.get(hash_function)
+    if hash_id is not None:
+        _RECORD_FORMATS[1 << 8 | hash_id] = (f"jfpv1${hash_function}$", DIGEST_SIZES[hash_function])
+
+
+def _remove_record_format(hash_function: str) -> None:
+    hash_id = HASH_FUNCTION_IDS.get(hash_function)
+    if hash_id is not None:
+        del _RECORD_FORMATS[1 << 8 | hash_id]
+
+
+_add_register_hook(_add_record_format, _remove_record_format)
+
+
+def _hash_function_id(hash_function: str) -> int:
+    hash_id = HASH_FUNCTION_IDS.get(hash_function)
+    if hash_id is None:
+        err = f"Expected one of hash functions with a binary id '{tuple(HASH_FUNCTION_IDS)}', instead got '{hash_function}'"
+        raise HashFunction(err)
+    return hash_id
+
+
+def _record_format(data: memoryview, pos: int) -> Tuple[str, int]:
+    """Get the text prefix and digest size of the binary fingerprint record at `pos`."""
+    if len(data) - pos < 2:
+        err = f"Expected binary JSON fingerprint header at offset {pos}, instead got {len(data) - pos} byte(s)"
+        raise FingerprintPattern(err)
+    header = data[pos] << 8 | data[pos + 1]
+    record_format = _RECORD_FORMATS.get(header)
+    if record_format is None:
+        if data[pos] != 1:
+            err = f"Expected one of supported JSON fingerprint versions '(1,)', instead got '{data[pos]}' at offset {pos}"
+            raise FingerprintVersion(err)
+        err = f"Expected one of supported hash function ids '{tuple(HASH_FUNCTION_IDS.values())}', instead got '{data[pos + 1]}' at offset {pos}"
+        raise HashFunction(err)
+    return record_format
+
+
+def to_bytes(fingerprint: str) -> bytes:
+    """Encode a JSON fingerprint into the compact binary format.
+
+    The binary format consists of a version byte, a hash function id byte (1: sha256, 2: sha384, 3: sha512, 4: blake2b,
+    5: blake2s, or the id of a registered hash function), and the raw digest of the hash value. It's losslessly
+    convertible back to the text format with `from_bytes()`.
+
+    Args:
+        fingerprint (str):
+            A valid JSON fingerprint (example: "jfpv1$sha256$2ecb0c919fcb06024f55380134da3bbaac3879f98adce89a8871706fe50dda03")
+
+    Returns:
+        bytes: The JSON fingerprint in binary format.
+    """
+    version, hash_function, hash = decode(fingerprint=fingerprint)
+    return bytes((version, _hash_function_id(hash_function=hash_function))) + bytes.fromhex(hash)
+
+
+def from_bytes(data: bytes) -> str:
+    """Decode a JSON fingerprint in binary format into the text format.
+
+    Args:
+        data (bytes-like object):
+            A JSON fingerprint in binary format, as created with `to_bytes()`.
+
+    Returns:
+        str: The JSON fingerprint in string format.
+    """
+    _validate_fingerprint_bytes_type(data)
+    with memoryview(data) as view:
+        prefix, digest_size = _record_format(data=view, pos=0)
+        if len(view) != 2 + digest_size:
+            err = f"Expected binary JSON fingerprint of {2 + digest_size} bytes, instead got {len(view)} bytes"
+            raise FingerprintPattern(err)
+        return prefix + view[2:].hex()
+
+
+def to_bytes_many(fingerprints: Iterable[str]) -> bytes:
+    """Encode JSON fingerprints into a packed array of binary fingerprints.
+
+    Args:
+        fingerprints (iterable of strings):
+            Valid JSON fingerprints.
+
+    Returns:
+        bytes: The concatenated binary JSON fingerprints, in the same order as the input fingerprints.
+    """
+    hash_function_ids = HASH_FUNCTION_IDS
+    return b"".join(
+        bytes((version, hash_function_ids.get(hash_function) or _hash_function_id(hash_function=hash_function))) + bytes.fromhex(hash)
+        for version, hash_function, hash in decode_many(fingerprints=fingerprints)
+    )
+
+
+def from_bytes_many(data: bytes) -> List[str]:
+    """Decode a packed array of binary JSON fingerprints into the text format.
+
+    The records are read from a memoryview of the data without copying, so packed arrays can also be decoded straight
+    from memory-mapped files. The records may use different hash functions, as each record's size is determined by its
+    hash function id.
+
+    Args:
+        data (bytes-like object):
+            Concatenated JSON fingerprints in binary format, as created with `to_bytes_many()`.
+
+    Returns:
+        list: A list of JSON fingerprints in string format, in the same order as in the packed array.
+    """
+    _validate_fingerprint_bytes_type(data)
+    fingerprints = []
+    with memoryview(data) as view:
+        size = len(view)
+        pos = 0
+        record_formats = _RECORD_FORMATS
+        while pos < size:
+            record_format = record_formats.get(view[pos] << 8 | view[pos + 1]) if pos + 1 < size else None
+            if record_format is None:
+                record_format = _record_format(data=view, pos=pos)
+            prefix, digest_size = record_format
+            start = pos + 2
+            pos = start + digest_size
+            if pos > size:
+                err = f"Expected binary JSON fingerprint of {2 + digest_size} bytes at offset {start - 2}, instead got {size - start + 2} bytes"
+                raise FingerprintPattern(err)
+            fingerprints.append(prefix + view[start:pos].hex())
+    return fingerprints
@@ -1,22 +1,47 @@
-from ._jfpv1 import _create_jfpv1_fingerprint
-from ._load_json import _load_json
+import mmap
+import os
+from typing import IO, Any, List, Optional, Sequence, Union
+
+from ._fingerprint_cache import FingerprintCache, _fingerprint_cache_key
+from ._jfpv1 import _create_jfpv1_fingerprint, _create_jfpv1_fingerprints
+from ._limits import Limits, _check_limits
+from ._load_json import _load_json, _load_json_buffer, _load_json_file
+from ._profile import _create_profiled, _is_profiling
+from ._stream import DEFAULT_CHUNK_SIZE, _create_jfpv1_stream_fingerprint
+from ._subtree_cache import SubtreeCache
 from ._validators import (
+    _validate_bytes_input_type,
     _validate_hash_function,
     _validate_input_type,
+    _validate_object,
     _validate_version,
 )
 
 
-def create(input: str, hash_function: str, version: int) -> str:
+def create(
+    input: str,
+    hash_function: str,
+    version: int,
+    subtree_cache: Optional[SubtreeCache] = None,
+    fingerprint_cache: Optional[FingerprintCache] = None,
+    limits: Optional[Limits] = None,
+) -> str:
     """Create JSON fingerprints with the selected hash function and JSON fingerprint algorithm version.
 
     Args:
         input (str):
             JSON input in string format.
         hash_function (str):
-            One of the supported hash function names in string format (options: "sha256", "sha384", or "sha512").
+            One of the supported hash function names in string format (options: "sha256", "sha384", "sha512",
+            "blake2b", "blake2s", or a registered hash function).
         version (int):
             An integer indicating the JSON fingerprint algorithm version to be used (options: 1).
+        subtree_cache (SubtreeCache):
+            Optional cache of hashed list subtrees, for JSON data with repeated sub-structures. None by default.
+        fingerprint_cache (FingerprintCache):
+            Optional cache of created fingerprints, for recurring identical JSON inputs. None by default.
+        limits (Limits):
+            Optional admission limits for the JSON input, which raise `LimitExceeded` when exceeded. None by default.
 
     Returns:
         str: A pre-formatted JSON fingerprint (example: "jfpv1${hash_function_name}${hash_hex_digest}").
@@ -24,5 +49,233 @@ def create(input: str, hash_function: str, version: int) -> str:
     _validate_version(version=version)
     _validate_input_type(input=input)
     _validate_hash_function(hash_function=hash_function, version=version)
-    loaded = _load_json(data=input)
-    return _create_jfpv1_fingerprint(data=loaded, hash_function=hash_function)
+    if limits is not None:
+        limits._check_input_size(size=len(input))
+    if fingerprint_cache is not None:
+        key = _fingerprint_cache_key(data=input, hash_function=hash_function, version=version, limits=limits)
+        fingerprint = fingerprint_cache.get(key)
+        if fingerprint is None:
+            fingerprint = create(input=input, hash_function=hash_function, version=version, subtree_cache=subtree_cache, limits=limits)
+            fingerprint_cache.put(key, fingerprint)
+        return fingerprint
+    if _is_profiling():
+        return _create_profiled(
+            load=lambda: _load_json(data=input, limits=limits),
+            input_size=len(input),
+            hash_function=hash_function,
+            subtree_cache=subtree_cache,
+        )
+    loaded = _load_json(data=input, limits=limits)
+    return _create_jfpv1_fingerprint(data=loaded, hash_function=hash_function, subtree_cache=subtree_cache)
+
+
+def create_multi(
+    input: str,
+    hash_functions: Sequence[str],
+    version: int,
+    subtree_cache: Optional[SubtreeCache] = None,
+    limits: Optional[Limits] = None,
+) -> List[str]:
+    """Create JSON fingerprints with multiple hash functions at once.
+
+    The JSON input is validated, parsed and traversed only once, and the canonical data elements are hashed with each
+    of the selected hash functions. Fingerprints are identical to the ones created with `create()`.
+
+    Args:
+        input (str):
+            JSON input in string format.
+        hash_functions (list of strings):
+            Supported hash function names in string format (options: "sha256", "sha384", "sha512",
+            "blake2b", "blake2s", or a registered hash function).
+        version (int):
+            An integer indicating the JSON fingerprint algorithm version to be used (options: 1).
+        subtree_cache (SubtreeCache):
+            Optional cache of hashed list subtrees, for JSON data with repeated sub-structures. None by default.
+        limits (Limits):
+            Optional admission limits for the JSON input, which raise `LimitExceeded` when exceeded. None by default.
+
+    Returns:
+        list: A list of pre-formatted JSON fingerprints, in the same order as the hash functions.
+    """
+    _validate_version(version=version)
+    _validate_input_type(input=input)
+    for hash_function in hash_functions:
+        _validate_hash_function(hash_function=hash_function, version=version)
+    if limits is not None:
+        limits._check_input_size(size=len(input))
+    unique_hash_functions = tuple(dict.fromkeys(hash_functions))
+    if not unique_hash_functions:
+        return []
+    loaded = _load_json(data=input, limits=limits)
+    fingerprints = _create_jfpv1_fingerprints(data=loaded, hash_functions=unique_hash_functions, subtree_cache=subtree_cache)
+    fingerprints_by_hash_function = dict(zip(unique_hash_functions, fingerprints))
+    return [fingerprints_by_hash_function[hash_function] for hash_function in hash_functions]
+
+
+def create_from_object(
+    input: Any,
+    hash_function: str,
+    version: int,
+    subtree_cache: Optional[SubtreeCache] = None,
+    limits: Optional[Limits] = None,
+) -> str:
+    """Create JSON fingerprints from a JSON-compatible Python object, such as a dict or a list.
+
+    The object is fingerprinted directly, without serializing it into a JSON string and parsing it back first. Only
+    the types that `json.loads` produces are accepted: dicts with string keys, lists, strings, integers, finite floats,
+    booleans and None. Fingerprints are identical to the ones created with `create()` from `json.dumps(input)`.
+
+    Args:
+        input (dict, list, str, int, float, bool or None):
+            JSON input as a Python object.
+        hash_function (str):
+            One of the supported hash function names in string format (options: "sha256", "sha384", "sha512",
+            "blake2b", "blake2s", or a registered hash function).
+        version (int):
+            An integer indicating the JSON fingerprint algorithm version to be used (options: 1).
+        subtree_cache (SubtreeCache):
+            Optional cache of hashed list subtrees, for JSON data with repeated sub-structures. None by default.
+        limits (Limits):
+            Optional admission limits for the JSON input, which raise `LimitExceeded` when exceeded. None by default.
+
+    Returns:
+        str: A pre-formatted JSON fingerprint (example: "jfpv1${hash_function_name}${hash_hex_digest}").
+    """
+    _validate_version(version=version)
+    _validate_object(input=input)
+    _validate_hash_function(hash_function=hash_function, version=version)
+    _check_limits(data=input, limits=limits)
+    if _is_profiling():
+        return _create_profiled(load=lambda: input, input_size=None, hash_function=hash_function, subtree_cache=subtree_cache)
+    return _create_jfpv1_fingerprint(data=input, hash_function=hash_function, subtree_cache=subtree_cache)
+
+
+def create_from_bytes(
+    input: Union[bytes, bytearray, memoryview, mmap.mmap],
+    hash_function: str,
+    version: int,
+    subtree_cache: Optional[SubtreeCache] = None,
+    fingerprint_cache: Optional[FingerprintCache] = None,
+    limits: Optional[Limits] = None,
+) -> str:
+    """Create JSON fingerprints from bytes-like JSON input.
+
+    The input is decoded directly from the buffer into a string, without copying it into an intermediate bytes object
+    first, and the decoded string is released before the JSON data is fingerprinted. Fingerprints are identical to the ones created
+    with `create()` from the decoded JSON string.
+
+    Args:
+        input (bytes, bytearray, memoryview or mmap.mmap):
+            JSON input in bytes-like format (UTF-8, UTF-16 or UTF-32 encoded).
+        hash_function (str):
+            One of the supported hash function names in string format (options: "sha256", "sha384", "sha512",
+            "blake2b", "blake2s", or a registered hash function).
+        version (int):
+            An integer indicating the JSON fingerprint algorithm version to be used (options: 1).
+        subtree_cache (SubtreeCache):
+            Optional cache of hashed list subtrees, for JSON data with repeated sub-structures. None by default.
+        fingerprint_cache (FingerprintCache):
+            Optional cache of created fingerprints, for recurring identical JSON inputs. None by default.
+        limits (Limits):
+            Optional admission limits for the JSON input, which raise `LimitExceeded` when exceeded. None by default.
+
+    Returns:
+        str: A pre-formatted JSON fingerprint (example: "jfpv1${hash_function_name}${hash_hex_digest}").
+    """
+    _validate_version(version=version)
+    _validate_bytes_input_type(input=input)
+    _validate_hash_function(hash_function=hash_function, version=version)
+    input_size = input.nbytes if isinstance(input, memoryview) else len(input)
+    if limits is not None:
+        limits._check_input_size(size=input_size)
+    if fingerprint_cache is not None:
+        key = _fingerprint_cache_key(data=input, hash_function=hash_function, version=version, limits=limits)
+        fingerprint = fingerprint_cache.get(key)
+        if fingerprint is None:
+            fingerprint = create_from_bytes(input=input, hash_function=hash_function, version=version, subtree_cache=subtree_cache, limits=limits)
+            fingerprint_cache.put(key, fingerprint)
+        return fingerprint
+    if _is_profiling():
+        return _create_profiled(
+            load=lambda: _load_json_buffer(data=input, limits=limits),
+            input_size=input_size,
+            hash_function=hash_function,
+            subtree_cache=subtree_cache,
+        )
+    loaded = _load_json_buffer(data=input, limits=limits)
+    return _create_jfpv1_fingerprint(data=loaded, hash_function=hash_function, subtree_cache=subtree_cache)
+
+
+def create_from_file(
+    path: Union[str, os.PathLike],
+    hash_function: str,
+    version: int,
+    subtree_cache: Optional[SubtreeCache] = None,
+    limits: Optional[Limits] = None,
+) -> str:
+    """Create JSON fingerprints from a JSON file.
+
+    The file is memory-mapped and decoded directly into a string instead of being read into memory first. The mapped
+    pages and the decoded string are released before the JSON data is fingerprinted. Fingerprints are identical to
+    the ones created with `create()` from the file content.
+
+    Args:
+        path (str or os.PathLike):
+            Path to a JSON file (UTF-8, UTF-16 or UTF-32 encoded).
+        hash_function (str):
+            One of the supported hash function names in string format (options: "sha256", "sha384", "sha512",
+            "blake2b", "blake2s", or a registered hash function).
+        version (int):
+            An integer indicating the JSON fingerprint algorithm version to be used (options: 1).
+        subtree_cache (SubtreeCache):
+            Optional cache of hashed list subtrees, for JSON data with repeated sub-structures. None by default.
+        limits (Limits):
+            Optional admission limits for the JSON input, which raise `LimitExceeded` when exceeded. None by default.
+
+    Returns:
+        str: A pre-formatted JSON fingerprint (example: "jfpv1${hash_function_name}${hash_hex_digest}").
+    """
+    _validate_version(version=version)
+    _validate_hash_function(hash_function=hash_function, version=version)
+    if limits is not None:
+        limits._check_input_size(size=os.path.getsize(path))
+    if _is_profiling():
+        return _create_profiled(
+            load=lambda: _load_json_file(path=path, limits=limits),
+            input_size=os.path.getsize(path),
+            hash_function=hash_function,
+            subtree_cache=subtree_cache,
+        )
+    loaded = _load_json_file(path=path, limits=limits)
+    return _create_jfpv1_fingerprint(data=loaded, hash_function=hash_function, subtree_cache=subtree_cache)
+
+
+def create_from_stream(stream: IO, hash_function: str, version: int, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """Create JSON fingerprints from a file-like object without loading the JSON data into memory.
+
+    The stream is parsed incrementally in chunks, and the data elements are hashed as soon as they are complete. The
+    memory usage grows with the depth of the JSON data, the number of data elements (one hash digest each) and the
+    size of the nested arrays, instead of the size of the whole JSON data. Fingerprints are identical to the ones
+    created with `create()` from the stream content.
+
+    The stream is read three times, so non-seekable streams are copied into a temporary file first. Like `json.loads`,
+    the last value of a duplicate key is kept: the overridden values are skipped, which takes one more pass over the
+    stream if any are found.
+
+    Args:
+        stream (file-like object):
+            A text or binary file-like object (UTF-8, UTF-16 or UTF-32 encoded) with JSON input.
+        hash_function (str):
+            One of the supported hash function names in string format (options: "sha256", "sha384", "sha512",
+            "blake2b", "blake2s", or a registered hash function).
+        version (int):
+            An integer indicating the JSON fingerprint algorithm version to be used (options: 1).
+        chunk_size (int):
+            The number of bytes or characters read from the stream at a time. 65536 by default.
+
+    Returns:
+        str: A pre-formatted JSON fingerprint (example: "jfpv1${hash_function_name}${hash_hex_digest}").
+    """
+    _validate_version(version=version)
+    _validate_hash_function(hash_function=hash_function, version=version)
+    return _create_jfpv1_stream_fingerprint(stream=stream, hash_function=hash_function, chunk_size=chunk_size)
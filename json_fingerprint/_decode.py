@@ -1,6 +1,48 @@
-from typing import Tuple
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
 
-from ._validators import _validate_fingerprint_format
+from ._hash_registry import _add_register_hook
+from ._validators import (
+    BYTES_INPUT_TYPES,
+    DIGEST_SIZES,
+    _validate_fingerprint_format,
+)
+from .exceptions import FingerprintPattern
+
+# The lengths of valid fingerprints mapped to (prefix, (version, hash function)) candidates
+_VARIANTS_BY_LENGTH: Dict[int, List[Tuple[str, Tuple[int, str]]]] = {}
+
+
+def _add_variant(hash_function: str) -> None:
+    prefix = f"jfpv1${hash_function}$"
+    length = len(prefix) + 2 * DIGEST_SIZES[hash_function]
+    _VARIANTS_BY_LENGTH.setdefault(length, []).append((prefix, (1, hash_function)))
+
+
+def _remove_variant(hash_function: str) -> None:
+    prefix = f"jfpv1${hash_function}$"
+    length = len(prefix) + 2 * DIGEST_SIZES[hash_function]
+    variants = [variant for variant in _VARIANTS_BY_LENGTH[length] if variant[0] != prefix]
+    if variants:
+        _VARIANTS_BY_LENGTH[length] = variants
+    else:
+        del _VARIANTS_BY_LENGTH[length]
+
+
+_add_register_hook(_add_variant, _remove_variant)
+
+
+class DecodedFingerprints(NamedTuple):
+    """Structured result of decoding multiple JSON fingerprints.
+
+    Attributes:
+        digests (dict):
+            Raw digests (bytes) of the valid fingerprints, grouped by (version, hash function) variant.
+        invalid (list of integers):
+            Indices of the invalid fingerprints.
+    """
+
+    digests: Dict[Tuple[int, str], List[bytes]]
+    invalid: List[int]
 
 
 def decode(fingerprint: str) -> Tuple[int, str, str]:
@@ -23,3 +65,194 @@ def decode(fingerprint: str) -> Tuple[int, str, str]:
     hash = elements[2]
 
     return version, hash_function, hash
+
+
+def _split_fingerprints(fingerprints: Union[Iterable[str], str, bytes]) -> List:
+    """Split a newline-delimited buffer of fingerprints into lines, or collect an iterable of fingerprints into a list."""
+    if isinstance(fingerprints, BYTES_INPUT_TYPES):
+        # Fingerprints are ASCII, and Latin-1 maps any other byte to a character that fails validation
+        fingerprints = str(fingerprints, "latin-1")
+    elif not isinstance(fingerprints, str):
+        return list(fingerprints)
+
+    lines = fingerprints.split("\n")
+    if not lines[-1]:
+        lines.pop()  # A trailing newline, or an empty buffer
+    return lines
+
+
+def _is_hex_digest(hex_digest: str) -> bool:
+    """Check that a string consists of lowercase hex digit pairs only."""
+    try:
+        return bytes.fromhex(hex_digest).hex() == hex_digest
+    except ValueError:
+        return False
+
+
+def _count_uniform_lines(fingerprints: Union[str, bytes]) -> int:
+    """Count the lines of a newline-delimited buffer of valid fingerprints of a single variant.
+
+    All lines of such a buffer have the same width, so the line separators and the prefix characters are validated
+    column by column with extended slices, and the hex digests by deleting the hex digit characters from the buffer.
+
+    Returns:
+        int: The number of lines, or -1 if the buffer isn't made of valid fingerprints of a single variant.
+    """
+    if not isinstance(fingerprints, BYTES_INPUT_TYPES):
+        fingerprints = fingerprints.encode("latin-1", "replace")
+    elif not isinstance(fingerprints, bytes):
+        fingerprints = bytes(fingerprints)
+    if fingerprints.endswith(b"\n"):
+        fingerprints = fingerprints[:-1]
+    if not fingerprints:
+        return 0
+
+    width = fingerprints.find(b"\n")
+    if width == -1:
+        width = len(fingerprints)
+    step = width + 1
+    count, remainder = divmod(len(fingerprints) + 1, step)
+    if remainder or fingerprints[width::step] != b"\n" * (count - 1):
+        return -1
+    for prefix, _ in _VARIANTS_BY_LENGTH.get(width, ()):
+        prefix = prefix.encode("ascii")
+        if all(fingerprints[i::step] == bytes((char,)) * count for i, char in enumerate(prefix)):
+            # Newlines are kept, so that a newline in place of a hex digit isn't mistaken for a line separator
+            non_hex = fingerprints.translate(None, b"0123456789abcdef")
+            return count if non_hex == b"\n".join([prefix.translate(None, b"0123456789abcdef")] * count) else -1
+    return -1
+
+
+def _are_valid_by_length(lines: List) -> bool:
+    """Check whether all fingerprints are valid, by validating the fingerprints of each length as a uniform buffer."""
+    try:
+        lengths = set(map(len, lines))
+    except TypeError:
+        return False
+    if not lengths.issubset(_VARIANTS_BY_LENGTH):
+        return False
+
+    for length in lengths:
+        group = [fingerprint for fingerprint in lines if len(fingerprint) == length] if len(lengths) > 1 else lines
+        try:
+            buffer = "\n".join(group)
+        except TypeError:
+            return False  # Not all fingerprints are strings
+        # Fingerprints with newlines would change the line count, or end the buffer with a newline
+        if buffer.endswith("\n") or _count_uniform_lines(fingerprints=buffer) != len(group):
+            return False
+    return True
+
+
+def _revalidate_hex_digests(
+    decoded: List[Optional[Tuple[int, str, str]]],
+    variant: Tuple[int, str],
+    hex_digests: List[str],
+    invalid: List[int],
+) -> None:
+    """Validate the hex digests of a variant one by one, after their bulk validation has failed."""
+    hex_digests.clear()
+    for index, item in enumerate(decoded):
+        if item is None or item[:2] != variant:
+            continue
+        if _is_hex_digest(item[2]):
+            hex_digests.append(item[2])
+        else:
+            decoded[index] = None
+            invalid.append(index)
+    invalid.sort()
+
+
+def _scan_fingerprints(lines: List) -> Tuple[List[Optional[Tuple[int, str, str]]], Dict[Tuple[int, str], List[str]], List[int]]:
+    """Decode fingerprints, and collect the indices of invalid fingerprints.
+
+    Fingerprints are dispatched to their candidate variants by length and prefix, and the hex digests of each variant
+    are validated in bulk. Only if a variant's bulk validation fails, its hex digests are validated one by one.
+
+    Returns:
+        A tuple of the decoded (version, hash function, hex digest) tuples with None for invalid fingerprints, the valid
+        hex digests grouped by (version, hash function) variant, and the sorted indices of invalid fingerprints.
+    """
+    variants_by_length = _VARIANTS_BY_LENGTH
+    decoded = []
+    hex_digests_by_variant = {}
+    invalid = []
+    for index, fingerprint in enumerate(lines):
+        if type(fingerprint) is str:
+            for prefix, variant in variants_by_length.get(len(fingerprint), ()):
+                if fingerprint.startswith(prefix):
+                    start = len(prefix)
+                    hex_digest = fingerprint[start:]
+                    decoded.append((variant[0], variant[1], hex_digest))
+                    hex_digests = hex_digests_by_variant.get(variant)
+                    if hex_digests is None:
+                        hex_digests = hex_digests_by_variant[variant] = []
+                    hex_digests.append(hex_digest)
+                    break
+            else:
+                decoded.append(None)
+                invalid.append(index)
+        else:
+            decoded.append(None)
+            invalid.append(index)
+
+    for variant, hex_digests in hex_digests_by_variant.items():
+        if not _is_hex_digest("".join(hex_digests)):
+            _revalidate_hex_digests(decoded=decoded, variant=variant, hex_digests=hex_digests, invalid=invalid)
+    return decoded, hex_digests_by_variant, invalid
+
+
+def decode_many(
+    fingerprints: Union[Iterable[str], str, bytes],
+    structured: bool = False,
+) -> Union[List[Tuple[int, str, str]], DecodedFingerprints]:
+    """Decode multiple json fingerprints in a single pass.
+
+    Instead of trying each variant's pattern on each fingerprint in turn, the fingerprints are dispatched to their
+    variant by length and prefix, and the hex digests of each variant are validated in bulk.
+
+    Args:
+        fingerprints (iterable of strings, or a newline-delimited buffer):
+            JSON fingerprints as an iterable of strings, or as a newline-delimited string or bytes-like buffer.
+        structured (bool):
+            If True, then return the raw digests grouped by variant along with the indices of invalid fingerprints,
+            instead of raising an exception on the first invalid fingerprint. False by default.
+
+    Returns:
+        list or DecodedFingerprints: A list of (version, hash function, hex digest) tuples in the same order as the
+        fingerprints, or a DecodedFingerprints tuple if `structured` is True.
+    """
+    lines = _split_fingerprints(fingerprints=fingerprints)
+    decoded, hex_digests_by_variant, invalid = _scan_fingerprints(lines=lines)
+    if not structured:
+        if invalid:
+            err = (
+                "Expected JSON fingerprint in format '{fingerprint_version}${hash_function}${hex_digest}', "
+                f"instead got: {lines[invalid[0]]} (index {invalid[0]})"
+            )
+            raise FingerprintPattern(err)
+        return decoded
+
+    digests = {variant: [bytes.fromhex(hex_digest) for hex_digest in hex_digests] for variant, hex_digests in hex_digests_by_variant.items()}
+    return DecodedFingerprints(digests=digests, invalid=invalid)
+
+
+def validate_many(fingerprints: Union[Iterable[str], str, bytes]) -> List[int]:
+    """Validate multiple json fingerprints in a single pass.
+
+    Fingerprints of a single variant are validated as a whole newline-delimited buffer, without splitting them into
+    lines. If the fingerprints aren't all valid, they're validated one by one to find the invalid ones.
+
+    Args:
+        fingerprints (iterable of strings, or a newline-delimited buffer):
+            JSON fingerprints as an iterable of strings, or as a newline-delimited string or bytes-like buffer.
+
+    Returns:
+        list: The indices of invalid fingerprints, which is empty if all fingerprints are valid.
+    """
+    if isinstance(fingerprints, (str, *BYTES_INPUT_TYPES)) and _count_uniform_lines(fingerprints=fingerprints) != -1:
+        return []
+    lines = _split_fingerprints(fingerprints=fingerprints)
+    if _are_valid_by_length(lines=lines):
+        return []
+    return _scan_fingerprints(lines=lines)[2]
@@ -0,0 +1,401 @@
+import asyncio
+import bisect
+import heapq
+import math
+import mmap
+import os
+import sys
+import tempfile
+from collections import deque
+from concurrent.futures import Executor
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from ._batch import DEFAULT_CHUNKSIZE, _imap_chunks, _validate_batch_options
+from ._create import create, create_from_bytes
+from ._validators import DIGEST_SIZES, _validate_hash_function, _validate_version
+
+DEDUPLICATOR_MODES = ("exact", "bloom")
+DEFAULT_BLOOM_CAPACITY = 1000000
+DEFAULT_FALSE_POSITIVE_RATE = 0.001
+
+# Spilled runs are merged into one when there are more than this many of them
+_MAX_SPILL_RUNS = 8
+# The first digest of each block of a spilled run is kept in memory, so a lookup reads a single block from the file
+_SPILL_BLOCK_SIZE = 1024
+
+
+class DeduplicatorStats(NamedTuple):
+    """Statistics of a `Deduplicator`."""
+
+    documents: int
+    unique: int
+    duplicates: int
+    memory_digests: int
+    spilled_digests: int
+    spill_runs: int
+    memory_bytes: int
+    false_positive_rate: float
+
+
+def _create_digest_chunk(inputs: List[Union[str, bytes]], hash_function: str, version: int) -> List[bytes]:
+    """Create the raw fingerprint digests of a chunk of JSON inputs, in a worker process or inline."""
+    digests = []
+    for input in inputs:
+        if isinstance(input, str):
+            fingerprint = create(input=input, hash_function=hash_function, version=version)
+        else:
+            fingerprint = create_from_bytes(input=input, hash_function=hash_function, version=version)
+        digests.append(bytes.fromhex(fingerprint.rsplit("$", 1)[1]))
+    return digests
+
+
+class _DigestRun:
+    """A file of sorted, fixed-size digests, with the first digest of each block kept in memory."""
+
+    def __init__(self, path: str, digests: Iterable[bytes], digest_size: int):
+        self.path = path
+        self.digest_size = digest_size
+        self.count = 0
+        self._fences = []
+        with open(path, "wb") as file:
+            for digest in digests:
+                if self.count % _SPILL_BLOCK_SIZE == 0:
+                    self._fences.append(digest)
+                file.write(digest)
+                self.count += 1
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __contains__(self, digest: bytes) -> bool:
+        block = bisect.bisect_right(self._fences, digest) - 1
+        if block < 0:
+            return False
+        size = self.digest_size
+        low = block * _SPILL_BLOCK_SIZE
+        high = min(low + _SPILL_BLOCK_SIZE, self.count)
+        while low < high:
+            middle = (low + high) // 2
+            start = middle * size
+            end = start + size
+            if self._map[start:end] < digest:
+                low = middle + 1
+            else:
+                high = middle
+        start = low * size
+        end = start + size
+        return low < self.count and self._map[start:end] == digest
+
+    def __iter__(self) -> Iterator[bytes]:
+        size = self.digest_size
+        for start in range(0, self.count * size, size):
+            end = start + size
+            yield self._map[start:end]
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+        os.remove(self.path)
+
+
+class _ExactSeenSet:
+    """An exact set of seen digests, which spills the digests into sorted run files when there are `max_digests` of them."""
+
+    def __init__(self, digest_size: int, max_digests: Optional[int], spill_directory: Optional[str]):
+        self.digest_size = digest_size
+        self.max_digests = max_digests
+        self.spill_directory = spill_directory
+        self.spilled = 0
+        self._digests = set()
+        self._runs: List[_DigestRun] = []
+        self._directory = None
+        self._run_id = 0
+
+    def add(self, digest: bytes) -> bool:
+        """Add a digest, and return True if it wasn't seen before."""
+        if digest in self._digests:
+            return False
+        for run in self._runs:
+            if digest in run:
+                return False
+        self._digests.add(digest)
+        if self.max_digests is not None and len(self._digests) >= self.max_digests:
+            self._spill()
+        return True
+
+    def _new_run(self, digests: Iterable[bytes]) -> _DigestRun:
+        if self._directory is None:
+            self._directory = tempfile.TemporaryDirectory(prefix="json_fingerprint_", dir=self.spill_directory)
+        self._run_id += 1
+        return _DigestRun(path=os.path.join(self._directory.name, f"{self._run_id}.run"), digests=digests, digest_size=self.digest_size)
+
+    def _spill(self) -> None:
+        self._runs.append(self._new_run(digests=sorted(self._digests)))
+        self.spilled += len(self._digests)
+        self._digests = set()
+        if len(self._runs) > _MAX_SPILL_RUNS:
+            runs = self._runs
+            self._runs = [self._new_run(digests=heapq.merge(*runs))]
+            for run in runs:
+                run.close()
+
+    def stats(self) -> dict:
+        digests = len(self._digests)
+        # Each digest is a bytes object referenced from a hash table slot
+        memory_bytes = sys.getsizeof(self._digests) + digests * sys.getsizeof(bytes(self.digest_size))
+        return {
+            "memory_digests": digests,
+            "spilled_digests": self.spilled,
+            "spill_runs": len(self._runs),
+            "memory_bytes": memory_bytes,
+            "false_positive_rate": 0.0,
+        }
+
+    def close(self) -> None:
+        for run in self._runs:
+            run.close()
+        self._runs = []
+        self._digests = set()
+        if self._directory is not None:
+            self._directory.cleanup()
+            self._directory = None
+
+
+class _BloomSeenSet:
+    """A Bloom filter of seen digests, sized for `capacity` digests at the given false positive rate.
+
+    The digests are uniformly distributed already, so the bit positions are derived from the digest itself with double
+    hashing instead of hashing it again.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float):
+        self.capacity = capacity
+        self.count = 0
+        self._nbits = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self._nhashes = max(1, round(self._nbits / capacity * math.log(2)))
+        self._bits = bytearray((self._nbits + 7) // 8)
+
+    def add(self, digest: bytes) -> bool:
+        """Add a digest, and return True if it wasn't seen before, or False if it was probably seen before."""
+        bits = self._bits
+        nbits = self._nbits
+        position = int.from_bytes(digest[:8], "little")
+        step = int.from_bytes(digest[8:16], "little") | 1
+        new = False
+        for _ in range(self._nhashes):
+            index = position % nbits
+            mask = 1 << (index & 7)
+            if not bits[index >> 3] & mask:
+                bits[index >> 3] |= mask
+                new = True
+            position += step
+        if new:
+            self.count += 1
+        return new
+
+    def stats(self) -> dict:
+        return {
+            "memory_digests": 0,
+            "spilled_digests": 0,
+            "spill_runs": 0,
+            "memory_bytes": len(self._bits),
+            "false_positive_rate": (1 - math.exp(-self._nhashes * self.count / self._nbits)) ** self._nhashes,
+        }
+
+    def close(self) -> None:
+        self._bits = bytearray(len(self._bits))
+        self.count = 0
+
+
+class Deduplicator:
+    """Detects duplicate JSON documents in a stream of documents by their JSON fingerprints.
+
+    Documents are fingerprinted in chunks, optionally on a pool of worker processes (see `imap_create()`), and only the
+    first occurrence of each fingerprint is yielded. Documents with identical data are duplicates regardless of their
+    formatting, key order or array element order.
+
+    The raw digests of the seen fingerprints are kept in a seen-set, in one of two modes:
+
+     * "exact": an exact set of digests. With `max_digests`, the digests are spilled into sorted files in a temporary
+       directory whenever there are `max_digests` of them in memory, which bounds the memory usage. Lookups of the
+       spilled digests read a single block of each file.
+     * "bloom": a Bloom filter with a fixed size, sized for `capacity` unique documents at `false_positive_rate`. A new
+       document is reported as a duplicate with at most that probability, so some unique documents are dropped. The
+       rate grows when there are more than `capacity` unique documents.
+
+    A deduplicator can be closed with `close()`, which removes the spilled files, or used as a context manager.
+
+    Args:
+        hash_function (str):
+            One of the supported hash function names in string format (options: "sha256", "sha384", "sha512",
+            "blake2b", "blake2s", or a registered hash function).
+        version (int):
+            An integer indicating the JSON fingerprint algorithm version to be used (options: 1).
+        mode (str):
+            The seen-set mode (options: "exact" or "bloom"). "exact" by default.
+        max_digests (int):
+            The maximum number of digests in memory in the "exact" mode before they are spilled into a file. None by
+            default, in which case all digests are kept in memory.
+        spill_directory (str):
+            The directory of the temporary directory for spilled digests. Defaults to the system temporary directory.
+        capacity (int):
+            The expected number of unique documents in the "bloom" mode. 1000000 by default.
+        false_positive_rate (float):
+            The false positive rate of the "bloom" mode at `capacity` unique documents. 0.001 by default.
+        workers (int):
+            The number of worker processes for `filter()`. 1 by default, in which case no processes are started. None
+            uses the number of CPUs.
+        chunksize (int):
+            The number of documents fingerprinted at a time. 256 by default.
+    """
+
+    def __init__(
+        self,
+        hash_function: str,
+        version: int,
+        mode: str = "exact",
+        max_digests: Optional[int] = None,
+        spill_directory: Optional[str] = None,
+        capacity: int = DEFAULT_BLOOM_CAPACITY,
+        false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE,
+        workers: Optional[int] = 1,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+    ):
+        _validate_version(version=version)
+        _validate_hash_function(hash_function=hash_function, version=version)
+        _validate_batch_options(workers=workers, chunksize=chunksize, max_pending=None)
+        if mode not in DEDUPLICATOR_MODES:
+            raise ValueError(f"Expected one of deduplicator modes '{DEDUPLICATOR_MODES}', instead got '{mode}'")
+        if max_digests is not None and max_digests < 1:
+            raise ValueError(f"Expected a positive max_digests, instead got '{max_digests}'")
+        if capacity < 1:
+            raise ValueError(f"Expected a positive capacity, instead got '{capacity}'")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError(f"Expected a false_positive_rate between 0 and 1, instead got '{false_positive_rate}'")
+        self.hash_function = hash_function
+        self.version = version
+        self.mode = mode
+        self.workers = workers
+        self.chunksize = chunksize
+        self.documents = 0
+        self.unique = 0
+        if mode == "exact":
+            self._seen = _ExactSeenSet(digest_size=DIGEST_SIZES[hash_function], max_digests=max_digests, spill_directory=spill_directory)
+        else:
+            self._seen = _BloomSeenSet(capacity=capacity, false_positive_rate=false_positive_rate)
+
+    def _add_digest(self, digest: bytes) -> bool:
+        self.documents += 1
+        if self._seen.add(digest):
+            self.unique += 1
+            return True
+        return False
+
+    def add(self, input: Union[str, bytes]) -> bool:
+        """Add a JSON document, and return True if it's the first occurrence of its fingerprint.
+
+        Args:
+            input (str or bytes):
+                JSON input in string format, or as UTF-8, UTF-16 or UTF-32 encoded bytes.
+
+        Returns:
+            bool: True if the document wasn't seen before, otherwise False.
+        """
+        digest = _create_digest_chunk(inputs=[input], hash_function=self.hash_function, version=self.version)[0]
+        return self._add_digest(digest)
+
+    def filter(self, inputs: Iterable[Union[str, bytes]]) -> Iterator[Union[str, bytes]]:
+        """Yield the first occurrences of JSON documents, and drop their duplicates.
+
+        Args:
+            inputs (iterable of strings or bytes):
+                JSON inputs in string format, or as UTF-8, UTF-16 or UTF-32 encoded bytes. Inputs are consumed lazily.
+
+        Returns:
+            iterator: An iterator of the first occurrences of the inputs, in input order.
+        """
+        # The inputs stay in the calling process, and only their digests are returned from the worker processes
+        pending = deque()
+
+        def consume():
+            for input in inputs:
+                pending.append(input)
+                yield input
+
+        chunks = _imap_chunks(
+            inputs=consume(),
+            function=_create_digest_chunk,
+            args=(self.hash_function, self.version),
+            workers=self.workers,
+            chunksize=self.chunksize,
+            max_pending=None,
+            ordered=True,
+        )
+        for _, digests in chunks:
+            for digest in digests:
+                input = pending.popleft()
+                if self._add_digest(digest):
+                    yield input
+
+    async def afilter(
+        self,
+        inputs: AsyncIterable[Union[str, bytes]],
+        executor: Optional[Executor] = None,
+    ) -> AsyncIterator[Union[str, bytes]]:
+        """Yield the first occurrences of JSON documents from an asynchronous stream, and drop their duplicates.
+
+        The documents are fingerprinted in chunks in an executor, so the event loop isn't blocked.
+
+        Args:
+            inputs (asynchronous iterable of strings or bytes):
+                JSON inputs in string format, or as UTF-8, UTF-16 or UTF-32 encoded bytes.
+            executor (concurrent.futures.Executor):
+                A thread or process pool executor. Defaults to the event loop's default executor (a thread pool).
+
+        Returns:
+            asynchronous iterator: An asynchronous iterator of the first occurrences of the inputs, in input order.
+        """
+        loop = asyncio.get_running_loop()
+
+        async def chunks():
+            chunk = []
+            async for input in inputs:
+                chunk.append(input)
+                if len(chunk) == self.chunksize:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+
+        async for chunk in chunks():
+            digests = await loop.run_in_executor(executor, _create_digest_chunk, chunk, self.hash_function, self.version)
+            for input, digest in zip(chunk, digests):
+                if self._add_digest(digest):
+                    yield input
+
+    @property
+    def stats(self) -> DeduplicatorStats:
+        """The numbers of documents, unique documents and duplicates, and the state of the seen-set."""
+        duplicates = self.documents - self.unique
+        return DeduplicatorStats(documents=self.documents, unique=self.unique, duplicates=duplicates, **self._seen.stats())
+
+    def close(self) -> None:
+        """Forget the seen documents, and remove the spilled files."""
+        self._seen.close()
+
+    def __enter__(self) -> "Deduplicator":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.unique
@@ -1,13 +1,13 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 
-from ._create import create
-from ._decode import decode
+from ._create import create_multi
+from ._decode import decode_many
+from ._limits import Limits
 
 
 def _get_target_hashes(fingerprints: List[str]) -> List[Dict]:
     target_hashes = []
-    for fingerprint in fingerprints:
-        version, hash_function, _ = decode(fingerprint=fingerprint)
+    for version, hash_function, _ in decode_many(fingerprints=fingerprints):
         element = {"version": version, "hash_function": hash_function}
         if element not in target_hashes:
             target_hashes.append(element)
@@ -15,22 +15,28 @@ def _get_target_hashes(fingerprints: List[str]) -> List[Dict]:
     return target_hashes
 
 
-def _create_input_fingerprints(input: str, target_hashes: List[Dict]) -> List[str]:
-    """Create all necessary JSON fingerprint variations of the JSON data input."""
-    input_fingerprints = []
+def _create_input_fingerprints(input: str, target_hashes: List[Dict], limits: Optional[Limits] = None) -> List[str]:
+    """Create all necessary JSON fingerprint variations of the JSON data input.
+
+    The input is parsed and traversed once per JSON fingerprint version, regardless of the number of hash functions.
+    """
+    hash_functions_by_version = {}
     for element in target_hashes:
-        fingerprint = create(input=input, hash_function=element["hash_function"], version=element["version"])
-        input_fingerprints.append(fingerprint)
+        hash_functions_by_version.setdefault(element["version"], []).append(element["hash_function"])
+
+    input_fingerprints = []
+    for version, hash_functions in hash_functions_by_version.items():
+        input_fingerprints.extend(create_multi(input=input, hash_functions=hash_functions, version=version, limits=limits))
     return input_fingerprints
 
 
-def find_matches(input: str, fingerprints: List[str], deduplicate: bool = False) -> List[str]:
+def find_matches(input: str, fingerprints: List[str], deduplicate: bool = False, limits: Optional[Limits] = None) -> List[str]:
     """Match raw json string input to a list of fingerprints.
 
     The fingerprint matching is executed as follows:
         1. Optional: deduplicate the target fingerprint list
         2. Decode the target fingerprint list to find all different JSON fingerprint variations (hash function, version)
-        3. Create JSON fingerprints from the input with identical parameters (e.g., all hash function variations)
+        3. Create JSON fingerprints from the input with identical parameters (e.g., all hash function variations in one pass)
         4. Compare the input JSON fingerprint variations to the target list and find all matches
 
     If there is e.g. "sha256" and "sha512" JSON fingerprint variations in the target list of fingerprints,
@@ -43,6 +49,8 @@ def find_matches(input: str, fingerprints: List[str], deduplicate: bool = False)
             A list of JSON fingerprints in string format.
         deduplicate (bool):
             If True, then deduplicate the fingerprint list before processing matches. False by default.
+        limits (Limits):
+            Optional admission limits for the JSON input, which raise `LimitExceeded` when exceeded. None by default.
 
     Returns:
         list: A list of JSON fingerprint matches in string format.
@@ -50,7 +58,7 @@ def find_matches(input: str, fingerprints: List[str], deduplicate: bool = False)
     if deduplicate:
         fingerprints = list(set(fingerprints))
     target_hashes = _get_target_hashes(fingerprints=fingerprints)
-    input_fingerprints = _create_input_fingerprints(input=input, target_hashes=target_hashes)
+    input_fingerprints = _create_input_fingerprints(input=input, target_hashes=target_hashes, limits=limits)
 
     matches = []
     for fingerprint in fingerprints:
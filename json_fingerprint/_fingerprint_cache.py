@@ -0,0 +1,101 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+from ._limits import Limits
+
+DEFAULT_FINGERPRINT_CACHE_MAXSIZE = 65536
+DEFAULT_FINGERPRINT_CACHE_MAXBYTES = 16 * 1024 * 1024
+
+_KEY_DIGEST_SIZE = 32
+
+
+def _fingerprint_cache_key(data, hash_function: str, version: int, limits: Optional[Limits] = None) -> Tuple[bytes, str, int, Optional[Tuple]]:
+    """Create a fingerprint cache key from a digest of the raw JSON input, the hash function, the version and the limits.
+
+    The input is hashed once with BLAKE2b, which is far cheaper than parsing, flattening and hashing its data elements.
+    Fingerprints are cached separately for each set of limits, so a fingerprint created within looser limits (or
+    without limits) is never returned for input that exceeds the limits of the current call.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8", "surrogatepass")
+    limits_key = None if limits is None else limits._key()
+    return hashlib.blake2b(data, digest_size=_KEY_DIGEST_SIZE).digest(), hash_function, version, limits_key
+
+
+def _entry_size(key: Tuple[bytes, str, int, Optional[Tuple]], fingerprint: str) -> int:
+    """Estimate the size of a cache entry from the lengths of the input digest and the fingerprint."""
+    return len(key[0]) + len(fingerprint)
+
+
+class FingerprintCache:
+    """A bounded cache of created JSON fingerprints, for workloads where identical JSON inputs recur.
+
+    When a cache is passed to `create()`, `create_from_bytes()` or `match()`, the fingerprint of each input is stored
+    under a key derived from a BLAKE2b digest of the raw input, the hash function, the version and the limits. An
+    identical input reuses the stored fingerprint, which costs a single hash pass over the input instead of creating the
+    fingerprint. Invalid inputs, and inputs that exceed the limits, are never cached.
+
+    The least recently used fingerprints are evicted when the cache has more than `maxsize` fingerprints, or when the
+    total size of the input digests and fingerprints exceeds `maxbytes`. A cache can be shared by multiple threads.
+
+    Args:
+        maxsize (int):
+            The maximum number of cached fingerprints. 65536 by default.
+        maxbytes (int):
+            The maximum total size of the cached input digests and fingerprints in bytes. 16 MiB by default.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_FINGERPRINT_CACHE_MAXSIZE, maxbytes: int = DEFAULT_FINGERPRINT_CACHE_MAXBYTES):
+        if maxsize < 1:
+            raise ValueError(f"Expected a positive maxsize, instead got '{maxsize}'")
+        if maxbytes < 1:
+            raise ValueError(f"Expected a positive maxbytes, instead got '{maxbytes}'")
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """Get a cached fingerprint, or None if the fingerprint isn't cached."""
+        with self._lock:
+            fingerprint = self._entries.get(key)
+            if fingerprint is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return fingerprint
+
+    def put(self, key: Hashable, fingerprint: str) -> None:
+        """Cache a fingerprint, and evict the least recently used fingerprints if the cache is full."""
+        size = _entry_size(key=key, fingerprint=fingerprint)
+        if size > self.maxbytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.nbytes -= _entry_size(key=key, fingerprint=previous)
+            self._entries[key] = fingerprint
+            self.nbytes += size
+            while len(self._entries) > self.maxsize or self.nbytes > self.maxbytes:
+                evicted_key, evicted = self._entries.popitem(last=False)
+                self.nbytes -= _entry_size(key=evicted_key, fingerprint=evicted)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all cached fingerprints and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,90 @@
+import hashlib
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+
+from json_fingerprint import hash_functions
+
+# Hash function names are written into fingerprints between "$" delimiters
+_HASH_FUNCTION_NAME_PATTERN = re.compile("^[a-z0-9_]+$")
+
+# Hash constructors, digest sizes and binary format ids by hash function name. The tables are changed in place, so the
+# modules that look up hash functions import and keep these very objects
+HASH_CONSTRUCTORS: Dict[str, Callable] = {}
+DIGEST_SIZES: Dict[str, int] = {}
+HASH_FUNCTION_IDS: Dict[str, int] = {}
+
+_BUILTIN_HASH_FUNCTIONS = (
+    hash_functions.SHA256,
+    hash_functions.SHA384,
+    hash_functions.SHA512,
+    hash_functions.BLAKE2B,
+    hash_functions.BLAKE2S,
+)
+
+# (register hook, unregister hook) pairs of the modules that derive tables from the registry
+_register_hooks: List[Tuple[Callable[[str], None], Callable[[str], None]]] = []
+
+
+def _add_register_hook(hook: Callable[[str], None], unregister_hook: Callable[[str], None]) -> None:
+    """Call a hook with the name of each registered hash function, including earlier ones, and another with each unregistered one."""
+    for name in HASH_CONSTRUCTORS:
+        hook(name)
+    _register_hooks.append((hook, unregister_hook))
+
+
+def register_hash_function(name: str, constructor: Callable, binary_id: Optional[int] = None) -> None:
+    """Register a hash function for creating, decoding and validating JSON fingerprints.
+
+    Fingerprints created with different hash functions are never equal, and a registered hash function can't be
+    replaced, so that the fingerprints of a name stay comparable. Any hashlib-compatible constructor can be registered,
+    such as `blake3.blake3` or `xxhash.xxh3_128` for internal cache keys.
+
+    Args:
+        name (str):
+            The hash function name in fingerprints, of lowercase letters, digits and underscores (example: "blake3").
+        constructor (callable):
+            A hashlib-compatible constructor, which is called with optional initial data and returns a hash object
+            with `update()`, `digest()`, `hexdigest()` and `digest_size`.
+        binary_id (int):
+            The hash function id byte of the binary format (see `to_bytes()`), from 1 to 255. Fingerprints of hash
+            functions without an id can't be converted into the binary format. None by default.
+    """
+    if type(name) is not str or not _HASH_FUNCTION_NAME_PATTERN.match(name):
+        raise ValueError(f"Expected a hash function name of lowercase letters, digits and underscores, instead got '{name}'")
+    if name in HASH_CONSTRUCTORS:
+        raise ValueError(f"Expected a hash function name other than the registered '{tuple(HASH_CONSTRUCTORS)}', instead got '{name}'")
+    if binary_id is not None and (type(binary_id) is not int or not 1 <= binary_id <= 255 or binary_id in HASH_FUNCTION_IDS.values()):
+        raise ValueError(f"Expected an unused binary id from 1 to 255, instead got '{binary_id}'")
+    digest_size = constructor().digest_size
+
+    HASH_CONSTRUCTORS[name] = constructor
+    DIGEST_SIZES[name] = digest_size
+    if binary_id is not None:
+        HASH_FUNCTION_IDS[name] = binary_id
+    for hook, _ in _register_hooks:
+        hook(name)
+
+
+def _unregister_hash_function(name: str) -> None:
+    """Remove a registered hash function, such as one registered by a test. Built-in hash functions can't be removed."""
+    if name not in HASH_CONSTRUCTORS or name in _BUILTIN_HASH_FUNCTIONS:
+        raise ValueError(f"Expected a registered hash function other than the built-in ones, instead got '{name}'")
+    # The unregister hooks look up the hash function's digest size and binary id, so it's removed from the tables last
+    for _, unregister_hook in _register_hooks:
+        unregister_hook(name)
+    del HASH_CONSTRUCTORS[name]
+    del DIGEST_SIZES[name]
+    HASH_FUNCTION_IDS.pop(name, None)
+
+
+def available_hash_functions() -> List[str]:
+    """Return the names of the registered hash functions, including the built-in ones."""
+    return list(HASH_CONSTRUCTORS)
+
+
+for _name, _constructor, _binary_id in zip(
+    _BUILTIN_HASH_FUNCTIONS,
+    (hashlib.sha256, hashlib.sha384, hashlib.sha512, hashlib.blake2b, hashlib.blake2s),
+    (1, 2, 3, 4, 5),
+):
+    register_hash_function(name=_name, constructor=_constructor, binary_id=_binary_id)
@@ -0,0 +1,397 @@
+import bisect
+from collections import Counter
+from json.encoder import encode_basestring
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Union
+
+from ._jfpv1 import _HASH_CONSTRUCTORS, _encode_value, _hash_digest_list
+from ._load_json import _load_json
+from ._validators import (
+    _validate_hash_function,
+    _validate_input_type,
+    _validate_object,
+    _validate_version,
+)
+from .exceptions import JSONPatch
+
+PATCH_OPERATIONS = ("add", "replace", "remove")
+
+# A data element that isn't a non-empty dict or list: (path head, value tail, hash digest without siblings)
+_Leaf = Tuple[str, str, bytes]
+
+
+class _Node:
+    """A non-empty dict or list of the JSON data, with the data elements beneath it.
+
+    List nodes also hold the sibling hash of the list and the digests of the list's own elements (the elements whose
+    closest enclosing list is this list) bound with the sibling hash.
+    """
+
+    __slots__ = ("is_list", "path", "child_path", "leaves", "children", "siblings", "bound")
+
+    def __init__(self, is_list: bool, path: str):
+        self.is_list = is_list
+        self.path = path
+        self.child_path = None
+        self.leaves: Dict[Union[str, int], _Leaf] = {}
+        self.children: Dict[Union[str, int], "_Node"] = {}
+        self.siblings = None
+        self.bound: List[bytes] = []
+
+
+def _open_node(node: _Node, data: Any) -> Iterator[Tuple[Union[str, int], Any]]:
+    """Prepare a node for building, and return an iterator over the keys and values of its data."""
+    if node.is_list:
+        node.child_path = f"{node.path}|[{len(data)}]" if node.path else f"[{len(data)}]"
+        return enumerate(data)
+    return iter(data.items())
+
+
+def _copy_json(data: Any) -> Any:
+    """Copy JSON data without recursion, like `copy.deepcopy` with JSON-compatible data."""
+    data_type = type(data)
+    if data_type is not dict and data_type is not list:
+        return data
+    copied = data_type()
+    stack = [(data, copied)]
+    while stack:
+        source, target = stack.pop()
+        items = source.items() if type(source) is dict else enumerate(source)
+        for key, value in items:
+            value_type = type(value)
+            if value_type is dict or value_type is list:
+                value_copy = value_type()
+                stack.append((value, value_copy))
+                value = value_copy
+            if type(target) is dict:
+                target[key] = value
+            else:
+                target.append(value)
+    return copied
+
+
+def _parse_pointer(pointer: str) -> List[str]:
+    """Split a JSON pointer (RFC 6901) into unescaped reference tokens."""
+    if type(pointer) is not str or (pointer and not pointer.startswith("/")):
+        err = f"Expected a JSON pointer starting with '/', instead got '{pointer}'"
+        raise JSONPatch(err)
+    if not pointer:
+        return []
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+
+def _list_index(data: List, token: str, pointer: str, insert: bool = False) -> int:
+    """Convert a reference token into an index of an existing list item, or an insertion index."""
+    if insert and token == "-":
+        return len(data)
+    if not token.isdigit() or not token.isascii() or (token.startswith("0") and token != "0"):
+        err = f"Expected a list index in JSON pointer '{pointer}', instead got '{token}'"
+        raise JSONPatch(err)
+    index = int(token)
+    if index > len(data) or (index == len(data) and not insert):
+        err = f"List index {index} of JSON pointer '{pointer}' is out of range"
+        raise JSONPatch(err)
+    return index
+
+
+def _container_key(data: Any, token: str, pointer: str) -> Union[str, int]:
+    """Convert a reference token into the key or index of an existing dict or list item."""
+    if type(data) is list:
+        return _list_index(data=data, token=token, pointer=pointer)
+    if type(data) is dict and token in data:
+        return token
+    err = f"Unable to find JSON pointer '{pointer}' in the JSON data"
+    raise JSONPatch(err)
+
+
+class IncrementalFingerprint:
+    """A JSON fingerprint that is updated incrementally as the JSON data changes by JSON Patch operations.
+
+    The hashes of all data elements and the sibling hashes of all lists are retained. An add, replace or remove operation
+    (RFC 6902) rehashes only the changed value, and rebinds the elements of the lists that enclose it with their new
+    sibling hashes. Adding or removing a list item changes the length of the list, which is a part of the paths of all
+    elements beneath it, so the list is rehashed as a whole. The sorted element hashes are updated in place, and the
+    fingerprint is identical to the one created with `create()` from the patched JSON data.
+
+    Args:
+        input (str):
+            JSON input in string format.
+        hash_function (str):
+            One of the supported hash function names in string format (options: "sha256", "sha384", "sha512",
+            "blake2b", "blake2s", or a registered hash function).
+        version (int):
+            An integer indicating the JSON fingerprint algorithm version to be used (options: 1).
+    """
+
+    def __init__(self, input: str, hash_function: str, version: int):
+        _validate_version(version=version)
+        _validate_input_type(input=input)
+        _validate_hash_function(hash_function=hash_function, version=version)
+        self.hash_function = hash_function
+        self.version = version
+        self._hash_constructor = _HASH_CONSTRUCTORS[hash_function]
+        self._reset(data=_load_json(data=input))
+
+    @property
+    def data(self) -> Any:
+        """The current JSON data. It must not be modified directly, as the element hashes would go out of sync."""
+        return self._data
+
+    @property
+    def fingerprint(self) -> str:
+        """The JSON fingerprint of the current JSON data."""
+        if self._fingerprint is None:
+            hex_digest = _hash_digest_list(digests=self._digests, hash_constructor=self._hash_constructor)
+            self._fingerprint = f"jfpv{self.version}${self.hash_function}${hex_digest}"
+        return self._fingerprint
+
+    def add(self, path: str, value: Any) -> str:
+        """Add a value to a dict, or insert it into a list ("-" appends), and return the updated fingerprint."""
+        self._apply(op="add", pointer=path, value=value)
+        return self.fingerprint
+
+    def replace(self, path: str, value: Any) -> str:
+        """Replace an existing value, and return the updated fingerprint."""
+        self._apply(op="replace", pointer=path, value=value)
+        return self.fingerprint
+
+    def remove(self, path: str) -> str:
+        """Remove an existing value, and return the updated fingerprint."""
+        self._apply(op="remove", pointer=path)
+        return self.fingerprint
+
+    def patch(self, operations: Iterable[Dict[str, Any]]) -> str:
+        """Apply JSON Patch operations in order, and return the updated fingerprint.
+
+        Each operation is a dict with "op" ("add", "replace" or "remove"), "path" (a JSON pointer) and, except for
+        "remove", "value" keys. If an operation fails, the operations before it remain applied.
+        """
+        for operation in operations:
+            op = operation.get("op") if type(operation) is dict else None
+            if op not in PATCH_OPERATIONS:
+                err = f"Expected one of supported JSON patch operations '{PATCH_OPERATIONS}', instead got '{op}'"
+                raise JSONPatch(err)
+            if "path" not in operation or (op != "remove" and "value" not in operation):
+                members = ("path",) if op == "remove" else ("path", "value")
+                err = f"Expected members '{members}' in JSON patch operation, instead got '{operation}'"
+                raise JSONPatch(err)
+            self._apply(op=op, pointer=operation["path"], value=operation.get("value"))
+        return self.fingerprint
+
+    def _hash(self, data: bytes) -> bytes:
+        return self._hash_constructor(data).digest()
+
+    def _reset(self, data: Any) -> None:
+        """Hash all data elements of new JSON data."""
+        self._data = data
+        self._root = self._build(data=data, path="")
+        digests = []
+        self._collect_digests(item=self._root, in_list=False, digests=digests)
+        digests.sort()
+        self._digests = digests
+        self._fingerprint = None
+
+    def _build(self, data: Any, path: str) -> Union[_Node, _Leaf]:
+        """Hash the data elements of a value, and bind the elements of the lists in it with their sibling hashes.
+
+        The value is traversed with an explicit stack, so the nesting depth isn't bound by the recursion limit. Each list
+        is bound when all of its items are built.
+        """
+        data_type = type(data)
+        if (data_type is not dict and data_type is not list) or not data:
+            return self._leaf(data=data, path=path)
+
+        root = _Node(is_list=data_type is list, path=path)
+        stack = [(root, _open_node(node=root, data=data))]
+        while stack:
+            node, items = stack[-1]
+            for key, value in items:
+                child_path = node.child_path if node.is_list else f"{node.path}|{{{key}}}" if node.path else f"{{{key}}}"
+                value_type = type(value)
+                if (value_type is dict or value_type is list) and value:
+                    child = _Node(is_list=value_type is list, path=child_path)
+                    node.children[key] = child
+                    stack.append((child, _open_node(node=child, data=value)))
+                    break
+                node.leaves[key] = self._leaf(data=value, path=child_path)
+            else:
+                stack.pop()
+                if node.is_list:
+                    self._bind(node=node)
+        return root
+
+    def _leaf(self, data: Any, path: str) -> _Leaf:
+        head = '{"path":' + encode_basestring(path)
+        tail = '"value":' + _encode_value(data) + "}"
+        return head, tail, self._hash(f"{head},{tail}".encode("utf-8"))
+
+    @staticmethod
+    def _set_child(node: _Node, key: Union[str, int], item: Union[_Node, _Leaf]) -> None:
+        if type(item) is _Node:
+            node.children[key] = item
+        else:
+            node.leaves[key] = item
+
+    @staticmethod
+    def _gather_own(node: _Node, own: List[_Leaf], nested: List[_Node]) -> None:
+        """Collect the elements whose closest enclosing list is the node's list, and the lists directly nested in it."""
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            own.extend(node.leaves.values())
+            for child in node.children.values():
+                if child.is_list:
+                    nested.append(child)
+                else:
+                    stack.append(child)
+
+    @staticmethod
+    def _collect_bound(node: _Node, digests: List[bytes]) -> None:
+        """Collect the bound element digests of all lists in a node's subtree."""
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node.is_list:
+                digests.extend(node.bound)
+            stack.extend(node.children.values())
+
+    @staticmethod
+    def _collect_digests(item: Union[_Node, _Leaf], in_list: bool, digests: List[bytes]) -> None:
+        """Collect the digests that a value contributes to the fingerprint.
+
+        These are the bound element digests of the lists in the value, and the digests of the elements outside of any
+        list. Elements inside an enclosing list contribute through the list's bound digests instead.
+        """
+        if type(item) is not _Node:
+            if not in_list:
+                digests.append(item[2])
+            return
+        stack = [(item, in_list)]
+        while stack:
+            node, in_list = stack.pop()
+            if node.is_list:
+                digests.extend(node.bound)
+                in_list = True
+            elif not in_list:
+                digests.extend([leaf[2] for leaf in node.leaves.values()])
+            stack.extend([(child, in_list) for child in node.children.values()])
+
+    def _bind(self, node: _Node) -> None:
+        """Compute the sibling hash of a list, and bind the list's own elements with it.
+
+        Only the list's own elements include the sibling hash, so it isn't computed for lists without elements of their
+        own.
+        """
+        own = []
+        nested = []
+        self._gather_own(node=node, own=own, nested=nested)
+        if not own:
+            node.siblings = None
+            node.bound = []
+            return
+        sibling_digests = []
+        for nested_node in nested:
+            self._collect_bound(node=nested_node, digests=sibling_digests)
+        sibling_digests.extend([leaf[2] for leaf in own])
+        sibling_digests.sort()
+        siblings = _hash_digest_list(digests=sibling_digests, hash_constructor=self._hash_constructor)
+        node.siblings = siblings
+        node.bound = [self._hash(f'{head},"siblings":"{siblings}",{tail}'.encode("utf-8")) for head, tail, _ in own]
+
+    def _apply(self, op: str, pointer: str, value: Any = None) -> None:
+        tokens = _parse_pointer(pointer=pointer)
+        if op != "remove":
+            _validate_object(input=value)
+            value = _copy_json(value)
+        if not tokens:
+            if op == "remove":
+                raise JSONPatch("Unable to remove the root of the JSON data")
+            self._reset(data=value)
+            return
+
+        parent, keys = self._locate(op=op, tokens=tokens, pointer=pointer)
+        was_empty = not parent
+        key = keys[-1]
+        if op == "remove":
+            del parent[key]
+        elif op == "add" and type(parent) is list:
+            parent.insert(key, value)
+        else:
+            parent[key] = value
+        self._rehash(op=op, parent=parent, keys=keys, was_empty=was_empty)
+
+    def _locate(self, op: str, tokens: List[str], pointer: str) -> Tuple[Union[dict, list], List[Union[str, int]]]:
+        """Find the container of the value at a JSON pointer, and the keys and indices leading to the value."""
+        keys = []
+        parent = self._data
+        for token in tokens[:-1]:
+            key = _container_key(data=parent, token=token, pointer=pointer)
+            keys.append(key)
+            parent = parent[key]
+        if type(parent) is list:
+            key = _list_index(data=parent, token=tokens[-1], pointer=pointer, insert=op == "add")
+        elif type(parent) is dict and (op == "add" or tokens[-1] in parent):
+            key = tokens[-1]
+        else:
+            err = f"Unable to find JSON pointer '{pointer}' in the JSON data"
+            raise JSONPatch(err)
+        keys.append(key)
+        return parent, keys
+
+    def _rehash(self, op: str, parent: Union[dict, list], keys: List[Union[str, int]], was_empty: bool) -> None:
+        """Rehash the smallest part of the data that an operation changed."""
+        if op == "replace" or (type(parent) is dict and parent and not was_empty):
+            # Only the value changed, or a key was added to or removed from a dict that remains non-empty
+            self._rebuild(keys=keys, depth=len(keys))
+        elif len(keys) > 1:
+            # The length of the list changed, or the dict changed between empty and non-empty
+            self._rebuild(keys=keys, depth=len(keys) - 1)
+        else:
+            self._reset(data=self._data)
+
+    def _rebuild(self, keys: List[Union[str, int]], depth: int) -> None:
+        """Rehash the value at `keys[:depth]`, and rebind the elements of the lists that enclose it."""
+        chain = [self._root]
+        data = self._data
+        for key in keys[: depth - 1]:
+            chain.append(chain[-1].children[key])
+            data = data[key]
+        node = chain[-1]
+        key = keys[depth - 1]
+        in_list = any(enclosing.is_list for enclosing in chain)
+
+        removed = []
+        added = []
+        old = node.children.pop(key, None) or node.leaves.pop(key, None)
+        if old is not None:
+            self._collect_digests(item=old, in_list=in_list, digests=removed)
+        if key in data if type(data) is dict else key < len(data):
+            if node.is_list:
+                path = node.child_path
+            else:
+                path = f"{node.path}|{{{key}}}" if node.path else f"{{{key}}}"
+            item = self._build(data=data[key], path=path)
+            self._set_child(node=node, key=key, item=item)
+            self._collect_digests(item=item, in_list=in_list, digests=added)
+
+        # The sibling hashes of the enclosing lists change from the innermost to the outermost list
+        for enclosing in reversed(chain):
+            if enclosing.is_list:
+                removed.extend(enclosing.bound)
+                self._bind(node=enclosing)
+                added.extend(enclosing.bound)
+        self._update_digests(removed=removed, added=added)
+
+    def _update_digests(self, removed: List[bytes], added: List[bytes]) -> None:
+        """Update the sorted digests in place, or re-sort them if a large share of them changed."""
+        digests = self._digests
+        if len(removed) + len(added) > len(digests) // 8:
+            counts = Counter(digests)
+            counts.subtract(removed)
+            counts.update(added)
+            self._digests = sorted(counts.elements())
+        else:
+            for digest in removed:
+                del digests[bisect.bisect_left(digests, digest)]
+            for digest in added:
+                bisect.insort(digests, digest)
+        self._fingerprint = None
@@ -0,0 +1,82 @@
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+from ._create import create_multi
+from ._decode import decode, decode_many
+
+
+class FingerprintIndex:
+    """A reusable set of JSON fingerprints for fast matching of JSON inputs.
+
+    The fingerprints are decoded once, when they are added to the index, and stored as raw digests grouped by their
+    variant (version and hash function). Matching a JSON input parses it only once, creates one fingerprint per variant
+    in the index, and looks up each digest from the set of its variant.
+
+    Args:
+        fingerprints (iterable of strings):
+            JSON fingerprints in string format.
+    """
+
+    def __init__(self, fingerprints: Iterable[str] = ()):
+        self._digests: Dict[Tuple[int, str], Set[bytes]] = {}
+        self.update(fingerprints)
+
+    def add(self, fingerprint: str) -> None:
+        """Add a JSON fingerprint to the index."""
+        version, hash_function, hash = decode(fingerprint=fingerprint)
+        self._digests.setdefault((version, hash_function), set()).add(bytes.fromhex(hash))
+
+    def update(self, fingerprints: Iterable[str]) -> None:
+        """Add JSON fingerprints to the index."""
+        digests = self._digests
+        for version, hash_function, hash in decode_many(fingerprints=fingerprints):
+            digests.setdefault((version, hash_function), set()).add(bytes.fromhex(hash))
+
+    def __contains__(self, fingerprint: str) -> bool:
+        version, hash_function, hash = decode(fingerprint=fingerprint)
+        return bytes.fromhex(hash) in self._digests.get((version, hash_function), ())
+
+    def __iter__(self) -> Iterator[str]:
+        for (version, hash_function), digests in self._digests.items():
+            for digest in digests:
+                yield f"jfpv{version}${hash_function}${digest.hex()}"
+
+    def __len__(self) -> int:
+        return sum(len(digests) for digests in self._digests.values())
+
+    @property
+    def variants(self) -> List[Tuple[int, str]]:
+        """The (version, hash function) variants of the fingerprints in the index."""
+        return list(self._digests)
+
+    def find_matches(self, input: str) -> List[str]:
+        """Match raw JSON string input to the fingerprints in the index.
+
+        Args:
+            input (str):
+                JSON input in string format.
+
+        Returns:
+            list: A list of matching JSON fingerprints in string format, at most one per variant in the index.
+        """
+        hash_functions_by_version = {}
+        for version, hash_function in self._digests:
+            hash_functions_by_version.setdefault(version, []).append(hash_function)
+
+        matches = []
+        for version, hash_functions in hash_functions_by_version.items():
+            for hash_function, fingerprint in zip(hash_functions, create_multi(input=input, hash_functions=hash_functions, version=version)):
+                if bytes.fromhex(fingerprint.rsplit("$", 1)[1]) in self._digests[(version, hash_function)]:
+                    matches.append(fingerprint)
+        return matches
+
+    def contains(self, input: str) -> bool:
+        """Check whether raw JSON string input matches any of the fingerprints in the index.
+
+        Args:
+            input (str):
+                JSON input in string format.
+
+        Returns:
+            bool: True if the input JSON data matches with a fingerprint in the index, otherwise False.
+        """
+        return bool(self.find_matches(input=input))
@@ -1,37 +1,38 @@
+import binascii
 import hashlib
 import json
-from typing import Any, Dict, List
+from json.encoder import encode_basestring
+from typing import Any, Callable, List, Optional, Sequence, Tuple
 
-from json_fingerprint import hash_functions
+from ._hash_registry import HASH_CONSTRUCTORS as _HASH_CONSTRUCTORS
+from ._subtree_cache import SubtreeCache
+
+_JSON_DUMPS_OPTIONS = {
+    "allow_nan": False,
+    "ensure_ascii": False,
+    "indent": None,
+    "separators": (",", ":"),
+    "skipkeys": False,
+    "sort_keys": True,
+}
+
+_INFINITY = float("inf")
+
+_DIGEST_BLOCK_SIZE = 1024
 
 
 def _create_json_hash(data: Any, hash_function: str) -> str:
     """Create a hash hex digest from json-converted data."""
-    json_string = json.dumps(
-        data,
-        allow_nan=False,
-        ensure_ascii=False,
-        indent=None,
-        separators=(",", ":"),
-        skipkeys=False,
-        sort_keys=True,
-    )
-    if hash_function == hash_functions.SHA256:
-        m = hashlib.sha256()
-    if hash_function == hash_functions.SHA384:
-        m = hashlib.sha384()
-    if hash_function == hash_functions.SHA512:
-        m = hashlib.sha512()
-    m.update(json_string.encode("utf-8"))
-
-    return m.hexdigest()
+    json_string = json.dumps(data, **_JSON_DUMPS_OPTIONS)
+    return _HASH_CONSTRUCTORS[hash_function](json_string.encode("utf-8")).hexdigest()
 
 
 def _create_sorted_hash_list(data: List, hash_function: str) -> List[str]:
     """Create a sorted hash hex digest list."""
+    hash_constructor = _HASH_CONSTRUCTORS[hash_function]
     out = []
     for obj in data:
-        hash = _create_json_hash(obj, hash_function=hash_function)
+        hash = hash_constructor(json.dumps(obj, **_JSON_DUMPS_OPTIONS).encode("utf-8")).hexdigest()
         out.append(hash)
     out.sort()
     return out
@@ -109,9 +110,271 @@ def _flatten_json(data: Any, hash_function: str, path: str = "", siblings: List
     return out
 
 
-def _create_jfpv1_fingerprint(data: Any, hash_function: str):
+def _encode_value(value: Any) -> str:
+    """Encode an element value into the same canonical JSON format as `_create_json_hash`."""
+    if type(value) is str:
+        return encode_basestring(value)
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if type(value) is int:
+        return int.__repr__(value)
+    if type(value) is float:
+        if value != value or value == _INFINITY or value == -_INFINITY:
+            raise ValueError(f"Out of range float values are not JSON compliant: {value!r}")
+        return float.__repr__(value)
+    return json.dumps(value, **_JSON_DUMPS_OPTIONS)
+
+
+def _hash_digest_list(digests: List[bytes], hash_constructor: Callable) -> str:
+    """Create a hash hex digest from a JSON array of the hex digests of sorted raw digests.
+
+    Raw digests of a hash function have a fixed width, and each byte maps to two lowercase hex digits in the same order,
+    so raw digests sort in the same order as their hex digests. Sorting the raw digests compares half as many bytes, and
+    the JSON array is written into the hash in blocks, without building the hex digest list or the whole JSON string.
+    """
+    m = hash_constructor(b"[")
+    separator = b'"'
+    for start in range(0, len(digests), _DIGEST_BLOCK_SIZE):
+        end = start + _DIGEST_BLOCK_SIZE
+        m.update(separator + b'","'.join(map(binascii.hexlify, digests[start:end])) + b'"')
+        separator = b',"'
+    m.update(b"]")
+    return m.hexdigest()
+
+
+class _Frame:
+    """An open non-empty dict or list while hashing a subtree."""
+
+    __slots__ = ("is_list", "items", "depth", "path", "head", "start", "unbound")
+
+    def __init__(self, data: Any, parts: List[str], hashes: List[List[bytes]], unbound: List[Tuple[str, str]]):
+        self.is_list = type(data) is list
+        if self.is_list:
+            parts.append(f"[{len(data)}]")
+            self.items = iter(data)
+            self.start = len(hashes[0])
+            self.unbound = []
+        else:
+            self.items = iter(data.items())
+            self.unbound = unbound
+        self.depth = len(parts)
+        self.path = None
+        self.head = None
+
+
+def _hash_subtree(
+    data: Any,
+    path: str,
+    hash_constructors: Tuple[Callable, ...],
+    hashes: List[List[bytes]],
+    unbound: List[Tuple[str, str]],
+    subtree_cache: Optional[SubtreeCache] = None,
+) -> None:
+    """Hash the elements of a non-empty dict or list in a single bottom-up (post-order) pass.
+
+    The canonical JSON of each element is written directly in the key order of `_create_json_hash`: the element is split
+    into a path head and a value tail, between which the sibling hash is placed. The raw digests of elements inside the
+    subtree's lists are appended to `hashes`, which holds a digest list for each hash constructor. The remaining elements
+    depend on the sibling hash of the closest enclosing list, which is not known yet, so their heads and tails are
+    appended to `unbound`. Heads and tails don't depend on the hash function, so they are shared by all hash lists.
+
+    The subtree is traversed with an explicit stack of open dicts and lists instead of recursion, so the nesting depth
+    isn't bound by the recursion limit. The path segments of the open containers are kept in a list, and a container's
+    path is joined only when it has a value of its own, so deeply nested containers don't build a path at every level.
+
+    With a `subtree_cache`, the hashes of each list's own elements are looked up from the cache before hashing them.
+    """
+    parts = [path] if path else []
+    stack = [_Frame(data=data, parts=parts, hashes=hashes, unbound=unbound)]
+    while stack:
+        frame = stack[-1]
+        # Drop the path segments of the closed child container
+        depth = frame.depth
+        del parts[depth:]
+        if not frame.is_list:
+            if _advance_dict_frame(frame=frame, parts=parts, stack=stack, hashes=hashes):
+                stack.pop()
+        elif _advance_list_frame(frame=frame, parts=parts, stack=stack, hashes=hashes):
+            stack.pop()
+            _bind_list_elements(
+                list_unbound=frame.unbound,
+                start=frame.start,
+                hash_constructors=hash_constructors,
+                hashes=hashes,
+                subtree_cache=subtree_cache,
+            )
+
+
+def _advance_dict_frame(frame: _Frame, parts: List[str], stack: List[_Frame], hashes: List[List[bytes]]) -> bool:
+    """Collect the elements of an open dict up to its next non-empty container, which is pushed onto the stack.
+
+    Returns True when the dict is complete.
+    """
+    for key, value in frame.items:
+        value_type = type(value)
+        if (value_type is dict or value_type is list) and value:
+            parts.append(f"{{{key}}}")
+            stack.append(_Frame(data=value, parts=parts, hashes=hashes, unbound=frame.unbound))
+            return False
+        if frame.path is None:
+            frame.path = "|".join(parts)
+        p = f"{frame.path}|{{{key}}}" if frame.path else f"{{{key}}}"
+        if value_type is str:
+            frame.unbound.append(('{"path":' + encode_basestring(p), '"value":' + encode_basestring(value) + "}"))
+        else:
+            frame.unbound.append(('{"path":' + encode_basestring(p), '"value":' + _encode_value(value) + "}"))
+    return True
+
+
+def _advance_list_frame(frame: _Frame, parts: List[str], stack: List[_Frame], hashes: List[List[bytes]]) -> bool:
+    """Collect the elements of an open list up to its next non-empty container, which is pushed onto the stack.
+
+    Returns True when the list is complete, and its own elements can be bound with its sibling hash.
+    """
+    for item in frame.items:
+        item_type = type(item)
+        if (item_type is dict or item_type is list) and item:
+            stack.append(_Frame(data=item, parts=parts, hashes=hashes, unbound=frame.unbound))
+            return False
+        if frame.head is None:
+            frame.head = '{"path":' + encode_basestring("|".join(parts))
+        if item_type is str:
+            frame.unbound.append((frame.head, '"value":' + encode_basestring(item) + "}"))
+        else:
+            frame.unbound.append((frame.head, '"value":' + _encode_value(item) + "}"))
+    return True
+
+
+def _bind_list_elements(
+    list_unbound: List[Tuple[str, str]],
+    start: int,
+    hash_constructors: Tuple[Callable, ...],
+    hashes: List[List[bytes]],
+    subtree_cache: Optional[SubtreeCache] = None,
+) -> None:
+    """Hash a completed list's own elements with their sibling hash.
+
+    The sibling hash covers completed elements of nested lists and the list's own elements without siblings. Only the
+    list's own elements include the sibling hash, so it isn't computed for lists without elements of their own.
+    """
+    elements = [f"{element_head},{element_tail}".encode("utf-8") for element_head, element_tail in list_unbound]
+    if subtree_cache is not None:
+        _bind_list_elements_cached(
+            elements=elements,
+            list_unbound=list_unbound,
+            start=start,
+            hash_constructors=hash_constructors,
+            hashes=hashes,
+            subtree_cache=subtree_cache,
+        )
+        return
+    if not list_unbound:
+        return
+    for hash_constructor, constructor_hashes in zip(hash_constructors, hashes):
+        sibling_hashes = constructor_hashes[start:]
+        sibling_hashes.extend([hash_constructor(element).digest() for element in elements])
+        sibling_hashes.sort()
+        siblings = _hash_digest_list(digests=sibling_hashes, hash_constructor=hash_constructor)
+        constructor_hashes.extend(
+            [
+                hash_constructor(f'{element_head},"siblings":"{siblings}",{element_tail}'.encode("utf-8")).digest()
+                for element_head, element_tail in list_unbound
+            ]
+        )
+
+
+def _bind_list_elements_cached(
+    elements: List[bytes],
+    list_unbound: List[Tuple[str, str]],
+    start: int,
+    hash_constructors: Tuple[Callable, ...],
+    hashes: List[List[bytes]],
+    subtree_cache: SubtreeCache,
+) -> None:
+    """Hash a list's own elements with their sibling hash, reusing the hashes of an identical list from the cache.
+
+    The hashes depend only on the list's own elements, which include the list's path, and on the element hashes of its
+    nested lists. A digest of these is the cache key, so an identical list at the same path is hashed only once. When
+    the list isn't cached, identical elements within the list are hashed only once.
+    """
+    # Raw digests have a fixed width, so they can be concatenated without separators
+    key_hash = hashlib.blake2b(b"".join(hashes[0][start:]))
+    key_hash.update(b"\n")
+    key_hash.update(b"\n".join(elements))
+    key = (hash_constructors, key_hash.digest())
+    bound = subtree_cache.get(key)
+    if bound is None:
+        # Identical elements produce identical hashes, so each unique element is hashed once
+        unique_elements = dict(zip(elements, list_unbound))
+        bound = []
+        for hash_constructor, constructor_hashes in zip(hash_constructors, hashes):
+            element_hashes = {element: hash_constructor(element).digest() for element in unique_elements}
+            sibling_hashes = constructor_hashes[start:]
+            sibling_hashes.extend([element_hashes[element] for element in elements])
+            sibling_hashes.sort()
+            siblings = _hash_digest_list(digests=sibling_hashes, hash_constructor=hash_constructor)
+            bound_hashes = {
+                element: hash_constructor(f'{element_head},"siblings":"{siblings}",{element_tail}'.encode("utf-8")).digest()
+                for element, (element_head, element_tail) in unique_elements.items()
+            }
+            bound.append(tuple([bound_hashes[element] for element in elements]))
+        bound = tuple(bound)
+        subtree_cache.put(key, bound)
+
+    for constructor_hashes, constructor_bound in zip(hashes, bound):
+        constructor_hashes.extend(constructor_bound)
+
+
+def _hash_elements_multi(data: Any, hash_functions: Sequence[str], subtree_cache: Optional[SubtreeCache] = None) -> List[List[bytes]]:
+    """Create the raw hash digests of all sibling-aware data elements of json data structures with each hash function.
+
+    Produces the hashes of the elements of `_flatten_json`, without building the element dicts. The data is traversed
+    only once, regardless of the number of hash functions.
+    """
+    hash_constructors = tuple(_HASH_CONSTRUCTORS[hash_function] for hash_function in hash_functions)
+    return _hash_elements_with_constructors(data=data, hash_constructors=hash_constructors, subtree_cache=subtree_cache)
+
+
+def _hash_elements_with_constructors(
+    data: Any,
+    hash_constructors: Tuple[Callable, ...],
+    subtree_cache: Optional[SubtreeCache] = None,
+) -> List[List[bytes]]:
+    """Create the raw hash digests of all sibling-aware data elements of json data structures with each hash constructor."""
+    hashes = [[] for _ in hash_constructors]
+    unbound = []
+    data_type = type(data)
+    if (data_type is dict or data_type is list) and data:
+        _hash_subtree(data=data, path="", hash_constructors=hash_constructors, hashes=hashes, unbound=unbound, subtree_cache=subtree_cache)
+    else:
+        unbound.append(('{"path":""', '"value":' + _encode_value(data) + "}"))
+
+    elements = [f"{element_head},{element_tail}".encode("utf-8") for element_head, element_tail in unbound]
+    for hash_constructor, constructor_hashes in zip(hash_constructors, hashes):
+        constructor_hashes.extend([hash_constructor(element).digest() for element in elements])
+    return hashes
+
+
+def _hash_elements(data: Any, hash_function: str) -> List[bytes]:
+    """Create the raw hash digests of all sibling-aware data elements of json data structures."""
+    return _hash_elements_multi(data=data, hash_functions=(hash_function,))[0]
+
+
+def _create_jfpv1_fingerprints(data: Any, hash_functions: Sequence[str], subtree_cache: Optional[SubtreeCache] = None) -> List[str]:
+    """Create jfpv1 fingerprints with multiple hash functions, traversing the data only once."""
+    fingerprints = []
+    hashes_by_hash_function = _hash_elements_multi(data=data, hash_functions=hash_functions, subtree_cache=subtree_cache)
+    for hash_function, hashes in zip(hash_functions, hashes_by_hash_function):
+        hashes.sort()
+        hex_digest = _hash_digest_list(digests=hashes, hash_constructor=_HASH_CONSTRUCTORS[hash_function])
+        fingerprints.append(f"jfpv1${hash_function}${hex_digest}")
+    return fingerprints
+
+
+def _create_jfpv1_fingerprint(data: Any, hash_function: str, subtree_cache: Optional[SubtreeCache] = None):
     """Create a jfpv1 fingerprint."""
-    flattened_json = _flatten_json(data=data, hash_function=hash_function)
-    sorted_hash_list = _create_sorted_hash_list(data=flattened_json, hash_function=hash_function)
-    hex_digest = _create_json_hash(data=sorted_hash_list, hash_function=hash_function)
-    return f"jfpv1${hash_function}${hex_digest}"
+    return _create_jfpv1_fingerprints(data=data, hash_functions=(hash_function,), subtree_cache=subtree_cache)[0]
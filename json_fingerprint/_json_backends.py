@@ -0,0 +1,143 @@
+import contextlib
+import json
+from typing import Any, Callable, Dict, Iterator, List
+
+# Optional JSON parsers, which are registered as backends when they are installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+STDLIB_BACKEND = "json"
+
+# Third-party parsers don't agree with the standard library on some input that they accept: orjson turns integers that
+# don't fit into 64 bits into floats, and crashes with stack overflows on very deep nesting instead of rejecting it.
+# Input with runs of 19 or more digits, or nested deeper than this, is only parsed with the standard library
+_MAX_BACKEND_DEPTH = 256
+_LONG_DIGIT_RUN = b"0" * 19
+
+# Maps JSON input to its skeleton: digits to "0", brackets and braces to "[" and "]", and other bytes to spaces,
+# except quotes and backslashes
+_SKELETON_TABLE = bytes(
+    0x30 if 0x30 <= byte <= 0x39 else 0x5B if byte in b"[{" else 0x5D if byte in b"]}" else byte if byte in b'"\\' else 0x20 for byte in range(256)
+)
+
+_BACKENDS: Dict[str, Callable[[bytes], Any]] = {STDLIB_BACKEND: json.loads}
+if orjson is not None:
+    _BACKENDS["orjson"] = orjson.loads
+
+# The standard library is the default: third-party parsers need a check of the input before parsing (see
+# `_is_backend_input()`), which takes about as long as the parsing they save
+_backend = STDLIB_BACKEND
+
+
+def _validate_json_backend(name: str) -> None:
+    if name not in _BACKENDS:
+        raise ValueError(f"Expected one of JSON backends '{tuple(_BACKENDS)}', instead got '{name}'")
+
+
+def register_json_backend(name: str, loads: Callable[[bytes], Any]) -> None:
+    """Register a JSON parser backend, which can then be selected with `set_json_backend()`.
+
+    The standard library's `json.loads()` is the reference: the backend is called with UTF-8 encoded JSON input, and
+    must return the same data as `json.loads()`, or raise an exception. Input that the backend rejects (e.g. with NaN
+    literals or lone surrogates) is parsed again with `json.loads()`, so only the accepted input has to match. Input
+    with integers of 19 or more digits, or nested deeper than 256 levels, is never passed to the backend.
+
+    Args:
+        name (str):
+            The backend name. Registering an existing name replaces the backend, except for the standard library's
+            "json".
+        loads (callable):
+            A function that parses UTF-8 encoded JSON input in bytes format.
+    """
+    if name == STDLIB_BACKEND:
+        raise ValueError(f"Expected a JSON backend name other than '{STDLIB_BACKEND}', instead got '{name}'")
+    if not callable(loads):
+        raise ValueError(f"Expected a callable JSON parser, instead got '{type(loads).__name__}'")
+    _BACKENDS[name] = loads
+
+
+def set_json_backend(name: str) -> None:
+    """Select the JSON parser backend used by all functions that parse JSON input, in the calling process.
+
+    Worker processes inherit the backend when they are forked, and otherwise use the default backend.
+
+    Args:
+        name (str):
+            A registered backend name: "json" (the standard library), "orjson" if it is installed, or a backend
+            registered with `register_json_backend()`.
+    """
+    global _backend
+
+    _validate_json_backend(name=name)
+    _backend = name
+
+
+def get_json_backend() -> str:
+    """Return the name of the JSON parser backend in use. Defaults to the standard library's "json"."""
+    return _backend
+
+
+def available_json_backends() -> List[str]:
+    """Return the names of the registered JSON parser backends, including the standard library's "json"."""
+    return list(_BACKENDS)
+
+
+@contextlib.contextmanager
+def _using_json_backend(name: str) -> Iterator[None]:
+    """Select a JSON parser backend temporarily."""
+    global _backend
+
+    _validate_json_backend(name=name)
+    previous = _backend
+    _backend = name
+    try:
+        yield
+    finally:
+        _backend = previous
+
+
+def _is_backend_input(encoded: bytes) -> bool:
+    """Check that UTF-8 encoded JSON input has no runs of 19 or more digits, and isn't nested too deep for a backend.
+
+    The check runs on the skeleton of the input, in a few passes of C loops. Escaped backslashes and quotes, and then
+    strings without brackets, are removed from the skeleton, so that the remaining quotes delimit the strings with
+    brackets, whose brackets are dropped too. Each pass of removing the innermost pairs of the remaining brackets
+    removes one level of nesting. Up to the first syntax error, where a parser stops, the strings are delimited the same
+    way as the parser delimits them.
+    """
+    skeleton = encoded.translate(_SKELETON_TABLE)
+    if _LONG_DIGIT_RUN in skeleton:
+        return False
+    # Escapes are removed while backslashes are still followed by the bytes they escape
+    skeleton = skeleton.replace(b"\\\\", b"").replace(b'\\"', b"").translate(None, b" 0\\").replace(b'""', b"")
+    if b'"' in skeleton:
+        skeleton = b"".join(skeleton.split(b'"')[::2])
+    for _ in range(_MAX_BACKEND_DEPTH):
+        if not skeleton:
+            return True
+        inner = skeleton.replace(b"[]", b"")
+        if len(inner) == len(skeleton):
+            # Unbalanced brackets
+            return False
+        skeleton = inner
+    return not skeleton
+
+
+def _loads(data: str) -> Any:
+    """Parse JSON input with the selected backend, falling back to `json.loads()` where the backend can't be used."""
+    loads = _BACKENDS[_backend]
+    if loads is not json.loads:
+        try:
+            encoded = data.encode("utf-8")
+        except UnicodeEncodeError:
+            # Lone surrogates can't be encoded
+            encoded = None
+        if encoded is not None and _is_backend_input(encoded=encoded):
+            try:
+                return loads(encoded)
+            except Exception:
+                # The standard library decides over the input the backend rejects
+                pass
+    return json.loads(data)
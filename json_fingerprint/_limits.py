@@ -0,0 +1,101 @@
+from typing import Any, Optional, Tuple
+
+from .exceptions import LimitExceeded
+
+_INFINITY = float("inf")
+
+
+class Limits:
+    """Admission limits for JSON input, to bound the cost of fingerprinting untrusted payloads.
+
+    Limits are accepted by `create()`, `create_multi()`, `create_from_bytes()`, `create_from_file()`,
+    `create_from_object()`, `match()` and `find_matches()`, but not by `create_from_stream()`. The input size is
+    checked before the input is parsed, and the other limits are checked in a single non-recursive pass over the
+    parsed data before its data elements are hashed. `LimitExceeded` is raised as
+    soon as any limit is exceeded, so the cost of rejecting a payload is bounded by the limits rather than by the
+    payload. Limits that are None are not checked.
+
+    The sibling hash of each array covers all the data elements nested in it, so the work of fingerprinting a data
+    element grows with the number of arrays enclosing it: each data element costs one work unit, plus one for each
+    enclosing array.
+
+    Args:
+        max_depth (int):
+            The maximum nesting depth of objects and arrays. None by default.
+        max_elements (int):
+            The maximum number of data elements. None by default.
+        max_input_size (int):
+            The maximum size of the JSON input in characters (string input) or bytes (bytes-like input and files).
+            None by default.
+        max_work (int):
+            The maximum number of work units. None by default.
+    """
+
+    def __init__(
+        self,
+        max_depth: Optional[int] = None,
+        max_elements: Optional[int] = None,
+        max_input_size: Optional[int] = None,
+        max_work: Optional[int] = None,
+    ):
+        for name, value in (("max_depth", max_depth), ("max_elements", max_elements), ("max_input_size", max_input_size), ("max_work", max_work)):
+            if value is not None and value < 1:
+                raise ValueError(f"Expected a positive {name}, instead got '{value}'")
+        self.max_depth = max_depth
+        self.max_elements = max_elements
+        self.max_input_size = max_input_size
+        self.max_work = max_work
+
+    def _key(self) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+        """Return the limits checked on parsed data, which decide whether a cached fingerprint may be reused."""
+        return self.max_depth, self.max_elements, self.max_work
+
+    def _check_input_size(self, size: int) -> None:
+        if self.max_input_size is not None and size > self.max_input_size:
+            err = f"Expected an input size of at most {self.max_input_size}, instead got {size}"
+            raise LimitExceeded(err)
+
+    def _check_depth(self, depth: int) -> None:
+        if self.max_depth is not None and depth > self.max_depth:
+            err = f"Expected a nesting depth of at most {self.max_depth}, instead got {depth} or more"
+            raise LimitExceeded(err)
+
+    def _check_data(self, data: Any) -> None:
+        """Check the depth, the data elements and the work of parsed JSON data, without recursion."""
+        if self.max_depth is None and self.max_elements is None and self.max_work is None:
+            return
+        max_depth = _INFINITY if self.max_depth is None else self.max_depth
+        max_elements = _INFINITY if self.max_elements is None else self.max_elements
+        max_work = _INFINITY if self.max_work is None else self.max_work
+        elements = 0
+        work = 0
+        # Each entry holds a value, its nesting depth and the number of non-empty arrays enclosing it
+        stack = [(data, 0, 0)]
+        while stack:
+            value, depth, lists = stack.pop()
+            value_type = type(value)
+            if value_type is dict or value_type is list:
+                depth += 1
+                if depth > max_depth:
+                    self._check_depth(depth=depth)
+                if value:
+                    if value_type is list:
+                        stack.extend([(item, depth, lists + 1) for item in value])
+                    else:
+                        stack.extend([(item, depth, lists) for item in value.values()])
+                    continue
+            elements += 1
+            if elements > max_elements:
+                err = f"Expected at most {self.max_elements} data elements, instead got {elements} or more"
+                raise LimitExceeded(err)
+            work += lists + 1
+            if work > max_work:
+                err = f"Expected at most {self.max_work} work units, instead got {work} or more"
+                raise LimitExceeded(err)
+
+
+def _check_limits(data: Any, limits: Optional[Limits]) -> Any:
+    """Check parsed JSON data against optional limits, and return the data."""
+    if limits is not None:
+        limits._check_data(data=data)
+    return data
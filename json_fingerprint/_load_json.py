@@ -1,11 +1,72 @@
+import io
 import json
+import mmap
+import os
+from typing import Optional
 
-from .exceptions import JSONLoad
+from ._json_backends import _loads
+from ._limits import Limits
+from ._stream import _build_data, _EventReader
+from .exceptions import JSONLoad, LimitExceeded
 
 
-def _load_json(data: str):
+def _load_json(data: str, limits: Optional[Limits] = None):
+    """Load JSON with the selected JSON parser backend, and check the loaded data against optional limits."""
     try:
-        return json.loads(data)
+        loaded = _loads(data=data)
+    except RecursionError:
+        # json.loads recurses for each nesting level, so deeper documents are parsed iteratively
+        loaded = _load_json_iterative(data=data, limits=limits)
     except Exception:
         err = "Unable to load JSON"
         raise JSONLoad(err) from None
+    if limits is not None:
+        limits._check_data(data=loaded)
+    return loaded
+
+
+def _load_json_iterative(data: str, limits: Optional[Limits] = None):
+    """Load JSON without recursion, like `json.loads` but slower, regardless of the nesting depth.
+
+    The maximum depth of the limits is checked while parsing, so hostile deeply nested input is rejected early.
+    """
+    try:
+        return _build_data(events=_EventReader(stream=io.StringIO(data)).events(), limits=limits)
+    except LimitExceeded:
+        raise
+    except Exception:
+        err = "Unable to load JSON"
+        raise JSONLoad(err) from None
+
+
+def _decode_json_buffer(data) -> str:
+    """Decode a bytes-like object directly into a string, like `json.loads` does with bytes input."""
+    try:
+        encoding = json.detect_encoding(bytes(data[:4]))
+        return str(data, encoding, "surrogatepass")
+    except Exception:
+        err = "Unable to load JSON"
+        raise JSONLoad(err) from None
+
+
+def _load_json_buffer(data, limits: Optional[Limits] = None):
+    """Load JSON from a bytes-like object without copying it into an intermediate bytes object."""
+    text = _decode_json_buffer(data=data)
+    return _load_json(data=text, limits=limits)
+
+
+def _load_json_file(path, limits: Optional[Limits] = None):
+    """Load JSON from a file.
+
+    The file is memory-mapped and decoded directly into a string. The mapped pages are released before parsing, so the
+    file content is held in memory only once, as the decoded string.
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            # Empty files can't be memory-mapped
+            return _load_json_buffer(data=b"", limits=limits)
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            text = _decode_json_buffer(data=buffer)
+            if hasattr(mmap, "MADV_DONTNEED"):
+                buffer.madvise(mmap.MADV_DONTNEED)
+    return _load_json(data=text, limits=limits)
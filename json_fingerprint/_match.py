@@ -1,8 +1,17 @@
+from typing import Optional
+
 from ._create import create
 from ._decode import decode
+from ._fingerprint_cache import FingerprintCache
+from ._limits import Limits
 
 
-def match(input: str, target_fingerprint: str) -> bool:
+def match(
+    input: str,
+    target_fingerprint: str,
+    fingerprint_cache: Optional[FingerprintCache] = None,
+    limits: Optional[Limits] = None,
+) -> bool:
     """Match raw json string input to target fingerprint.
 
     Decodes the target fingerprint and creates a fingerprint from the input with identical parameters.
@@ -14,12 +23,16 @@ def match(input: str, target_fingerprint: str) -> bool:
             JSON input in string format.
         target_fingerprint (str):
             Target JSON fingerprint in string format.
+        fingerprint_cache (FingerprintCache):
+            Optional cache of created fingerprints, for recurring identical JSON inputs. None by default.
+        limits (Limits):
+            Optional admission limits for the JSON input, which raise `LimitExceeded` when exceeded. None by default.
 
     Returns:
         bool: True if the input JSON data matches with the target fingerprint, otherwise False.
     """
     version, hash_function, _ = decode(fingerprint=target_fingerprint)
-    input_fingerprint = create(input=input, hash_function=hash_function, version=version)
+    input_fingerprint = create(input=input, hash_function=hash_function, version=version, fingerprint_cache=fingerprint_cache, limits=limits)
     if input_fingerprint == target_fingerprint:
         return True
     return False
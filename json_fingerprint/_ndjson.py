@@ -0,0 +1,141 @@
+import codecs
+import json
+from typing import IO, Iterator, List, Optional, Tuple, Union
+
+from ._batch import DEFAULT_CHUNKSIZE, _imap_chunks, _validate_batch_options
+from ._create import create, create_from_bytes
+from ._validators import _validate_hash_function, _validate_version
+from .exceptions import JSONLoad
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+NDJSON_ERRORS = ("raise", "skip")
+
+
+def _read_chunks(stream: IO, buffer_size: int) -> Iterator[Union[str, bytes]]:
+    """Read a stream in chunks of `buffer_size`.
+
+    The encoding of a binary stream is detected from its first bytes, like `json.loads` does with bytes input. UTF-8
+    chunks are yielded as they are, and the records are decoded by `create_from_bytes()`. The line feeds of UTF-16 and
+    UTF-32 are more than one byte long, so these chunks are decoded incrementally into strings before they are split.
+    """
+    chunk = stream.read(buffer_size)
+    if not isinstance(chunk, bytes):
+        while chunk:
+            yield chunk
+            chunk = stream.read(buffer_size)
+        return
+    while 0 < len(chunk) < 4:
+        more = stream.read(buffer_size)
+        if not more:
+            break
+        chunk += more
+    encoding = json.detect_encoding(chunk)
+    if encoding in ("utf-8", "utf-8-sig"):
+        while chunk:
+            yield chunk
+            chunk = stream.read(buffer_size)
+        return
+    decoder = codecs.getincrementaldecoder(encoding)("surrogatepass")
+    while chunk:
+        yield decoder.decode(chunk)
+        chunk = stream.read(buffer_size)
+    yield decoder.decode(b"", final=True)
+
+
+def _iter_lines(stream: IO, buffer_size: int) -> Iterator[Tuple[int, Union[str, bytes]]]:
+    """Read a stream in chunks of `buffer_size`, and yield (line number, line) pairs of its non-blank lines."""
+    line_no = 0
+    rest = None
+    for chunk in _read_chunks(stream=stream, buffer_size=buffer_size):
+        if not chunk:
+            continue
+        if rest:
+            chunk = rest + chunk
+        lines = chunk.split(b"\n" if isinstance(chunk, bytes) else "\n")
+        rest = lines.pop()
+        for line in lines:
+            line_no += 1
+            if line.strip():
+                yield line_no, line
+    if rest is not None and rest.strip():
+        yield line_no + 1, rest
+
+
+def _create_ndjson_chunk(
+    lines: List[Tuple[int, Union[str, bytes]]],
+    hash_function: str,
+    version: int,
+    errors: str,
+) -> List[Tuple[int, Optional[str]]]:
+    """Create JSON fingerprints of a chunk of numbered lines, in a worker process or inline."""
+    results = []
+    for line_no, line in lines:
+        try:
+            if isinstance(line, str):
+                fingerprint = create(input=line, hash_function=hash_function, version=version)
+            else:
+                fingerprint = create_from_bytes(input=line, hash_function=hash_function, version=version)
+        except (JSONLoad, ValueError) as exc:
+            if errors == "raise":
+                raise type(exc)(f"{exc} on line {line_no}") from None
+            fingerprint = None
+        results.append((line_no, fingerprint))
+    return results
+
+
+def create_from_ndjson(
+    stream: IO,
+    hash_function: str,
+    version: int,
+    errors: str = "raise",
+    workers: Optional[int] = 1,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> Iterator[Tuple[int, Optional[str]]]:
+    """Create JSON fingerprints of the records of newline-delimited JSON (NDJSON or JSON Lines), one record per line.
+
+    The stream is read in large buffered chunks and split into lines, and the records are fingerprinted in chunks,
+    optionally in parallel on a pool of worker processes (see `imap_create()`). Blank lines are skipped. Fingerprints
+    are identical to the ones created with `create()` from each line.
+
+    Args:
+        stream (file-like object):
+            A binary (UTF-8, UTF-16 or UTF-32 encoded, detected from the first bytes) or text file-like object with
+            NDJSON input.
+        hash_function (str):
+            One of the supported hash function names in string format (options: "sha256", "sha384", "sha512",
+            "blake2b", "blake2s", or a registered hash function).
+        version (int):
+            An integer indicating the JSON fingerprint algorithm version to be used (options: 1).
+        errors (str):
+            How invalid records are handled: "raise" raises `JSONLoad` (or `ValueError` with out of range floats) with
+            the line number, and "skip" yields None in place of the fingerprint. "raise" by default.
+        workers (int):
+            The number of worker processes. 1 by default, in which case no processes are started. None uses the number
+            of CPUs.
+        chunksize (int):
+            The number of records fingerprinted at a time, or dispatched to a worker process at a time. 256 by default.
+        buffer_size (int):
+            The number of bytes or characters read from the stream at a time. 1 MiB by default.
+
+    Returns:
+        iterator: An iterator of (line number, JSON fingerprint) tuples in line order, with 1-based line numbers.
+    """
+    _validate_version(version=version)
+    _validate_hash_function(hash_function=hash_function, version=version)
+    _validate_batch_options(workers=workers, chunksize=chunksize, max_pending=None)
+    if errors not in NDJSON_ERRORS:
+        raise ValueError(f"Expected one of error handling options '{NDJSON_ERRORS}', instead got '{errors}'")
+    if buffer_size < 1:
+        raise ValueError(f"Expected a positive buffer_size, instead got '{buffer_size}'")
+    chunks = _imap_chunks(
+        inputs=_iter_lines(stream=stream, buffer_size=buffer_size),
+        function=_create_ndjson_chunk,
+        args=(hash_function, version, errors),
+        workers=workers,
+        chunksize=chunksize,
+        max_pending=None,
+        ordered=True,
+    )
+    return (result for _, results in chunks for result in results)
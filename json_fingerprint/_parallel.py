@@ -0,0 +1,267 @@
+import binascii
+import math
+import multiprocessing
+import os
+import sys
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from json.encoder import encode_basestring
+from typing import Any, Callable, List, Optional, Tuple
+
+from ._jfpv1 import (
+    _HASH_CONSTRUCTORS,
+    _create_jfpv1_fingerprint,
+    _encode_value,
+    _hash_subtree,
+)
+from ._limits import Limits
+from ._load_json import _load_json
+from ._validators import (
+    _validate_hash_function,
+    _validate_input_type,
+    _validate_version,
+)
+
+# Top-level items are split into this many chunks per worker process, and the hashes into this many partitions per
+# worker process, which evens out chunks and partitions of uneven cost
+_TASKS_PER_WORKER = 4
+
+# On Linux, the worker processes are forked after parsing, and read the top-level items from a copy-on-write copy of
+# the parent's memory instead of having them pickled
+_FORK_ITEMS = sys.platform.startswith("linux")
+
+# The top-level items of the pool's document in a forked worker process, set by the pool's initializer. The items are
+# passed as the initializer's arguments, which forked processes inherit without pickling, so each pool has its own
+_worker_items: Optional[List[Any]] = None
+
+
+def _init_worker(items: List[Any]) -> None:
+    """Keep the top-level items inherited from the calling process in a forked worker process."""
+    global _worker_items
+
+    _worker_items = items
+
+
+def _chunk_items(items: Optional[List[Any]], start: int, end: int) -> List[Any]:
+    return _worker_items[start:end] if items is None else items
+
+
+def _collect_items(
+    items: List[Any],
+    path: str,
+    is_list: bool,
+    hash_constructors: Tuple,
+    hashes: List[List[bytes]],
+    unbound: List[Tuple[str, str]],
+) -> None:
+    """Hash the subtrees of a chunk of top-level items like `_hash_subtree`, and collect the top-level elements in `unbound`.
+
+    The items are list items at `path`, or (key, value) pairs of a top-level dict. Elements inside the lists nested in
+    the items are complete, and their hashes are appended to `hashes`.
+    """
+    head = '{"path":' + encode_basestring(path)
+    for item in items:
+        if is_list:
+            value = item
+            item_path = path
+        else:
+            key, value = item
+            item_path = f"{{{key}}}"
+            head = '{"path":' + encode_basestring(item_path)
+        value_type = type(value)
+        if (value_type is dict or value_type is list) and value:
+            _hash_subtree(data=value, path=item_path, hash_constructors=hash_constructors, hashes=hashes, unbound=unbound)
+        else:
+            unbound.append((head, '"value":' + _encode_value(value) + "}"))
+
+
+def _partition(digests: List[bytes], partitions: int) -> List[bytes]:
+    """Split digests into `partitions` ranges of their first byte, and pack the digests of each range into a single bytes object.
+
+    Digests are uniformly distributed, so the partitions are about equally large, and packed digests are cheap to pickle.
+    """
+    buckets = [[] for _ in range(partitions)]
+    for digest in digests:
+        buckets[digest[0] * partitions >> 8].append(digest)
+    return [b"".join(bucket) for bucket in buckets]
+
+
+def _hash_items(
+    items: Optional[List[Any]],
+    start: int,
+    end: int,
+    path: str,
+    is_list: bool,
+    hash_function: str,
+    partitions: int,
+) -> Tuple[List[bytes], List[bytes], bytes]:
+    """Hash a chunk of top-level items in a worker process.
+
+    Returns the partitioned hashes of the complete elements, the partitioned hashes of the top-level elements without a
+    sibling hash, and with top-level list items, the canonical JSON heads and tails of the top-level elements for
+    `_bind_items()`. Heads and tails never contain a raw line feed, so they are joined with line feeds into a single
+    bytes object, which is cheap to pickle.
+    """
+    hash_constructor = _HASH_CONSTRUCTORS[hash_function]
+    hashes = [[]]
+    unbound = []
+    _collect_items(
+        items=_chunk_items(items=items, start=start, end=end),
+        path=path,
+        is_list=is_list,
+        hash_constructors=(hash_constructor,),
+        hashes=hashes,
+        unbound=unbound,
+    )
+    unbound_hashes = [hash_constructor(f"{element_head},{element_tail}".encode("utf-8")).digest() for element_head, element_tail in unbound]
+    elements = "\n".join([f"{element_head}\n{element_tail}" for element_head, element_tail in unbound]).encode("utf-8") if is_list else b""
+    return _partition(digests=hashes[0], partitions=partitions), _partition(digests=unbound_hashes, partitions=partitions), elements
+
+
+def _bind_items(elements: bytes, hash_function: str, siblings: str, partitions: int) -> List[bytes]:
+    """Hash the top-level elements of a chunk of top-level list items with the list's sibling hash in a worker process."""
+    hash_constructor = _HASH_CONSTRUCTORS[hash_function]
+    parts = elements.split(b"\n")
+    separator = f',"siblings":"{siblings}",'.encode("ascii")
+    hashes = [hash_constructor(parts[index] + separator + parts[index + 1]).digest() for index in range(0, len(parts), 2)]
+    return _partition(digests=hashes, partitions=partitions)
+
+
+def _sort_partition(packed: List[bytes], digest_size: int) -> bytes:
+    """Sort the digests of a partition in a worker process, and return them as a fragment of a JSON array of hex digests."""
+    data = b"".join(packed)
+    bounds = range(0, len(data) + 1, digest_size)
+    digests = [data[start:end] for start, end in zip(bounds, bounds[1:])]
+    digests.sort()
+    return b",".join([b'"' + binascii.hexlify(digest) + b'"' for digest in digests])
+
+
+def _hash_partitions(executor: Executor, partitions: List[List[bytes]], hash_constructor: Callable) -> str:
+    """Sort partitioned digests on a process pool, and create a hash hex digest of the JSON array of their hex digests.
+
+    The partitions are ranges of the digests' first byte, so the fragments of the sorted partitions are in the order of
+    the sorted digests, and the result is identical to `_hash_digest_list()` of the sorted digests.
+    """
+    digest_size = hash_constructor().digest_size
+    futures = [executor.submit(_sort_partition, packed, digest_size) for packed in partitions]
+    m = hash_constructor(b"[")
+    separator = b""
+    for future in futures:
+        fragment = future.result()
+        if fragment:
+            m.update(separator + fragment)
+            separator = b","
+    m.update(b"]")
+    return m.hexdigest()
+
+
+def _split(count: int, chunks: int) -> List[Tuple[int, int]]:
+    size = math.ceil(count / chunks)
+    return [(start, min(start + size, count)) for start in range(0, count, size)]
+
+
+def _gather_chunks(futures: List[Future], partitions: int) -> Tuple[List[List[bytes]], List[List[bytes]], List[bytes]]:
+    """Collect the results of `_hash_items()` of all chunks.
+
+    Returns the packed digests of the complete and of the unbound elements per partition, and the canonical JSON of the
+    top-level elements of each chunk of top-level list items.
+    """
+    hashes = [[] for _ in range(partitions)]
+    unbound_hashes = [[] for _ in range(partitions)]
+    chunk_elements = []
+    for future in futures:
+        chunk_hashes, chunk_unbound_hashes, elements = future.result()
+        for partition, packed in enumerate(chunk_hashes):
+            hashes[partition].append(packed)
+        for partition, packed in enumerate(chunk_unbound_hashes):
+            unbound_hashes[partition].append(packed)
+        if elements:
+            chunk_elements.append(elements)
+    return hashes, unbound_hashes, chunk_elements
+
+
+def _create_jfpv1_parallel_fingerprint(data: Any, hash_function: str, workers: int) -> str:
+    """Create a jfpv1 fingerprint by hashing chunks of the top-level items on a process pool.
+
+    The elements inside the items' nested lists are complete within a chunk. The top-level elements of a dict have no
+    sibling hash, and are hashed in the first pass. The top-level elements of a list depend on the list's sibling hash,
+    which covers the hashes of all elements of the list, so they are hashed in a second pass from the canonical JSON
+    returned by the first pass, once the first pass of all chunks is complete.
+
+    The hashes are partitioned by their first byte and sorted in parallel as well, so the calling process only parses the
+    input and hashes the sorted partitions in order. The result doesn't depend on the chunks or the partitions.
+    """
+    is_list = type(data) is list
+    items = data if is_list else list(data.items())
+    path = f"[{len(data)}]" if is_list else ""
+    partitions = min(workers * _TASKS_PER_WORKER, 256)
+    # The chunks are passed as (items, start, end), where the items are None when the workers read them from memory
+    chunks = [(None if _FORK_ITEMS else items[start:end], start, end) for start, end in _split(count=len(items), chunks=workers * _TASKS_PER_WORKER)]
+    hash_constructor = _HASH_CONSTRUCTORS[hash_function]
+    if _FORK_ITEMS:
+        pool_options = {"mp_context": multiprocessing.get_context("fork"), "initializer": _init_worker, "initargs": (items,)}
+    else:
+        pool_options = {}
+
+    with ProcessPoolExecutor(max_workers=workers, **pool_options) as executor:
+        futures = [executor.submit(_hash_items, *chunk, path, is_list, hash_function, partitions) for chunk in chunks]
+        hashes, unbound_hashes, chunk_elements = _gather_chunks(futures=futures, partitions=partitions)
+        if chunk_elements:
+            sibling_hashes = [packed + unbound for packed, unbound in zip(hashes, unbound_hashes)]
+            siblings = _hash_partitions(executor=executor, partitions=sibling_hashes, hash_constructor=hash_constructor)
+            futures = [executor.submit(_bind_items, elements, hash_function, siblings, partitions) for elements in chunk_elements]
+            for future in futures:
+                for partition, packed in enumerate(future.result()):
+                    hashes[partition].append(packed)
+        else:
+            for packed, unbound in zip(hashes, unbound_hashes):
+                packed.extend(unbound)
+        hex_digest = _hash_partitions(executor=executor, partitions=hashes, hash_constructor=hash_constructor)
+
+    return f"jfpv1${hash_function}${hex_digest}"
+
+
+def create_parallel(
+    input: str,
+    hash_function: str,
+    version: int,
+    workers: Optional[int] = None,
+    limits: Optional[Limits] = None,
+) -> str:
+    """Create a JSON fingerprint of a single large JSON document on a pool of worker processes.
+
+    The document is parsed once, and its top-level array items or object values are split into chunks, which are hashed
+    in parallel, and so are the partitions of the sorted element hashes. The fingerprint is identical to the one created
+    with `create()`. Parsing and the final hash run in the calling process, so the speedup is bounded by their share of
+    the work. On Linux, the worker processes are forked after parsing and read the items from the shared copy-on-write
+    memory of the calling process, so the items aren't pickled.
+
+    Args:
+        input (str):
+            JSON input in string format.
+        hash_function (str):
+            One of the supported hash function names in string format (options: "sha256", "sha384", "sha512",
+            "blake2b", "blake2s", or a registered hash function).
+        version (int):
+            An integer indicating the JSON fingerprint algorithm version to be used (options: 1).
+        workers (int):
+            The number of worker processes. Defaults to the number of CPUs. With 1 worker, or when the document isn't
+            a non-empty array or object, no processes are started.
+        limits (Limits):
+            Optional admission limits for the JSON input, which raise `LimitExceeded` when exceeded. None by default.
+
+    Returns:
+        str: A pre-formatted JSON fingerprint (example: "jfpv1${hash_function_name}${hash_hex_digest}").
+    """
+    _validate_version(version=version)
+    _validate_input_type(input=input)
+    _validate_hash_function(hash_function=hash_function, version=version)
+    if workers is not None and workers < 1:
+        raise ValueError(f"Expected a positive number of workers, instead got '{workers}'")
+    if limits is not None:
+        limits._check_input_size(size=len(input))
+    data = _load_json(data=input, limits=limits)
+    workers = workers or os.cpu_count() or 1
+    data_type = type(data)
+    if workers == 1 or not (data_type is dict or data_type is list) or not data:
+        return _create_jfpv1_fingerprint(data=data, hash_function=hash_function)
+    return _create_jfpv1_parallel_fingerprint(data=data, hash_function=hash_function, workers=workers)
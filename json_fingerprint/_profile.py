@@ -0,0 +1,196 @@
+import contextlib
+import contextvars
+import time
+from typing import Any, Callable, Iterator, List, NamedTuple, Optional, Tuple
+
+from ._jfpv1 import (
+    _HASH_CONSTRUCTORS,
+    _hash_digest_list,
+    _hash_elements_with_constructors,
+)
+from ._subtree_cache import SubtreeCache
+
+
+class CreateProfile(NamedTuple):
+    """Per-phase durations and data statistics of a single fingerprint creation.
+
+    Attributes:
+        hash_function (str):
+            The hash function name.
+        input_size (int):
+            The size of the JSON input in characters (string input) or bytes (bytes-like input and files), or None with
+            Python object input, which has no serialized size.
+        parse (float):
+            The duration of loading the JSON input, in seconds.
+        flatten_and_hash (float):
+            The duration of flattening the data and hashing the data elements in a single pass, in seconds.
+        sort (float):
+            The duration of sorting the element hashes, in seconds.
+        final_hash (float):
+            The duration of hashing the sorted element hashes into the fingerprint, in seconds.
+        total (float):
+            The duration of all phases, in seconds.
+        elements (int):
+            The number of sibling-aware data elements.
+        lists (int):
+            The number of non-empty lists, each of which has a sibling hash.
+        max_depth (int):
+            The maximum nesting depth of dicts and lists.
+        bytes_hashed (int):
+            The number of bytes fed into the hash function. Elements reused from a subtree cache aren't hashed.
+    """
+
+    hash_function: str
+    input_size: Optional[int]
+    parse: float
+    flatten_and_hash: float
+    sort: float
+    final_hash: float
+    total: float
+    elements: int
+    lists: int
+    max_depth: int
+    bytes_hashed: int
+
+
+_hooks: List[Callable[[CreateProfile], Any]] = []
+_context_hooks: contextvars.ContextVar = contextvars.ContextVar("json_fingerprint_profile_hooks", default=())
+
+
+def add_profile_hook(hook: Callable[[CreateProfile], Any]) -> None:
+    """Call a function with the `CreateProfile` of each fingerprint created from now on, in any thread.
+
+    Args:
+        hook (callable):
+            A function that takes a `CreateProfile`, e.g. to export the numbers to a metrics pipeline.
+    """
+    _hooks.append(hook)
+
+
+def remove_profile_hook(hook: Callable[[CreateProfile], Any]) -> None:
+    """Stop calling a function added with `add_profile_hook()`."""
+    _hooks.remove(hook)
+
+
+@contextlib.contextmanager
+def profile(hook: Optional[Callable[[CreateProfile], Any]] = None) -> Iterator[List[CreateProfile]]:
+    """Record a `CreateProfile` for each fingerprint created in the context.
+
+    The context is local to the current thread or asyncio task. Without active hooks or contexts, fingerprint creation
+    isn't instrumented at all.
+
+    Args:
+        hook (callable):
+            An optional function that is also called with each `CreateProfile`. None by default.
+
+    Returns:
+        list: A list that is filled with the `CreateProfile` of each fingerprint created in the context.
+    """
+    profiles = []
+    hooks = (profiles.append,) if hook is None else (profiles.append, hook)
+    token = _context_hooks.set(_context_hooks.get() + hooks)
+    try:
+        yield profiles
+    finally:
+        _context_hooks.reset(token)
+
+
+def _is_profiling() -> bool:
+    return bool(_hooks) or bool(_context_hooks.get())
+
+
+class _ByteCountingHash:
+    """A hash constructor that counts the bytes it's created and updated with.
+
+    It compares and hashes equal to the wrapped constructor, so subtree cache keys are unaffected.
+    """
+
+    __slots__ = ("constructor", "bytes_hashed")
+
+    def __init__(self, constructor: Callable):
+        self.constructor = constructor
+        self.bytes_hashed = 0
+
+    def __call__(self, data: bytes = b""):
+        self.bytes_hashed += len(data)
+        return _ByteCountingHashObject(hash=self.constructor(data), counter=self)
+
+    def __eq__(self, other) -> bool:
+        return self.constructor == getattr(other, "constructor", other)
+
+    def __hash__(self) -> int:
+        return hash(self.constructor)
+
+
+class _ByteCountingHashObject:
+    """A hash object that adds the bytes it's updated with to the count of its `_ByteCountingHash`."""
+
+    __slots__ = ("hash", "counter")
+
+    def __init__(self, hash, counter: _ByteCountingHash):
+        self.hash = hash
+        self.counter = counter
+
+    def update(self, data: bytes) -> None:
+        self.counter.bytes_hashed += len(data)
+        self.hash.update(data)
+
+    def digest(self) -> bytes:
+        return self.hash.digest()
+
+    def hexdigest(self) -> str:
+        return self.hash.hexdigest()
+
+
+def _measure_structure(data: Any) -> Tuple[int, int]:
+    """Count the non-empty lists, and measure the maximum nesting depth of dicts and lists."""
+    lists = 0
+    max_depth = 0
+    stack = [(data, 0)]
+    while stack:
+        value, depth = stack.pop()
+        value_type = type(value)
+        if value_type is not dict and value_type is not list:
+            continue
+        depth += 1
+        max_depth = max(max_depth, depth)
+        if not value:
+            continue
+        if value_type is list:
+            lists += 1
+            stack.extend([(item, depth) for item in value])
+        else:
+            stack.extend([(item, depth) for item in value.values()])
+    return lists, max_depth
+
+
+def _create_profiled(load: Callable[[], Any], input_size: Optional[int], hash_function: str, subtree_cache: Optional[SubtreeCache] = None) -> str:
+    """Create a jfpv1 fingerprint like `_create_jfpv1_fingerprint`, and report its `CreateProfile` to the active hooks."""
+    start = time.perf_counter()
+    data = load()
+    parsed = time.perf_counter()
+    hash_constructor = _ByteCountingHash(_HASH_CONSTRUCTORS[hash_function])
+    hashes = _hash_elements_with_constructors(data=data, hash_constructors=(hash_constructor,), subtree_cache=subtree_cache)[0]
+    hashed = time.perf_counter()
+    hashes.sort()
+    sorted_ = time.perf_counter()
+    hex_digest = _hash_digest_list(digests=hashes, hash_constructor=hash_constructor)
+    end = time.perf_counter()
+
+    lists, max_depth = _measure_structure(data=data)
+    record = CreateProfile(
+        hash_function=hash_function,
+        input_size=input_size,
+        parse=parsed - start,
+        flatten_and_hash=hashed - parsed,
+        sort=sorted_ - hashed,
+        final_hash=end - sorted_,
+        total=end - start,
+        elements=len(hashes),
+        lists=lists,
+        max_depth=max_depth,
+        bytes_hashed=hash_constructor.bytes_hashed,
+    )
+    for hook in (*_hooks, *_context_hooks.get()):
+        hook(record)
+    return f"jfpv1${hash_function}${hex_digest}"
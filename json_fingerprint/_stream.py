@@ -0,0 +1,475 @@
+import codecs
+import json
+import re
+import tempfile
+from array import array
+from json.decoder import scanstring
+from json.encoder import encode_basestring
+from json.scanner import NUMBER_RE
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from ._jfpv1 import (
+    _HASH_CONSTRUCTORS,
+    _encode_value,
+    _hash_digest_list,
+)
+from ._limits import Limits
+from .exceptions import JSONLoad
+
+START_MAP = "start_map"
+MAP_KEY = "map_key"
+END_MAP = "end_map"
+START_ARRAY = "start_array"
+END_ARRAY = "end_array"
+VALUE = "value"
+
+DEFAULT_CHUNK_SIZE = 65536
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_LOOKAHEAD = 16  # Enough characters to recognize any literal ("-Infinity") without refilling the buffer
+_LITERALS = (("null", None), ("true", True), ("false", False), ("NaN", float("nan")), ("Infinity", float("inf")), ("-Infinity", float("-inf")))
+
+# Parser states
+_EXPECT_VALUE = 0
+_EXPECT_VALUE_OR_END_ARRAY = 1
+_EXPECT_KEY = 2
+_EXPECT_KEY_OR_END_MAP = 3
+_EXPECT_COLON = 4
+_EXPECT_DELIMITER = 5
+
+
+def _load_error() -> JSONLoad:
+    err = "Unable to load JSON"
+    return JSONLoad(err)
+
+
+class _EventReader:
+    """Incremental JSON parser that reads a file-like object in chunks and produces parse events.
+
+    Accepts the same JSON documents as `json.loads`, and produces identical keys and values. Binary streams are decoded
+    like `json.loads` decodes bytes input.
+    """
+
+    def __init__(self, stream: IO, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = None
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _read_chunk(self) -> str:
+        chunk = self._stream.read(self._chunk_size)
+        if isinstance(chunk, str):
+            self._eof = not chunk
+            return chunk
+
+        if self._decoder is None:
+            while 0 < len(chunk) < 4:
+                more = self._stream.read(self._chunk_size)
+                if not more:
+                    break
+                chunk += more
+            encoding = json.detect_encoding(chunk[:4])
+            self._decoder = codecs.getincrementaldecoder(encoding)("surrogatepass")
+        self._eof = not chunk
+        try:
+            return self._decoder.decode(chunk, final=self._eof)
+        except UnicodeDecodeError:
+            raise _load_error() from None
+
+    def _fill(self, size: int) -> None:
+        """Read chunks until `size` characters are buffered from the current position, or the stream ends."""
+        pos = self._pos
+        chunks = [self._buffer[pos:]]
+        buffered = len(chunks[0])
+        while buffered < size and not self._eof:
+            chunk = self._read_chunk()
+            chunks.append(chunk)
+            buffered += len(chunk)
+        self._buffer = "".join(chunks)
+        self._pos = 0
+
+    def _next_char(self) -> str:
+        """Skip whitespace and return the next character, or an empty string at the end of the stream."""
+        while True:
+            if len(self._buffer) - self._pos < _LOOKAHEAD and not self._eof:
+                self._fill(max(self._chunk_size, _LOOKAHEAD))
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if self._eof:
+                return ""
+
+    def _read_string(self) -> str:
+        size = self._chunk_size
+        while True:
+            try:
+                value, self._pos = scanstring(self._buffer, self._pos + 1, True)
+                return value
+            except json.JSONDecodeError as exc:
+                # The string may continue in the next chunk, unless the error is clearly before the buffer's end
+                incomplete = exc.msg.startswith("Unterminated string") or exc.pos + 6 >= len(self._buffer)
+                if self._eof or not incomplete:
+                    raise _load_error() from None
+                self._fill(len(self._buffer) - self._pos + size)
+                size *= 2
+
+    def _read_number_or_literal(self) -> Any:
+        while True:
+            match = NUMBER_RE.match(self._buffer, self._pos)
+            if match is None or match.end() + 2 < len(self._buffer) or self._eof:
+                break
+            # The number may continue in the next chunk
+            self._fill(len(self._buffer) - self._pos + self._chunk_size)
+
+        if match is not None:
+            self._pos = match.end()
+            integer, frac, exp = match.groups()
+            try:
+                if frac or exp:
+                    return float(integer + (frac or "") + (exp or ""))
+                return int(integer)
+            except ValueError:
+                raise _load_error() from None
+
+        for literal, value in _LITERALS:
+            if self._buffer.startswith(literal, self._pos):
+                self._pos += len(literal)
+                return value
+        raise _load_error()
+
+    def events(self) -> Iterator[Tuple[str, Any]]:  # noqa: C901
+        """Iterate over (event, value) pairs, where value is the key of MAP_KEY events and the value of VALUE events."""
+        stack = []
+        state = _EXPECT_VALUE
+        while True:
+            char = self._next_char()
+
+            if state == _EXPECT_DELIMITER:
+                if not stack:
+                    if char:
+                        raise _load_error()
+                    return
+                self._pos += 1
+                if char == ",":
+                    state = _EXPECT_VALUE if stack[-1] == "[" else _EXPECT_KEY
+                elif char == "]" and stack[-1] == "[":
+                    stack.pop()
+                    yield END_ARRAY, None
+                elif char == "}" and stack[-1] == "{":
+                    stack.pop()
+                    yield END_MAP, None
+                else:
+                    raise _load_error()
+                continue
+
+            if state == _EXPECT_KEY or state == _EXPECT_KEY_OR_END_MAP:
+                if char == '"':
+                    yield MAP_KEY, self._read_string()
+                    state = _EXPECT_COLON
+                elif char == "}" and state == _EXPECT_KEY_OR_END_MAP:
+                    self._pos += 1
+                    stack.pop()
+                    yield END_MAP, None
+                    state = _EXPECT_DELIMITER
+                else:
+                    raise _load_error()
+                continue
+
+            if state == _EXPECT_COLON:
+                if char != ":":
+                    raise _load_error()
+                self._pos += 1
+                state = _EXPECT_VALUE
+                continue
+
+            # Expecting a value
+            if char == '"':
+                yield VALUE, self._read_string()
+                state = _EXPECT_DELIMITER
+            elif char == "{":
+                self._pos += 1
+                stack.append(char)
+                yield START_MAP, None
+                state = _EXPECT_KEY_OR_END_MAP
+            elif char == "[":
+                self._pos += 1
+                stack.append(char)
+                yield START_ARRAY, None
+                state = _EXPECT_VALUE_OR_END_ARRAY
+            elif char == "]" and state == _EXPECT_VALUE_OR_END_ARRAY:
+                self._pos += 1
+                stack.pop()
+                yield END_ARRAY, None
+                state = _EXPECT_DELIMITER
+            elif char:
+                yield VALUE, self._read_number_or_literal()
+                state = _EXPECT_DELIMITER
+            else:
+                raise _load_error()
+
+
+def _scan_array_lengths(events: Iterator[Tuple[str, Any]]) -> Tuple[array, Set[int]]:
+    """Validate the JSON stream and collect the lengths of all arrays in the order of their start events.
+
+    Like `json.loads`, the last value of a duplicate key is kept, which can't be known until the object ends. The
+    indices of the key events (in the order of all key events) whose values are overridden by a later duplicate key
+    are collected as well, so that the values can be skipped in the later passes (see `_skip_overridden_values`).
+    """
+    lengths = array("Q")
+    overridden = set()
+    key_index = -1
+    stack = []  # [array index, item count] for arrays, {key: key index} for objects
+    for event, value in events:
+        if event == MAP_KEY:
+            key_index += 1
+            keys = stack[-1]
+            previous = keys.get(value)
+            if previous is not None:
+                overridden.add(previous)
+            keys[value] = key_index
+            continue
+        if event == END_ARRAY:
+            index, count = stack.pop()
+            lengths[index] = count
+            continue
+        if event == END_MAP:
+            stack.pop()
+            continue
+
+        if stack and type(stack[-1]) is list:
+            stack[-1][1] += 1
+        if event == START_ARRAY:
+            stack.append([len(lengths), 0])
+            lengths.append(0)
+        elif event == START_MAP:
+            stack.append({})
+    return lengths, overridden
+
+
+def _skip_overridden_values(events: Iterator[Tuple[str, Any]], overridden: Set[int]) -> Iterator[Tuple[str, Any]]:
+    """Drop the keys and values that are overridden by a later duplicate key from the parse events."""
+    key_index = -1
+    skipping = False
+    depth = 0  # The nesting depth within a skipped value
+    for event, value in events:
+        if event == MAP_KEY:
+            key_index += 1
+            if not skipping and key_index in overridden:
+                skipping = True
+                continue
+        if skipping:
+            if event == START_MAP or event == START_ARRAY:
+                depth += 1
+            elif event == END_MAP or event == END_ARRAY:
+                depth -= 1
+            if depth == 0 and event != MAP_KEY:
+                skipping = False
+            continue
+        yield event, value
+
+
+def _build_data(events: Iterator[Tuple[str, Any]], limits: Optional[Limits] = None) -> Any:
+    """Build JSON data from parse events without recursion, for documents nested deeper than `json.loads` can parse.
+
+    Like `json.loads`, the last value of a duplicate key is kept at the position of the key's first occurrence. The
+    maximum depth of the limits is checked as soon as each object or array starts.
+    """
+    stack = []  # [container, current key] for each open object or array
+    data = None
+    for event, value in events:
+        if event == MAP_KEY:
+            stack[-1][1] = value
+            continue
+        if event == START_MAP or event == START_ARRAY:
+            stack.append([{} if event == START_MAP else [], None])
+            if limits is not None:
+                limits._check_depth(depth=len(stack))
+            continue
+        if event == END_MAP or event == END_ARRAY:
+            value = stack.pop()[0]
+
+        if not stack:
+            data = value
+        elif stack[-1][1] is None:
+            stack[-1][0].append(value)
+        else:
+            stack[-1][0][stack[-1][1]] = value
+    return data
+
+
+class _Frame:
+    """An open object or array while hashing the stream elements."""
+
+    __slots__ = ("is_list", "path", "child_path", "head", "list", "empty", "index", "start", "unbound", "pending")
+
+    def __init__(self, is_list: bool, path: str, list: Optional["_Frame"]):
+        self.is_list = is_list
+        self.path = path
+        self.child_path = None
+        self.head = None
+        self.list = list  # The closest enclosing non-empty list
+        self.empty = True
+        self.index = None
+        self.start = 0
+        self.unbound = None
+        self.pending = None
+
+
+def _hash_stream_elements(  # noqa: C901
+    events: Iterator[Tuple[str, Any]],
+    lengths: array,
+    hash_constructor: Callable,
+    hashes: List[bytes],
+    list_siblings: Dict[int, str],
+    final_pass: bool,
+) -> None:
+    """Hash the sibling-aware data elements of a JSON stream, in the first or in the final pass over the stream.
+
+    In the first pass, the sibling hashes of all lists are computed. Elements outside of lists, and elements of nested
+    lists, are complete when their closest enclosing list ends. Their hashes are appended to `hashes`, and the heads
+    and tails of nested lists' elements are kept only until the list ends. The elements of top-level lists (lists
+    without an enclosing list) would have to be kept until the document ends, so only the sibling hashes of top-level
+    lists are stored in `list_siblings`, and their elements are hashed in the final pass.
+    """
+    stack = []
+    list_index = 0
+    for event, value in events:
+        if event == MAP_KEY:
+            frame = stack[-1]
+            frame.child_path = f"{frame.path}|{{{value}}}" if frame.path else f"{{{value}}}"
+            frame.empty = False
+            continue
+
+        if event == END_MAP or event == END_ARRAY:
+            frame = stack.pop()
+            if frame.empty:
+                path, value, closest_list = frame.path, {} if event == END_MAP else [], frame.list
+            elif not frame.is_list or final_pass:
+                continue
+            else:
+                # Complete the list with its sibling hash
+                start = frame.start
+                sibling_hashes = hashes[start:]
+                sibling_hashes.extend(frame.unbound)
+                frame.unbound = None
+                sibling_hashes.sort()
+                siblings = _hash_digest_list(digests=sibling_hashes, hash_constructor=hash_constructor)
+                del sibling_hashes
+                if frame.pending is None:
+                    list_siblings[frame.index] = siblings
+                else:
+                    for element_head, element_tail in frame.pending:
+                        hashes.append(hash_constructor(f'{element_head},"siblings":"{siblings}",{element_tail}'.encode("utf-8")).digest())
+                continue
+        elif stack:
+            parent = stack[-1]
+            path = parent.child_path
+            closest_list = parent if parent.is_list else parent.list
+            if event == START_MAP:
+                stack.append(_Frame(is_list=False, path=path, list=closest_list))
+                continue
+            if event == START_ARRAY:
+                frame = _Frame(is_list=True, path=path, list=closest_list)
+                stack.append(frame)
+                list_index = _open_list(frame=frame, lengths=lengths, list_index=list_index, hashes=hashes)
+                continue
+        else:
+            path, closest_list = "", None
+            if event == START_MAP or event == START_ARRAY:
+                frame = _Frame(is_list=event == START_ARRAY, path=path, list=None)
+                stack.append(frame)
+                if frame.is_list:
+                    list_index = _open_list(frame=frame, lengths=lengths, list_index=list_index, hashes=hashes)
+                continue
+
+        # Process a value, which is a data element
+        if final_pass and (closest_list is None or closest_list.pending is not None):
+            continue
+        if closest_list is not None and path is closest_list.child_path:
+            element_head = closest_list.head
+        else:
+            element_head = '{"path":' + encode_basestring(path)
+        element_tail = '"value":' + _encode_value(value) + "}"
+
+        if final_pass:
+            siblings = list_siblings[closest_list.index]
+            hashes.append(hash_constructor(f'{element_head},"siblings":"{siblings}",{element_tail}'.encode("utf-8")).digest())
+        elif closest_list is None:
+            hashes.append(hash_constructor(f"{element_head},{element_tail}".encode("utf-8")).digest())
+        else:
+            closest_list.unbound.append(hash_constructor(f"{element_head},{element_tail}".encode("utf-8")).digest())
+            if closest_list.pending is not None:
+                closest_list.pending.append((element_head, element_tail))
+
+
+def _open_list(frame: _Frame, lengths: array, list_index: int, hashes: List[bytes]) -> int:
+    """Initialize a list frame from the collected array lengths, and return the index of the next list."""
+    length = lengths[list_index]
+    if length:
+        frame.empty = False
+        frame.index = list_index
+        frame.child_path = f"{frame.path}|[{length}]" if frame.path else f"[{length}]"
+        frame.head = '{"path":' + encode_basestring(frame.child_path)
+        frame.start = len(hashes)
+        frame.unbound = []
+        frame.pending = [] if frame.list is not None else None
+    return list_index + 1
+
+
+def _spool(stream: IO, chunk_size: int) -> IO:
+    """Copy a non-seekable stream into a temporary file."""
+    chunk = stream.read(chunk_size)
+    if isinstance(chunk, str):
+        spool = tempfile.TemporaryFile("w+", encoding="utf-8", errors="surrogatepass", newline="")
+    else:
+        spool = tempfile.TemporaryFile("w+b")
+    while chunk:
+        spool.write(chunk)
+        chunk = stream.read(chunk_size)
+    spool.seek(0)
+    return spool
+
+
+def _create_jfpv1_stream_fingerprint(stream: IO, hash_function: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """Create a jfpv1 fingerprint from a JSON stream without loading the JSON data into memory.
+
+    The array lengths are part of the paths of all elements in an array, so the stream is read in three passes: the
+    first one collects the array lengths, and the latter two hash the elements (see `_hash_stream_elements`). If any
+    object has duplicate keys, the array lengths are collected again without the overridden values, in a fourth pass.
+    Non-seekable streams are spooled into a temporary file first.
+    """
+    seekable = getattr(stream, "seekable", None)
+    if seekable is None or not seekable():
+        with _spool(stream=stream, chunk_size=chunk_size) as spool:
+            return _create_jfpv1_stream_fingerprint(stream=spool, hash_function=hash_function, chunk_size=chunk_size)
+
+    start = stream.tell()
+    lengths, overridden = _scan_array_lengths(events=_EventReader(stream=stream, chunk_size=chunk_size).events())
+    if overridden:
+        # Arrays in the overridden values of duplicate keys are skipped, so their lengths are collected again
+        stream.seek(start)
+        events = _skip_overridden_values(events=_EventReader(stream=stream, chunk_size=chunk_size).events(), overridden=overridden)
+        lengths, _ = _scan_array_lengths(events=events)
+
+    hash_constructor = _HASH_CONSTRUCTORS[hash_function]
+    hashes = []
+    list_siblings = {}
+    for final_pass in (False, True):
+        stream.seek(start)
+        events = _EventReader(stream=stream, chunk_size=chunk_size).events()
+        if overridden:
+            events = _skip_overridden_values(events=events, overridden=overridden)
+        _hash_stream_elements(
+            events=events,
+            lengths=lengths,
+            hash_constructor=hash_constructor,
+            hashes=hashes,
+            list_siblings=list_siblings,
+            final_pass=final_pass,
+        )
+
+    hashes.sort()
+    hex_digest = _hash_digest_list(digests=hashes, hash_constructor=hash_constructor)
+    return f"jfpv1${hash_function}${hex_digest}"
@@ -0,0 +1,60 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+DEFAULT_SUBTREE_CACHE_MAXSIZE = 4096
+
+
+class SubtreeCache:
+    """A bounded cache of hashed list subtrees, for JSON data with repeated sub-structures.
+
+    When a cache is passed to `create()` (or to the other fingerprint creation functions), the element hashes of each
+    list are stored under a key derived from the list's canonical elements, which include the list's path. An identical
+    list at the same path, in the same or in a later JSON document, reuses the stored element hashes instead of hashing
+    its elements again. Identical elements within a list are also hashed only once. Fingerprints are identical with and
+    without a cache.
+
+    The least recently used subtrees are evicted when the cache is full. A cache can be shared by multiple threads.
+
+    Args:
+        maxsize (int):
+            The maximum number of cached list subtrees. 4096 by default.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_SUBTREE_CACHE_MAXSIZE):
+        if maxsize < 1:
+            raise ValueError(f"Expected a positive maxsize, instead got '{maxsize}'")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached subtree, or None if the subtree isn't cached."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Cache a subtree, and evict the least recently used subtree if the cache is full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached subtrees and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
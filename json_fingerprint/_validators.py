@@ -1,7 +1,8 @@
+import mmap
 import re
+from typing import Any, Dict
 
-from json_fingerprint import hash_functions
-
+from ._hash_registry import DIGEST_SIZES, HASH_CONSTRUCTORS, _add_register_hook
 from .exceptions import (
     FingerprintPattern,
     FingerprintVersion,
@@ -9,22 +10,32 @@ from .exceptions import (
     InputDataType,
 )
 
-SHA256_JFP_REGEX_PATTERN = re.compile("^jfpv1\\$sha256\\$[0-9a-f]{64}$")
-SHA384_JFP_REGEX_PATTERN = re.compile("^jfpv1\\$sha384\\$[0-9a-f]{96}$")
-SHA512_JFP_REGEX_PATTERN = re.compile("^jfpv1\\$sha512\\$[0-9a-f]{128}$")
+# Fingerprint patterns by hash function name, e.g. "^jfpv1\\$sha256\\$[0-9a-f]{64}$" for sha256
+JFPV1_REGEX_PATTERNS: Dict[str, re.Pattern] = {}
+
+
+def _add_regex_pattern(hash_function: str) -> None:
+    JFPV1_REGEX_PATTERNS[hash_function] = re.compile(f"^jfpv1\\${hash_function}\\$[0-9a-f]{{{2 * DIGEST_SIZES[hash_function]}}}$")
+
+
+def _remove_regex_pattern(hash_function: str) -> None:
+    del JFPV1_REGEX_PATTERNS[hash_function]
 
-JFPV1_HASH_FUNCTIONS = (
-    hash_functions.SHA256,
-    hash_functions.SHA384,
-    hash_functions.SHA512,
-)
+
+_add_register_hook(_add_regex_pattern, _remove_regex_pattern)
 
 JSON_FINGERPRINT_VERSIONS = (1,)
 
+BYTES_INPUT_TYPES = (bytes, bytearray, memoryview, mmap.mmap)
+
+OBJECT_VALUE_TYPES = (str, int, float, bool, type(None))
+
+_INFINITY = float("inf")
+
 
 def _validate_hash_function(hash_function: str, version: int):
-    if version == 1 and hash_function not in JFPV1_HASH_FUNCTIONS:
-        err = f"Expected one of supported hash functions '{JFPV1_HASH_FUNCTIONS}', instead got '{hash_function}'"
+    if version == 1 and hash_function not in HASH_CONSTRUCTORS:
+        err = f"Expected one of supported hash functions '{tuple(HASH_CONSTRUCTORS)}', instead got '{hash_function}'"
         raise HashFunction(err)
 
 
@@ -34,6 +45,57 @@ def _validate_input_type(input: str):
         raise InputDataType(err)
 
 
+def _validate_bytes_input_type(input: bytes):
+    if not isinstance(input, BYTES_INPUT_TYPES):
+        err = f"Expected one of data types '{BYTES_INPUT_TYPES}' (JSON in bytes-like format), instead got '{type(input)}'"
+        raise InputDataType(err)
+
+
+def _validate_object(input: Any):
+    """Validate that a Python object consists of the types that `json.loads` produces, like `json.dumps` with strict options.
+
+    Containers must be of exact types dict and list, and dict keys must be strings. Out of range floats (NaN and
+    infinity) are rejected like `json.dumps(allow_nan=False)` rejects them. The object is traversed with an explicit
+    stack, so the nesting depth isn't bound by the recursion limit.
+    """
+    markers = set()  # The ids of the containers enclosing the current value
+    stack = [(input, False)]
+    while stack:
+        value, closing = stack.pop()
+        if closing:
+            markers.remove(id(value))
+            continue
+
+        value_type = type(value)
+        if value_type is dict or value_type is list:
+            marker = id(value)
+            if marker in markers:
+                raise ValueError("Circular reference detected")
+            markers.add(marker)
+            stack.append((value, True))
+            if value_type is dict:
+                for key in value:
+                    if type(key) is not str:
+                        err = f"Expected object keys of data type '{str}', instead got '{type(key)}'"
+                        raise InputDataType(err)
+                stack.extend([(item, False) for item in value.values()])
+            else:
+                stack.extend([(item, False) for item in value])
+            continue
+
+        if value_type not in OBJECT_VALUE_TYPES:
+            err = f"Expected one of data types '{(dict, list, *OBJECT_VALUE_TYPES)}' (JSON-compatible object), instead got '{value_type}'"
+            raise InputDataType(err)
+        if value_type is float and (value != value or value == _INFINITY or value == -_INFINITY):
+            raise ValueError(f"Out of range float values are not JSON compliant: {value!r}")
+
+
+def _validate_fingerprint_bytes_type(input: bytes):
+    if not isinstance(input, BYTES_INPUT_TYPES):
+        err = f"Expected one of data types '{BYTES_INPUT_TYPES}' (JSON fingerprint in binary format), instead got '{type(input)}'"
+        raise InputDataType(err)
+
+
 def _validate_version(version: int):
     if version not in JSON_FINGERPRINT_VERSIONS:
         err = f"Expected one of supported JSON fingerprint versions '{JSON_FINGERPRINT_VERSIONS}', instead got '{version}'"
@@ -43,7 +105,7 @@ def _validate_version(version: int):
 def _validate_fingerprint_format(fingerprint: str):
     is_valid = False
 
-    if SHA256_JFP_REGEX_PATTERN.match(fingerprint) or SHA384_JFP_REGEX_PATTERN.match(fingerprint) or SHA512_JFP_REGEX_PATTERN.match(fingerprint):
+    if any(pattern.match(fingerprint) for pattern in JFPV1_REGEX_PATTERNS.values()):
         is_valid = True
 
     if not is_valid:
@@ -0,0 +1,226 @@
+"""Asyncio API for creating and matching JSON fingerprints without blocking the event loop."""
+
+import asyncio
+import os
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ._create import create as _create
+from ._find_matches import find_matches as _find_matches
+from ._match import match as _match
+
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_QUEUE_SIZE = 1024
+
+_Call = Tuple[Callable, Dict[str, Any]]
+
+_default_dispatchers: Dict[asyncio.AbstractEventLoop, "Dispatcher"] = {}
+
+
+def _run_batch(calls: List[_Call]) -> List[Tuple[bool, Any]]:
+    """Run a batch of calls in an executor, and collect (success, result or exception) pairs."""
+    results = []
+    for function, kwargs in calls:
+        try:
+            results.append((True, function(**kwargs)))
+        except Exception as exc:
+            results.append((False, exc))
+    return results
+
+
+class Dispatcher:
+    """Dispatches fingerprint requests from an event loop to an executor in batches.
+
+    Requests are put into a bounded queue, and each coroutine waits for room in the queue when it's full, which applies
+    back-pressure to the callers. The queued requests are collected into batches of up to `max_batch_size` requests,
+    and each batch is run in the executor as a single job, which amortizes the dispatch overhead of small requests. At
+    most `max_pending_batches` batches run at a time, and requests accumulate into larger batches meanwhile.
+
+    A dispatcher is bound to the event loop where it's first used. It can be closed with `aclose()`, or used as an
+    asynchronous context manager.
+
+    Args:
+        executor (concurrent.futures.Executor):
+            A thread or process pool executor. Defaults to the event loop's default executor (a thread pool).
+        max_batch_size (int):
+            The maximum number of requests run in the executor as a single job. 64 by default.
+        max_queue_size (int):
+            The maximum number of queued requests before callers have to wait. 1024 by default.
+        max_pending_batches (int):
+            The maximum number of batches running in the executor at a time. Defaults to the number of CPUs.
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        max_pending_batches: Optional[int] = None,
+    ):
+        if max_batch_size < 1:
+            raise ValueError(f"Expected a positive max_batch_size, instead got '{max_batch_size}'")
+        if max_queue_size < 1:
+            raise ValueError(f"Expected a positive max_queue_size, instead got '{max_queue_size}'")
+        if max_pending_batches is not None and max_pending_batches < 1:
+            raise ValueError(f"Expected a positive max_pending_batches, instead got '{max_pending_batches}'")
+        self.max_batch_size = max_batch_size
+        self.max_queue_size = max_queue_size
+        self.max_pending_batches = max_pending_batches or os.cpu_count() or 1
+        self._executor = executor
+        self._loop = None
+        self._queue = None
+        self._pending_batches = None
+        self._worker = None
+        self._batches = set()
+
+    def _start(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._pending_batches = asyncio.Semaphore(self.max_pending_batches)
+            self._worker = loop.create_task(self._dispatch())
+        elif self._loop is not loop:
+            raise RuntimeError("Expected the dispatcher to be used in a single event loop")
+
+    async def _submit(self, function: Callable, **kwargs) -> Any:
+        self._start()
+        future = self._loop.create_future()
+        await self._queue.put((function, kwargs, future))
+        return await future
+
+    async def _dispatch(self) -> None:
+        """Collect queued requests into batches, and run them in the executor."""
+        queue = self._queue
+        while True:
+            # Requests accumulate in the queue while the maximum number of batches is running
+            await self._pending_batches.acquire()
+            batch = [await queue.get()]
+            while len(batch) < self.max_batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            task = self._loop.create_task(self._run(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run(self, batch: List[Tuple[Callable, Dict[str, Any], asyncio.Future]]) -> None:
+        try:
+            calls = [(function, kwargs) for function, kwargs, _ in batch]
+            try:
+                results = await self._loop.run_in_executor(self._executor, _run_batch, calls)
+            except Exception as exc:
+                # The whole batch failed, e.g. due to a broken process pool or an unpicklable result
+                results = [(False, exc)] * len(batch)
+            for (_, _, future), (success, result) in zip(batch, results):
+                if future.done():
+                    continue  # The caller was cancelled
+                if success:
+                    future.set_result(result)
+                else:
+                    future.set_exception(result)
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+            self._pending_batches.release()
+
+    async def create(self, input: str, hash_function: str, version: int) -> str:
+        """Create a JSON fingerprint in the executor. See `json_fingerprint.create()`."""
+        return await self._submit(_create, input=input, hash_function=hash_function, version=version)
+
+    async def match(self, input: str, target_fingerprint: str) -> bool:
+        """Match raw JSON string input to a target fingerprint in the executor. See `json_fingerprint.match()`."""
+        return await self._submit(_match, input=input, target_fingerprint=target_fingerprint)
+
+    async def find_matches(self, input: str, fingerprints: List[str], deduplicate: bool = False) -> List[str]:
+        """Match raw JSON string input to a list of fingerprints in the executor. See `json_fingerprint.find_matches()`."""
+        return await self._submit(_find_matches, input=input, fingerprints=fingerprints, deduplicate=deduplicate)
+
+    async def aclose(self) -> None:
+        """Wait for the queued requests to complete, and stop dispatching."""
+        if self._worker is None:
+            return
+        await self._queue.join()
+        self._worker.cancel()
+        await asyncio.gather(self._worker, return_exceptions=True)
+        self._loop = None
+        self._queue = None
+        self._pending_batches = None
+        self._worker = None
+
+    async def __aenter__(self) -> "Dispatcher":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+
+def _get_dispatcher(dispatcher: Optional[Dispatcher]) -> Dispatcher:
+    """Get the given dispatcher, or the default dispatcher of the running event loop."""
+    if dispatcher is not None:
+        return dispatcher
+    loop = asyncio.get_running_loop()
+    dispatcher = _default_dispatchers.get(loop)
+    if dispatcher is None:
+        # Drop the default dispatchers of closed event loops, e.g. from earlier asyncio.run() calls
+        for closed_loop in [other_loop for other_loop in _default_dispatchers if other_loop.is_closed()]:
+            del _default_dispatchers[closed_loop]
+        dispatcher = _default_dispatchers[loop] = Dispatcher()
+    return dispatcher
+
+
+async def create(input: str, hash_function: str, version: int, dispatcher: Optional[Dispatcher] = None) -> str:
+    """Create JSON fingerprints without blocking the event loop.
+
+    Args:
+        input (str):
+            JSON input in string format.
+        hash_function (str):
+            One of the supported hash function names in string format (options: "sha256", "sha384", "sha512",
+            "blake2b", "blake2s", or a registered hash function).
+        version (int):
+            An integer indicating the JSON fingerprint algorithm version to be used (options: 1).
+        dispatcher (Dispatcher):
+            The dispatcher that runs the request. Defaults to a shared dispatcher of the running event loop, which uses
+            the event loop's default executor.
+
+    Returns:
+        str: A pre-formatted JSON fingerprint (example: "jfpv1${hash_function_name}${hash_hex_digest}").
+    """
+    return await _get_dispatcher(dispatcher).create(input=input, hash_function=hash_function, version=version)
+
+
+async def match(input: str, target_fingerprint: str, dispatcher: Optional[Dispatcher] = None) -> bool:
+    """Match raw json string input to target fingerprint without blocking the event loop.
+
+    Args:
+        input (str):
+            JSON input in string format.
+        target_fingerprint (str):
+            Target JSON fingerprint in string format.
+        dispatcher (Dispatcher):
+            The dispatcher that runs the request. Defaults to a shared dispatcher of the running event loop, which uses
+            the event loop's default executor.
+
+    Returns:
+        bool: True if the input JSON data matches with the target fingerprint, otherwise False.
+    """
+    return await _get_dispatcher(dispatcher).match(input=input, target_fingerprint=target_fingerprint)
+
+
+async def find_matches(input: str, fingerprints: List[str], deduplicate: bool = False, dispatcher: Optional[Dispatcher] = None) -> List[str]:
+    """Match raw json string input to a list of fingerprints without blocking the event loop.
+
+    Args:
+        input (str):
+            JSON input in string format.
+        fingerprints (list of strings):
+            A list of JSON fingerprints in string format.
+        deduplicate (bool):
+            If True, then deduplicate the fingerprint list before processing matches. False by default.
+        dispatcher (Dispatcher):
+            The dispatcher that runs the request. Defaults to a shared dispatcher of the running event loop, which uses
+            the event loop's default executor.
+
+    Returns:
+        list: A list of JSON fingerprint matches in string format.
+    """
+    return await _get_dispatcher(dispatcher).find_matches(input=input, fingerprints=fingerprints, deduplicate=deduplicate)
@@ -0,0 +1,7 @@
+"""Benchmark suite and regression harness for the jfpv1 engine.
+
+Run with `python -m json_fingerprint.benchmarks --help` for the command-line options.
+"""
+
+from ._payloads import SCENARIOS, generate_input, generate_payload
+from ._runner import PHASES, compare, run_benchmarks, run_scenario, select_scenarios
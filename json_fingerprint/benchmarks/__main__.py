@@ -0,0 +1,85 @@
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from .._hash_registry import available_hash_functions
+from .._json_backends import available_json_backends
+from ._payloads import SCENARIOS
+from ._runner import (
+    DEFAULT_NUMBER,
+    DEFAULT_REPEAT,
+    DEFAULT_TOLERANCE,
+    compare,
+    run_benchmarks,
+    select_scenarios,
+)
+
+_GENERATOR_OPTIONS = ("depth", "fan_out", "string_size", "key_count")
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m json_fingerprint.benchmarks",
+        description="Benchmark the jfpv1 engine with synthetic JSON payloads, and report the results as JSON.",
+    )
+    parser.add_argument("--scenario", action="append", choices=tuple(SCENARIOS), help="A standard scenario to run (repeatable, default: all).")
+    parser.add_argument("--depth", type=int, help="Run a custom scenario with this number of levels of nested arrays.")
+    parser.add_argument("--fan-out", type=int, help="Run a custom scenario with this number of items in each array.")
+    parser.add_argument("--string-size", type=int, help="Run a custom scenario with this number of characters in each string.")
+    parser.add_argument("--key-count", type=int, help="Run a custom scenario with this number of keys in each object.")
+    parser.add_argument(
+        "--hash-function",
+        action="append",
+        choices=available_hash_functions(),
+        help="A hash function to compare (repeatable, default: sha256).",
+    )
+    parser.add_argument(
+        "--json-backend",
+        action="append",
+        choices=available_json_backends(),
+        help="A JSON parser backend to compare (repeatable, default: the default backend).",
+    )
+    parser.add_argument("--number", type=int, default=DEFAULT_NUMBER, help=f"Fingerprints per measurement (default: {DEFAULT_NUMBER}).")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help=f"Measurements per scenario (default: {DEFAULT_REPEAT}).")
+    parser.add_argument("--output", help="Write the results into this file instead of the standard output.")
+    parser.add_argument("--baseline", help="Compare the results to baseline results saved with --output, and fail on regressions.")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help=f"The allowed relative regression (default: {DEFAULT_TOLERANCE}).")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmarks, and return the exit status: 0 on success, 1 on regressions."""
+    args = _parse_args(argv)
+    scenarios = select_scenarios(args.scenario) if args.scenario else {}
+    custom = {option: getattr(args, option) for option in _GENERATOR_OPTIONS if getattr(args, option) is not None}
+    if custom:
+        scenarios["custom"] = dict(SCENARIOS["flat"], **custom)
+    results = run_benchmarks(
+        scenarios=scenarios or None,
+        number=args.number,
+        repeat=args.repeat,
+        json_backends=args.json_backend,
+        hash_functions=args.hash_function,
+    )
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = compare(results=results, baseline=baseline, tolerance=args.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+import json
+import random
+import string
+from typing import Any, Dict
+
+# Standard benchmark scenarios by name: payload generator options
+SCENARIOS: Dict[str, Dict[str, int]] = {
+    "flat": {"depth": 1, "fan_out": 64, "string_size": 8, "key_count": 4},
+    "nested": {"depth": 7, "fan_out": 2, "string_size": 8, "key_count": 3},
+    "records": {"depth": 2, "fan_out": 50, "string_size": 32, "key_count": 8},
+    "text": {"depth": 1, "fan_out": 32, "string_size": 8192, "key_count": 2},
+    "wide": {"depth": 2, "fan_out": 4, "string_size": 16, "key_count": 256},
+}
+
+_ALPHABET = string.ascii_letters + string.digits + " äöå€"
+
+
+def _leaf(rng: random.Random, index: int, string_size: int) -> Any:
+    """Generate a primitive value, cycling through the JSON value types."""
+    kind = index % 5
+    if kind == 0:
+        return "".join(rng.choices(_ALPHABET, k=string_size))
+    if kind == 1:
+        return rng.randint(-(10**9), 10**9)
+    if kind == 2:
+        return rng.uniform(-1e6, 1e6)
+    if kind == 3:
+        return rng.random() < 0.5
+    return None
+
+
+def _node(rng: random.Random, depth: int, fan_out: int, string_size: int, key_count: int) -> Any:
+    if depth == 0:
+        return _leaf(rng=rng, index=0, string_size=string_size)
+    node = {}
+    for index in range(key_count):
+        if index == 0:
+            node[f"key_{index}"] = [_node(rng, depth - 1, fan_out, string_size, key_count) for _ in range(fan_out)]
+        else:
+            node[f"key_{index}"] = _leaf(rng=rng, index=index, string_size=string_size)
+    return node
+
+
+def generate_payload(depth: int, fan_out: int, string_size: int, key_count: int, seed: int = 0) -> Any:
+    """Generate a deterministic synthetic JSON payload.
+
+    Each object has `key_count` keys. The first key holds an array of `fan_out` nested objects (or strings at the
+    deepest level), and the other keys hold strings of `string_size` characters, integers, floats, booleans and nulls
+    in turn. The payload has `depth` levels of nested arrays.
+
+    Args:
+        depth (int):
+            The number of levels of nested arrays.
+        fan_out (int):
+            The number of items in each array.
+        string_size (int):
+            The number of characters in each string value.
+        key_count (int):
+            The number of keys in each object.
+        seed (int):
+            The seed of the random values. 0 by default.
+
+    Returns:
+        dict or str: The JSON payload as a Python object.
+    """
+    for name, value in (("depth", depth), ("fan_out", fan_out), ("string_size", string_size), ("key_count", key_count)):
+        if value < (0 if name in ("depth", "string_size") else 1):
+            raise ValueError(f"Expected a valid {name}, instead got '{value}'")
+    rng = random.Random(seed)
+    return _node(rng=rng, depth=depth, fan_out=fan_out, string_size=string_size, key_count=key_count)
+
+
+def generate_input(depth: int, fan_out: int, string_size: int, key_count: int, seed: int = 0) -> str:
+    """Generate a deterministic synthetic JSON payload in string format. See `generate_payload()`."""
+    return json.dumps(generate_payload(depth=depth, fan_out=fan_out, string_size=string_size, key_count=key_count, seed=seed))
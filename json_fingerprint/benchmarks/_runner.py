@@ -0,0 +1,212 @@
+import platform
+import time
+import tracemalloc
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from .._create import create
+from .._jfpv1 import _HASH_CONSTRUCTORS, _hash_digest_list, _hash_elements
+from .._json_backends import _using_json_backend, get_json_backend
+from .._load_json import _load_json
+from .._validators import _validate_hash_function
+from ._payloads import SCENARIOS, generate_input
+
+PHASES = ("parse", "flatten_and_hash", "sort", "final_hash")
+
+DEFAULT_NUMBER = 10
+DEFAULT_REPEAT = 5
+DEFAULT_TOLERANCE = 0.2
+
+
+def _measure_phases(input: str, hash_function: str, number: int, repeat: int) -> Dict[str, float]:
+    """Measure the best average duration of each phase of a jfpv1 fingerprint, in seconds.
+
+    The data elements are flattened and hashed in a single pass, so flattening and element hashing are one phase.
+    """
+    hash_constructor = _HASH_CONSTRUCTORS[hash_function]
+    best = dict.fromkeys(PHASES, float("inf"))
+    for _ in range(repeat):
+        totals = dict.fromkeys(PHASES, 0.0)
+        for _ in range(number):
+            start = time.perf_counter()
+            data = _load_json(data=input)
+            parsed = time.perf_counter()
+            hashes = _hash_elements(data=data, hash_function=hash_function)
+            hashed = time.perf_counter()
+            hashes.sort()
+            sorted_ = time.perf_counter()
+            _hash_digest_list(digests=hashes, hash_constructor=hash_constructor)
+            end = time.perf_counter()
+            totals["parse"] += parsed - start
+            totals["flatten_and_hash"] += hashed - parsed
+            totals["sort"] += sorted_ - hashed
+            totals["final_hash"] += end - sorted_
+        for phase, total in totals.items():
+            best[phase] = min(best[phase], total / number)
+    return best
+
+
+def _measure_ops_per_sec(input: str, hash_function: str, number: int, repeat: int) -> float:
+    """Measure the best throughput of `create()` in fingerprints per second."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            create(input=input, hash_function=hash_function, version=1)
+        best = min(best, time.perf_counter() - start)
+    return number / best if best else float("inf")
+
+
+def _measure_peak_memory(input: str, hash_function: str) -> int:
+    """Measure the peak memory allocated by `create()` in bytes, excluding the input."""
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        # Clearing the traces also resets the peak
+        tracemalloc.clear_traces()
+        create(input=input, hash_function=hash_function, version=1)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    return peak
+
+
+def run_scenario(
+    options: Dict[str, int],
+    hash_function: str = "sha256",
+    number: int = DEFAULT_NUMBER,
+    repeat: int = DEFAULT_REPEAT,
+    json_backend: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Benchmark `create()` with a synthetic payload.
+
+    Args:
+        options (dict):
+            Payload generator options: depth, fan_out, string_size and key_count (see `generate_payload()`).
+        hash_function (str):
+            One of the supported hash function names in string format (options: "sha256", "sha384", "sha512",
+            "blake2b", "blake2s", or a registered hash function).
+        number (int):
+            The number of fingerprints created per measurement. 10 by default.
+        repeat (int):
+            The number of measurements, of which the best one is reported. 5 by default.
+        json_backend (str):
+            The JSON parser backend (see `set_json_backend()`). Defaults to the backend in use.
+
+    Returns:
+        dict: The payload options and size, the JSON parser backend and the hash function, the number of data elements,
+        the per-phase durations in seconds, the throughput in fingerprints per second, and the peak memory usage in
+        bytes.
+    """
+    _validate_hash_function(hash_function=hash_function, version=1)
+    if number < 1 or repeat < 1:
+        raise ValueError(f"Expected a positive number and repeat, instead got '{number}' and '{repeat}'")
+    json_backend = json_backend or get_json_backend()
+    input = generate_input(**options)
+    with _using_json_backend(name=json_backend):
+        return {
+            "options": dict(options),
+            "payload_bytes": len(input.encode("utf-8")),
+            "json_backend": json_backend,
+            "hash_function": hash_function,
+            "elements": len(_hash_elements(data=_load_json(data=input), hash_function=hash_function)),
+            "phases": _measure_phases(input=input, hash_function=hash_function, number=number, repeat=repeat),
+            "ops_per_sec": _measure_ops_per_sec(input=input, hash_function=hash_function, number=number, repeat=repeat),
+            "peak_memory_bytes": _measure_peak_memory(input=input, hash_function=hash_function),
+        }
+
+
+def run_benchmarks(
+    scenarios: Optional[Dict[str, Dict[str, int]]] = None,
+    hash_function: str = "sha256",
+    number: int = DEFAULT_NUMBER,
+    repeat: int = DEFAULT_REPEAT,
+    json_backends: Optional[Sequence[str]] = None,
+    hash_functions: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    """Benchmark `create()` with a set of synthetic payloads.
+
+    Args:
+        scenarios (dict):
+            Payload generator options by scenario name. Defaults to the standard scenarios.
+        hash_function (str):
+            One of the supported hash function names in string format (options: "sha256", "sha384", "sha512",
+            "blake2b", "blake2s", or a registered hash function).
+        number (int):
+            The number of fingerprints created per measurement. 10 by default.
+        repeat (int):
+            The number of measurements, of which the best one is reported. 5 by default.
+        json_backends (list):
+            JSON parser backends to compare (see `set_json_backend()`). Defaults to the backend in use.
+        hash_functions (list):
+            Hash functions to compare. Defaults to `hash_function`.
+
+    Returns:
+        dict: The environment and the benchmark settings, and the results of `run_scenario()` by scenario name. With
+        multiple JSON parser backends or hash functions, the results are named "{scenario}/{backend}/{hash function}",
+        leaving out the settings with a single option.
+    """
+    scenarios = SCENARIOS if scenarios is None else scenarios
+    json_backends = list(json_backends or [get_json_backend()])
+    hash_functions = list(hash_functions or [hash_function])
+    results = {}
+    for name, options in scenarios.items():
+        for json_backend in json_backends:
+            for hash_function in hash_functions:
+                key = name
+                if len(json_backends) > 1:
+                    key += f"/{json_backend}"
+                if len(hash_functions) > 1:
+                    key += f"/{hash_function}"
+                results[key] = run_scenario(options=options, hash_function=hash_function, number=number, repeat=repeat, json_backend=json_backend)
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "hash_functions": hash_functions,
+        "json_backends": json_backends,
+        "number": number,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = DEFAULT_TOLERANCE) -> List[str]:
+    """Compare benchmark results to a saved baseline, and describe the regressions.
+
+    A scenario regresses if its throughput is lower, or its peak memory usage higher, than the baseline's by more
+    than the relative `tolerance`. Scenarios that are missing from either results are skipped.
+
+    Args:
+        results (dict):
+            Benchmark results, as returned by `run_benchmarks()`.
+        baseline (dict):
+            Baseline benchmark results, as returned by `run_benchmarks()`.
+        tolerance (float):
+            The allowed relative change. 0.2 (20%) by default.
+
+    Returns:
+        list: Descriptions of the regressions, which is empty if nothing regressed.
+    """
+    regressions = []
+    baseline_results = baseline.get("results", {})
+    for name, result in results.get("results", {}).items():
+        base = baseline_results.get(name)
+        if base is None:
+            continue
+        if result["ops_per_sec"] < base["ops_per_sec"] * (1 - tolerance):
+            regressions.append(f"{name}: throughput {result['ops_per_sec']:.1f} ops/sec, baseline {base['ops_per_sec']:.1f} ops/sec")
+        if result["peak_memory_bytes"] > base["peak_memory_bytes"] * (1 + tolerance):
+            regressions.append(f"{name}: peak memory {result['peak_memory_bytes']} bytes, baseline {base['peak_memory_bytes']} bytes")
+    return regressions
+
+
+def select_scenarios(names: Iterable[str]) -> Dict[str, Dict[str, int]]:
+    """Select standard benchmark scenarios by name."""
+    scenarios = {}
+    for name in names:
+        if name not in SCENARIOS:
+            raise ValueError(f"Expected one of benchmark scenarios '{tuple(SCENARIOS)}', instead got '{name}'")
+        scenarios[name] = SCENARIOS[name]
+    return scenarios
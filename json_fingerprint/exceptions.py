@@ -26,3 +26,15 @@ class JSONLoad(Exception):
     """The input data is not valid JSON."""
 
     pass
+
+
+class JSONPatch(Exception):
+    """The JSON patch operation can't be applied to the JSON data."""
+
+    pass
+
+
+class LimitExceeded(Exception):
+    """The input data exceeds a configured limit."""
+
+    pass
@@ -1,5 +1,11 @@
-"""Supported hash function choices."""
+"""Supported hash function choices.
+
+SHA-2 hash functions are the default choice. BLAKE2 hash functions are faster with small data elements on most CPUs,
+and more hash functions can be registered with `register_hash_function()`.
+"""
 
 SHA256 = "sha256"
 SHA384 = "sha384"
 SHA512 = "sha512"
+BLAKE2B = "blake2b"
+BLAKE2S = "blake2s"
@@ -1,11 +1,24 @@
 import unittest
 
+from json_fingerprint.tests.test_aio import TestAio
+from json_fingerprint.tests.test_batch import TestBatch
+from json_fingerprint.tests.test_benchmarks import TestBenchmarks
+from json_fingerprint.tests.test_binary import TestBinary
 from json_fingerprint.tests.test_create import TestCreate
 from json_fingerprint.tests.test_decode import TestDecode
+from json_fingerprint.tests.test_dedup import TestDeduplicator
 from json_fingerprint.tests.test_find_matches import TestFindMatches
 from json_fingerprint.tests.test_hash_functions import TestHashFunctions
+from json_fingerprint.tests.test_incremental import TestIncremental
+from json_fingerprint.tests.test_index import TestIndex
 from json_fingerprint.tests.test_jfpv1 import TestJfpv1
+from json_fingerprint.tests.test_json_backends import TestJsonBackends
+from json_fingerprint.tests.test_limits import TestLimits
 from json_fingerprint.tests.test_match import TestMatch
+from json_fingerprint.tests.test_ndjson import TestNdjson
+from json_fingerprint.tests.test_parallel import TestParallel
+from json_fingerprint.tests.test_profile import TestProfile
+from json_fingerprint.tests.test_stream import TestStream
 from json_fingerprint.tests.test_validators import TestValidators
 
 if __name__ == "__main__":
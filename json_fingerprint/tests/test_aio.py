@@ -0,0 +1,85 @@
+import asyncio
+import json
+import random
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+from json_fingerprint import aio, create, exceptions, find_matches, hash_functions
+from json_fingerprint.tests.utils import random_json
+
+
+class TestAio(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        rng = random.Random(5)
+        self.inputs = [json.dumps(random_json(rng)) for _ in range(50)]
+        self.expected = [create(input=input, hash_function=hash_functions.SHA256, version=1) for input in self.inputs]
+
+    async def test_aio_create(self):
+        """Test asynchronous fingerprint creation.
+
+        Verify that:
+        - Fingerprints are identical to create(), with the default dispatcher and with small batches and queues
+        """
+        fingerprints = await asyncio.gather(*(aio.create(input=input, hash_function=hash_functions.SHA256, version=1) for input in self.inputs))
+        self.assertEqual(fingerprints, self.expected)
+
+        async with aio.Dispatcher(max_batch_size=4, max_queue_size=2, max_pending_batches=1) as dispatcher:
+            fingerprints = await asyncio.gather(
+                *(aio.create(input=input, hash_function=hash_functions.SHA256, version=1, dispatcher=dispatcher) for input in self.inputs)
+            )
+        self.assertEqual(fingerprints, self.expected)
+
+    async def test_aio_process_executor(self):
+        """Test asynchronous fingerprint creation and matching in a process pool.
+
+        Verify that:
+        - Fingerprints and matches are identical to the synchronous functions
+        """
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            async with aio.Dispatcher(executor=executor, max_batch_size=8) as dispatcher:
+                fingerprints = await asyncio.gather(
+                    *(dispatcher.create(input=input, hash_function=hash_functions.SHA256, version=1) for input in self.inputs)
+                )
+                self.assertEqual(fingerprints, self.expected)
+                self.assertTrue(await dispatcher.match(input=self.inputs[0], target_fingerprint=self.expected[0]))
+                matches = await dispatcher.find_matches(input=self.inputs[1], fingerprints=self.expected)
+                self.assertEqual(matches, find_matches(input=self.inputs[1], fingerprints=self.expected))
+
+    async def test_aio_match(self):
+        """Test asynchronous fingerprint matching.
+
+        Verify that:
+        - Matches are identical to the synchronous functions
+        """
+        self.assertTrue(await aio.match(input=self.inputs[0], target_fingerprint=self.expected[0]))
+        self.assertFalse(await aio.match(input=json.dumps({"foo": "bar"}), target_fingerprint=self.expected[0]))
+        matches = await aio.find_matches(input=self.inputs[2], fingerprints=self.expected, deduplicate=True)
+        self.assertEqual(sorted(matches), sorted(find_matches(input=self.inputs[2], fingerprints=self.expected, deduplicate=True)))
+
+    async def test_aio_errors(self):
+        """Test asynchronous fingerprint errors.
+
+        Verify that:
+        - Exceptions are raised to the caller of the failing request only, and the other requests in the batch succeed
+        - ValueError is raised with invalid dispatcher options
+        """
+        async with aio.Dispatcher(max_batch_size=8) as dispatcher:
+            results = await asyncio.gather(
+                dispatcher.create(input=self.inputs[0], hash_function=hash_functions.SHA256, version=1),
+                dispatcher.create(input='{"foo": bar}', hash_function=hash_functions.SHA256, version=1),
+                dispatcher.create(input=self.inputs[0], hash_function="md5", version=1),
+                dispatcher.match(input=self.inputs[0], target_fingerprint="invalid fingerprint string"),
+                return_exceptions=True,
+            )
+        self.assertEqual(results[0], self.expected[0])
+        self.assertIsInstance(results[1], exceptions.JSONLoad)
+        self.assertIsInstance(results[2], exceptions.HashFunction)
+        self.assertIsInstance(results[3], exceptions.FingerprintPattern)
+
+        for options in ({"max_batch_size": 0}, {"max_queue_size": 0}, {"max_pending_batches": 0}):
+            with self.assertRaises(ValueError):
+                aio.Dispatcher(**options)
+
+
+if __name__ == "__main__":
+    unittest.main()
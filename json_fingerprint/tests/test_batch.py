@@ -0,0 +1,148 @@
+import itertools
+import json
+import multiprocessing.shared_memory
+import os
+import random
+import threading
+import unittest
+
+from json_fingerprint import (
+    _batch,
+    create,
+    create_many,
+    exceptions,
+    hash_functions,
+    imap_create,
+    imap_create_unordered,
+)
+from json_fingerprint.tests.utils import random_json
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(4)
+        self.inputs = [json.dumps(random_json(rng)) for _ in range(50)]
+        self.expected = [create(input=input, hash_function=hash_functions.SHA256, version=1) for input in self.inputs]
+
+    def test_create_many(self):
+        """Test batch fingerprint creation.
+
+        Verify that:
+        - Fingerprints are identical to create() and in input order, with and without worker processes
+        """
+        for workers in (1, 2):
+            fingerprints = create_many(self.inputs, hash_function=hash_functions.SHA256, version=1, workers=workers, chunksize=3)
+            self.assertEqual(fingerprints, self.expected)
+
+    def test_imap_create_unordered(self):
+        """Test unordered batch fingerprint creation.
+
+        Verify that:
+        - Each fingerprint is yielded exactly once, along with the index of its input
+        """
+        pairs = imap_create_unordered(self.inputs, hash_function=hash_functions.SHA256, version=1, workers=2, chunksize=4, max_pending=2)
+        self.assertEqual(sorted(pairs), list(enumerate(self.expected)))
+
+    def test_imap_create_lazy_inputs(self):
+        """Test batch fingerprint creation with endless inputs.
+
+        Verify that:
+        - Inputs are consumed lazily, so results of an endless input iterable can be iterated over
+        """
+        inputs = (json.dumps({"i": i}) for i in itertools.count())
+        fingerprints = imap_create(inputs, hash_function=hash_functions.SHA256, version=1, workers=2, chunksize=2)
+        first = list(itertools.islice(fingerprints, 5))
+        fingerprints.close()
+        expected = [create(input=json.dumps({"i": i}), hash_function=hash_functions.SHA256, version=1) for i in range(5)]
+        self.assertEqual(first, expected)
+
+    def test_imap_create_close_early(self):
+        """Test closing batch fingerprint iterators before they're exhausted.
+
+        Verify that:
+        - Closing the iterators shuts down the process pool with chunks still in flight, without deadlocking
+        """
+
+        def close_early():
+            for shared_memory in (False, True):
+                for _ in range(10):
+                    inputs = (json.dumps({"i": i}) for i in itertools.count())
+                    fingerprints = imap_create(
+                        inputs, hash_function=hash_functions.SHA256, version=1, workers=2, chunksize=2, shared_memory=shared_memory
+                    )
+                    list(itertools.islice(fingerprints, 5))
+                    fingerprints.close()
+                    pairs = imap_create_unordered(self.inputs, hash_function=hash_functions.SHA256, version=1, workers=2, chunksize=1)
+                    list(itertools.islice(pairs, 5))
+                    pairs.close()
+
+        thread = threading.Thread(target=close_early, daemon=True)
+        thread.start()
+        thread.join(timeout=120)
+        self.assertFalse(thread.is_alive())
+
+    def test_create_many_shared_memory(self):
+        """Test batch fingerprint creation with inputs in shared memory.
+
+        Verify that:
+        - Fingerprints are identical to create(), also with non-ASCII inputs
+        - Exceptions raised with invalid inputs are propagated, and all shared memory segments are removed
+        """
+        inputs = self.inputs + ['{"ä€𝄞": "\\n"}', '["𝄞", "\\u00e4"]']
+        expected = self.expected + [create(input=input, hash_function=hash_functions.SHA256, version=1) for input in inputs[-2:]]
+        segments = set(os.listdir("/dev/shm")) if os.path.isdir("/dev/shm") else set()
+        fingerprints = create_many(inputs, hash_function=hash_functions.SHA256, version=1, workers=2, chunksize=3, shared_memory=True)
+        self.assertEqual(fingerprints, expected)
+        pairs = imap_create_unordered(inputs, hash_function=hash_functions.SHA256, version=1, workers=2, chunksize=4, shared_memory=True)
+        self.assertEqual(sorted(pairs), list(enumerate(expected)))
+
+        with self.assertRaises(exceptions.JSONLoad):
+            create_many(self.inputs + ['{"foo": bar}'], hash_function=hash_functions.SHA256, version=1, workers=2, chunksize=5, shared_memory=True)
+        with self.assertRaises(exceptions.InputDataType):
+            create_many([b"[1]"], hash_function=hash_functions.SHA256, version=1, workers=2, shared_memory=True)
+        fingerprints = imap_create(self.inputs, hash_function=hash_functions.SHA256, version=1, workers=2, chunksize=2, shared_memory=True)
+        self.assertEqual(next(fingerprints), self.expected[0])
+        fingerprints.close()
+        if os.path.isdir("/dev/shm"):
+            self.assertEqual(set(os.listdir("/dev/shm")), segments)
+
+    @unittest.skipUnless(os.path.exists("/proc/self/maps"), "Requires /proc/self/maps")
+    def test_shared_chunk_detaches_segment(self):
+        """Test that shared memory segments are attached for a single chunk.
+
+        Verify that:
+        - The chunk's fingerprints are created from the segment, and the segment is unmapped afterwards
+        """
+        data = "".join(self.inputs[:3]).encode("utf-8")
+        size = len(data)
+        segment = multiprocessing.shared_memory.SharedMemory(create=True, size=size)
+        try:
+            segment.buf[:size] = data
+            offsets = [0]
+            for input in self.inputs[:3]:
+                offsets.append(offsets[-1] + len(input.encode("utf-8")))
+            fingerprints = _batch._create_shared_chunk((segment.name, offsets), hash_functions.SHA256, 1)
+            self.assertEqual(fingerprints, self.expected[:3])
+            with open("/proc/self/maps") as maps:
+                self.assertEqual(maps.read().count(segment.name.lstrip("/")), 1)
+        finally:
+            segment.close()
+            segment.unlink()
+
+    def test_batch_errors(self):
+        """Test batch fingerprint creation errors.
+
+        Verify that:
+        - Invalid hash functions and options are rejected before any input is processed
+        - Exceptions raised with invalid inputs are propagated from the worker processes
+        """
+        with self.assertRaises(exceptions.HashFunction):
+            imap_create(self.inputs, hash_function="not123", version=1)
+        with self.assertRaises(ValueError):
+            imap_create_unordered(self.inputs, hash_function=hash_functions.SHA256, version=1, workers=0)
+        with self.assertRaises(exceptions.JSONLoad):
+            create_many(['{"foo": bar}'], hash_function=hash_functions.SHA256, version=1, workers=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
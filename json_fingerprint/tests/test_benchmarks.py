@@ -0,0 +1,92 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from json_fingerprint import (
+    _json_backends,
+    benchmarks,
+    create,
+    hash_functions,
+    register_json_backend,
+)
+from json_fingerprint.benchmarks.__main__ import main
+
+TINY_SCENARIO = {"depth": 2, "fan_out": 2, "string_size": 4, "key_count": 3}
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_generate_payload(self):
+        """Test synthetic benchmark payloads.
+
+        Verify that:
+        - Payloads are deterministic for a seed, and have the requested shape
+        - ValueError is raised with invalid generator options
+        """
+        payload = benchmarks.generate_payload(**TINY_SCENARIO)
+        self.assertEqual(payload, benchmarks.generate_payload(**TINY_SCENARIO))
+        self.assertNotEqual(payload, benchmarks.generate_payload(**TINY_SCENARIO, seed=1))
+        self.assertEqual(sorted(payload), ["key_0", "key_1", "key_2"])
+        self.assertEqual(len(payload["key_0"]), 2)
+        self.assertEqual(len(payload["key_0"][0]["key_0"][0]), 4)
+        create(input=benchmarks.generate_input(**TINY_SCENARIO), hash_function=hash_functions.SHA256, version=1)
+        with self.assertRaises(ValueError):
+            benchmarks.generate_payload(depth=1, fan_out=0, string_size=4, key_count=3)
+
+    def test_run_and_compare(self):
+        """Test benchmark results and regression detection.
+
+        Verify that:
+        - Results hold the per-phase durations, the throughput and the peak memory usage of each scenario
+        - Throughput and peak memory regressions beyond the tolerance are reported
+        - Results of multiple JSON parser backends or hash functions are named by scenario, backend and hash function
+        """
+        results = benchmarks.run_benchmarks(scenarios={"tiny": TINY_SCENARIO}, number=1, repeat=1)
+        result = results["results"]["tiny"]
+        self.assertEqual(result["json_backend"], "json")
+        self.assertEqual(set(result["phases"]), set(benchmarks.PHASES))
+        self.assertGreater(result["ops_per_sec"], 0)
+        self.assertGreater(result["peak_memory_bytes"], 0)
+        self.assertEqual(benchmarks.compare(results=results, baseline=results), [])
+
+        faster = json.loads(json.dumps(results))
+        faster["results"]["tiny"]["ops_per_sec"] = result["ops_per_sec"] * 2
+        faster["results"]["tiny"]["peak_memory_bytes"] = result["peak_memory_bytes"] // 2
+        self.assertEqual(len(benchmarks.compare(results=results, baseline=faster)), 2)
+        self.assertEqual(benchmarks.compare(results=results, baseline=faster, tolerance=1.5), [])
+
+        register_json_backend("test", json.loads)
+        self.addCleanup(_json_backends._BACKENDS.pop, "test")
+        matrix = benchmarks.run_benchmarks(scenarios={"tiny": TINY_SCENARIO}, number=1, repeat=1, json_backends=["json", "test"])
+        self.assertEqual(list(matrix["results"]), ["tiny/json", "tiny/test"])
+        self.assertEqual(matrix["results"]["tiny/test"]["json_backend"], "test")
+        matrix = benchmarks.run_benchmarks(scenarios={"tiny": TINY_SCENARIO}, number=1, repeat=1, hash_functions=["sha256", "blake2s"])
+        self.assertEqual(list(matrix["results"]), ["tiny/sha256", "tiny/blake2s"])
+        self.assertEqual(matrix["results"]["tiny/blake2s"]["hash_function"], "blake2s")
+
+    def test_command_line(self):
+        """Test the benchmark command-line entry point.
+
+        Verify that:
+        - Results are written as JSON, and the exit status is 1 only on regressions against a baseline
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "baseline.json")
+            args = ["--depth", "1", "--fan-out", "2", "--number", "1", "--repeat", "1"]
+            self.assertEqual(main(args + ["--output", path]), 0)
+            with open(path, "r", encoding="utf-8") as file:
+                baseline = json.load(file)
+            self.assertEqual(list(baseline["results"]), ["custom"])
+
+            baseline["results"]["custom"]["ops_per_sec"] *= 1000
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(baseline, file)
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()) as stderr:
+                self.assertEqual(main(args + ["--baseline", path]), 1)
+            self.assertIn("Regression: custom: throughput", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
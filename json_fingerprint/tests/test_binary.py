@@ -0,0 +1,77 @@
+import json
+import unittest
+
+from json_fingerprint import (
+    create,
+    exceptions,
+    from_bytes,
+    from_bytes_many,
+    hash_functions,
+    to_bytes,
+    to_bytes_many,
+)
+
+
+class TestBinary(unittest.TestCase):
+    def setUp(self):
+        input = json.dumps({"foo": "bar"})
+        self.jfpv1_sha256 = create(input=input, hash_function=hash_functions.SHA256, version=1)
+        self.jfpv1_sha384 = create(input=input, hash_function=hash_functions.SHA384, version=1)
+        self.jfpv1_sha512 = create(input=input, hash_function=hash_functions.SHA512, version=1)
+
+    def test_jfpv1_binary_format(self):
+        """Test binary fingerprint encoder and decoder.
+
+        Verify that:
+        - Fingerprints of all jfpv1 SHA-2 variants are encoded into version byte, hash function id byte and raw digest
+        - Binary fingerprints are losslessly decoded into the text format
+        - Exceptions are properly raised with invalid input
+        """
+        for fingerprint, hash_id in ((self.jfpv1_sha256, 1), (self.jfpv1_sha384, 2), (self.jfpv1_sha512, 3)):
+            binary = to_bytes(fingerprint=fingerprint)
+            self.assertEqual(binary, bytes((1, hash_id)) + bytes.fromhex(fingerprint.split("$")[-1]))
+            self.assertEqual(from_bytes(data=binary), fingerprint)
+            self.assertEqual(from_bytes(data=bytearray(binary)), fingerprint)
+            self.assertEqual(from_bytes(data=memoryview(binary)), fingerprint)
+
+        binary = to_bytes(fingerprint=self.jfpv1_sha256)
+        with self.assertRaises(exceptions.FingerprintPattern):
+            to_bytes(fingerprint="invalid fingerprint")
+        with self.assertRaises(exceptions.FingerprintPattern):
+            from_bytes(data=binary[:-1])
+        with self.assertRaises(exceptions.FingerprintPattern):
+            from_bytes(data=binary + b"\x00")
+        with self.assertRaises(exceptions.FingerprintPattern):
+            from_bytes(data=b"\x01")
+        with self.assertRaises(exceptions.FingerprintVersion):
+            from_bytes(data=b"\x02" + binary[1:])
+        with self.assertRaises(exceptions.HashFunction):
+            from_bytes(data=b"\x01\x09" + binary[2:])
+        with self.assertRaises(exceptions.InputDataType):
+            from_bytes(data=binary.hex())
+
+    def test_jfpv1_binary_format_many(self):
+        """Test packed binary fingerprint array encoder and decoder.
+
+        Verify that:
+        - Packed arrays of mixed jfpv1 variants are losslessly decoded, in order
+        - Empty arrays are supported
+        - FingerprintPattern exception is properly raised with truncated arrays
+        """
+        fingerprints = [self.jfpv1_sha512, self.jfpv1_sha256, self.jfpv1_sha384, self.jfpv1_sha256]
+        packed = to_bytes_many(fingerprints=fingerprints)
+        self.assertEqual(len(packed), 34 + 34 + 50 + 66)
+        self.assertEqual(packed, b"".join(to_bytes(fingerprint=fingerprint) for fingerprint in fingerprints))
+        self.assertEqual(from_bytes_many(data=packed), fingerprints)
+        self.assertEqual(from_bytes_many(data=bytearray(packed)), fingerprints)
+        self.assertEqual(to_bytes_many(fingerprints=[]), b"")
+        self.assertEqual(from_bytes_many(data=b""), [])
+
+        with self.assertRaises(exceptions.FingerprintPattern):
+            from_bytes_many(data=packed[:-1])
+        with self.assertRaises(exceptions.FingerprintPattern):
+            from_bytes_many(data=packed + b"\x01")
+
+
+if __name__ == "__main__":
+    unittest.main()
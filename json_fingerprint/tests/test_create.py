@@ -1,9 +1,22 @@
 import json
+import mmap
 import os
+import random
+import tempfile
 import unittest
 
-from json_fingerprint import create, hash_functions
-from json_fingerprint.exceptions import JSONLoad
+from json_fingerprint import (
+    FingerprintCache,
+    SubtreeCache,
+    create,
+    create_from_bytes,
+    create_from_file,
+    create_from_object,
+    create_multi,
+    hash_functions,
+)
+from json_fingerprint.exceptions import HashFunction, InputDataType, JSONLoad
+from json_fingerprint.tests.utils import random_json
 
 TESTS_DIR = os.path.dirname(__file__)
 TESTDATA_DIR = os.path.join(TESTS_DIR, "testdata")
@@ -141,6 +154,164 @@ class TestCreate(unittest.TestCase):
 
         self.assertNotEqual(fp_1, fp_2)
 
+    def test_jfpv1_create_multi(self):
+        """Test jfpv1 fingerprint creation with multiple hash functions.
+
+        Verify that:
+        - Fingerprints are identical to create() and in the same order as the hash functions
+        - Exceptions are properly raised with invalid hash functions and input
+        """
+        input = json.dumps([1, {"foo": ["bar", [2, 3]]}, []])
+        selected_hash_functions = [hash_functions.SHA512, hash_functions.SHA256, hash_functions.SHA384, hash_functions.SHA256]
+        fingerprints = create_multi(input=input, hash_functions=selected_hash_functions, version=1)
+        expected = [create(input=input, hash_function=hash_function, version=1) for hash_function in selected_hash_functions]
+        self.assertEqual(fingerprints, expected)
+        self.assertEqual(create_multi(input=input, hash_functions=[], version=1), [])
+
+        with self.assertRaises(HashFunction):
+            create_multi(input=input, hash_functions=[hash_functions.SHA256, "not123"], version=1)
+        with self.assertRaises(JSONLoad):
+            create_multi(input='{"foo": bar}', hash_functions=[hash_functions.SHA256], version=1)
+
+    def test_jfpv1_create_from_bytes(self):
+        """Test jfpv1 fingerprint creation from bytes-like input.
+
+        Verify that:
+        - Fingerprints created from bytes, bytearray, memoryview and mmap input match the known valid fingerprint
+        - UTF-16 encoded input is decoded like with json.loads
+        - JSONLoad and InputDataType exceptions are properly raised with invalid input
+        """
+        expected = "jfpv1$sha256$b182c755347a6884fd11f1194cbe0961f548e5ac62be78a56c48c3c05eb56650"
+        with open(os.path.join(TESTDATA_DIR, "jfpv1_test_obj_1.json"), "rb") as file:
+            raw = file.read()
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                self.assertEqual(create_from_bytes(buffer, hash_function=hash_functions.SHA256, version=1), expected)
+
+        for input in (raw, bytearray(raw), memoryview(raw), raw.decode("utf-8").encode("utf-16")):
+            self.assertEqual(create_from_bytes(input, hash_function=hash_functions.SHA256, version=1), expected)
+
+        with self.assertRaises(JSONLoad):
+            create_from_bytes(b'{"foo": bar}', hash_function=hash_functions.SHA256, version=1)
+        with self.assertRaises(JSONLoad):
+            create_from_bytes(b"", hash_function=hash_functions.SHA256, version=1)
+        with self.assertRaises(InputDataType):
+            create_from_bytes('{"foo": "bar"}', hash_function=hash_functions.SHA256, version=1)
+
+    def test_jfpv1_create_from_file(self):
+        """Test jfpv1 fingerprint creation from files.
+
+        Verify that:
+        - Fingerprints created from files match the known valid fingerprint
+        - JSONLoad exception is properly raised with an empty file
+        """
+        fp = create_from_file(os.path.join(TESTDATA_DIR, "jfpv1_test_obj_2.json"), hash_function=hash_functions.SHA256, version=1)
+        self.assertEqual(fp, "jfpv1$sha256$b182c755347a6884fd11f1194cbe0961f548e5ac62be78a56c48c3c05eb56650")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "empty.json")
+            open(path, "wb").close()
+            with self.assertRaises(JSONLoad):
+                create_from_file(path, hash_function=hash_functions.SHA256, version=1)
+
+    def test_jfpv1_create_from_object(self):
+        """Test jfpv1 fingerprint creation from Python objects.
+
+        Verify that:
+        - Fingerprints are identical to the ones created from the JSON string of random objects
+        - InputDataType is raised with non-JSON types and non-string keys
+        - ValueError is raised with out of range floats and circular references
+        """
+        rng = random.Random(6)
+        for _ in range(100):
+            data = random_json(rng)
+            expected = create(input=json.dumps(data), hash_function=hash_functions.SHA256, version=1)
+            self.assertEqual(create_from_object(input=data, hash_function=hash_functions.SHA256, version=1), expected)
+
+        for input in ((1, 2), {1: "foo"}, {"foo": b"bar"}, [{1, 2}], object()):
+            with self.assertRaises(InputDataType):
+                create_from_object(input=input, hash_function=hash_functions.SHA256, version=1)
+        circular = []
+        circular.append(circular)
+        for input in (float("nan"), {"foo": [float("inf")]}, circular):
+            with self.assertRaises(ValueError):
+                create_from_object(input=input, hash_function=hash_functions.SHA256, version=1)
+        with self.assertRaises(HashFunction):
+            create_from_object(input={"foo": "bar"}, hash_function="md5", version=1)
+
+    def test_jfpv1_create_with_subtree_cache(self):
+        """Test jfpv1 fingerprint creation with a subtree cache.
+
+        Verify that:
+        - Fingerprints are identical with and without a subtree cache
+        - Identical list subtrees are reused across calls, and hits and misses are counted
+        - The least recently used subtrees are evicted when the cache is full
+        - ValueError is raised with an invalid maxsize
+        """
+        input = json.dumps({"items": [{"tags": ["a", "b"]}, {"tags": ["a", "b"]}]})
+        expected = create(input=input, hash_function=hash_functions.SHA256, version=1)
+        subtree_cache = SubtreeCache(maxsize=2)
+        self.assertEqual(create(input=input, hash_function=hash_functions.SHA256, version=1, subtree_cache=subtree_cache), expected)
+        self.assertEqual((subtree_cache.hits, subtree_cache.misses, len(subtree_cache)), (1, 2, 2))
+        self.assertEqual(create(input=input, hash_function=hash_functions.SHA256, version=1, subtree_cache=subtree_cache), expected)
+        self.assertEqual((subtree_cache.hits, subtree_cache.misses, len(subtree_cache)), (4, 2, 2))
+
+        fingerprints = create_multi(input=input, hash_functions=["sha512", "sha256"], version=1, subtree_cache=subtree_cache)
+        self.assertEqual(fingerprints[1], expected)
+        self.assertEqual(len(subtree_cache), 2)
+        self.assertEqual(create_from_bytes(input=input.encode("utf-8"), hash_function="sha256", version=1, subtree_cache=subtree_cache), expected)
+
+        subtree_cache.clear()
+        self.assertEqual((subtree_cache.hits, subtree_cache.misses, len(subtree_cache)), (0, 0, 0))
+        with self.assertRaises(ValueError):
+            SubtreeCache(maxsize=0)
+
+    def test_jfpv1_create_with_fingerprint_cache(self):
+        """Test jfpv1 fingerprint creation with a fingerprint cache.
+
+        Verify that:
+        - Fingerprints are identical with and without a fingerprint cache
+        - Identical inputs reuse the cached fingerprint, and hits, misses and evictions are counted
+        - Inputs are cached separately for each hash function
+        - The least recently used fingerprints are evicted by entry count and by total size
+        - Invalid inputs are not cached
+        - ValueError is raised with an invalid maxsize or maxbytes
+        """
+        input_1 = json.dumps({"foo": "bar"})
+        input_2 = json.dumps([1, 2, 3])
+        expected_1 = create(input=input_1, hash_function=hash_functions.SHA256, version=1)
+        expected_2 = create(input=input_2, hash_function=hash_functions.SHA256, version=1)
+        fingerprint_cache = FingerprintCache(maxsize=2)
+        self.assertEqual(create(input=input_1, hash_function=hash_functions.SHA256, version=1, fingerprint_cache=fingerprint_cache), expected_1)
+        self.assertEqual(create(input=input_1, hash_function=hash_functions.SHA256, version=1, fingerprint_cache=fingerprint_cache), expected_1)
+        self.assertEqual((fingerprint_cache.hits, fingerprint_cache.misses, len(fingerprint_cache)), (1, 1, 1))
+        self.assertEqual(fingerprint_cache.nbytes, 32 + len(expected_1))
+
+        fingerprint = create(input=input_1, hash_function=hash_functions.SHA512, version=1, fingerprint_cache=fingerprint_cache)
+        self.assertEqual(fingerprint, create(input=input_1, hash_function=hash_functions.SHA512, version=1))
+        self.assertEqual((fingerprint_cache.hits, fingerprint_cache.misses, len(fingerprint_cache)), (1, 2, 2))
+        fingerprint = create_from_bytes(input=input_2.encode("utf-8"), hash_function="sha256", version=1, fingerprint_cache=fingerprint_cache)
+        self.assertEqual(fingerprint, expected_2)
+        self.assertEqual((fingerprint_cache.evictions, len(fingerprint_cache)), (1, 2))
+        self.assertEqual(create(input=input_2, hash_function=hash_functions.SHA256, version=1, fingerprint_cache=fingerprint_cache), expected_2)
+        self.assertEqual(fingerprint_cache.hits, 2)
+
+        with self.assertRaises(JSONLoad):
+            create('{"foo": bar}', hash_function=hash_functions.SHA256, version=1, fingerprint_cache=fingerprint_cache)
+        self.assertEqual(len(fingerprint_cache), 2)
+
+        fingerprint_cache = FingerprintCache(maxbytes=2 * (32 + len(expected_1)))
+        for input in (input_1, input_2, json.dumps(None)):
+            create(input=input, hash_function=hash_functions.SHA256, version=1, fingerprint_cache=fingerprint_cache)
+        self.assertEqual((fingerprint_cache.evictions, len(fingerprint_cache)), (1, 2))
+        self.assertLessEqual(fingerprint_cache.nbytes, fingerprint_cache.maxbytes)
+
+        fingerprint_cache.clear()
+        self.assertEqual((fingerprint_cache.hits, fingerprint_cache.misses, fingerprint_cache.evictions, fingerprint_cache.nbytes), (0, 0, 0, 0))
+        with self.assertRaises(ValueError):
+            FingerprintCache(maxsize=0)
+        with self.assertRaises(ValueError):
+            FingerprintCache(maxbytes=0)
+
 
 if __name__ == "__main__":
     unittest.main()
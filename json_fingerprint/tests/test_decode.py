@@ -1,7 +1,14 @@
 import json
 import unittest
 
-from json_fingerprint import create, decode, exceptions, hash_functions
+from json_fingerprint import (
+    create,
+    decode,
+    decode_many,
+    exceptions,
+    hash_functions,
+    validate_many,
+)
 
 
 class TestDecode(unittest.TestCase):
@@ -35,6 +42,85 @@ class TestDecode(unittest.TestCase):
         with self.assertRaises(exceptions.FingerprintPattern):
             decode(fingerprint="invalid fingerprint")
 
+    def test_jfpv1_decode_many(self):
+        """Test bulk json fingerprint decoder and validator.
+
+        Verify that:
+        - Lists and newline-delimited buffers of fingerprints are decoded identically to decode()
+        - Structured results group the raw digests by variant, and report the indices of invalid fingerprints
+        - Invalid fingerprints are reported by validate_many()
+        - FingerprintPattern exception is properly raised with invalid fingerprints
+        """
+        input = json.dumps({"foo": "bar"})
+        fingerprints = [
+            create(input=input, hash_function=hash_functions.SHA256, version=1),
+            create(input=input, hash_function=hash_functions.SHA512, version=1),
+            create(input=input, hash_function=hash_functions.SHA384, version=1),
+            create(input=json.dumps({"bar": "foo"}), hash_function=hash_functions.SHA256, version=1),
+        ]
+        expected = [decode(fingerprint=fingerprint) for fingerprint in fingerprints]
+        buffer = "\n".join(fingerprints) + "\n"
+        self.assertEqual(decode_many(fingerprints=fingerprints), expected)
+        self.assertEqual(decode_many(fingerprints=iter(fingerprints)), expected)
+        self.assertEqual(decode_many(fingerprints=buffer), expected)
+        self.assertEqual(decode_many(fingerprints=buffer.encode()), expected)
+        self.assertEqual(decode_many(fingerprints=memoryview(buffer.encode()[:-1])), expected)
+        self.assertEqual(decode_many(fingerprints=[]), [])
+        self.assertEqual(decode_many(fingerprints=b""), [])
+
+        sha256_fingerprint = fingerprints[0]
+        invalid = [
+            sha256_fingerprint.upper(),
+            sha256_fingerprint[:-1],
+            sha256_fingerprint + "0",
+            sha256_fingerprint.replace("sha256", "sha384"),
+            sha256_fingerprint.replace("jfpv1", "jfpv2"),
+            sha256_fingerprint[:-1] + "\u00e4",
+            "",
+            None,
+        ]
+        result = decode_many(fingerprints=invalid[:4] + fingerprints + invalid[4:], structured=True)
+        self.assertEqual(result.invalid, [0, 1, 2, 3, 8, 9, 10, 11])
+        self.assertEqual(list(result.digests), [(1, "sha256"), (1, "sha512"), (1, "sha384")])
+        self.assertEqual(result.digests[(1, "sha256")], [bytes.fromhex(expected[0][2]), bytes.fromhex(expected[3][2])])
+        self.assertEqual(result.digests[(1, "sha512")], [bytes.fromhex(expected[1][2])])
+
+        buffer = "\n".join(fingerprints[:2] + ["invalid fingerprint", "", fingerprints[2]])
+        self.assertEqual(validate_many(fingerprints=buffer), [2, 3])
+        self.assertEqual(validate_many(fingerprints=buffer.encode("utf-8")), [2, 3])
+        self.assertEqual(validate_many(fingerprints=fingerprints), [])
+        self.assertEqual(validate_many(fingerprints=invalid), list(range(len(invalid))))
+
+        uniform = [create(input=json.dumps(i), hash_function=hash_functions.SHA256, version=1) for i in range(5)]
+        buffer = "\n".join(uniform) + "\n"
+        self.assertEqual(validate_many(fingerprints=buffer), [])
+        self.assertEqual(validate_many(fingerprints=buffer.encode("utf-8")), [])
+        self.assertEqual(validate_many(fingerprints=uniform), [])
+        self.assertEqual(validate_many(fingerprints=uniform[:4] + [uniform[4] + "\n"]), [4])
+        self.assertEqual(validate_many(fingerprints=uniform[:3] + ["\n".join(uniform[3:])]), [3])
+        self.assertEqual(validate_many(fingerprints=buffer.replace("sha256", "sha512", 1)), [0])
+        for i in range(len(uniform[2])):
+            invalid_fingerprint = "".join(char if j != i else "G" for j, char in enumerate(uniform[2]))
+            buffer_with_error = "\n".join(uniform[:2] + [invalid_fingerprint] + uniform[3:])
+            self.assertEqual(validate_many(fingerprints=buffer_with_error), [2])
+
+        # A newline in place of a hex digit isn't a line separator
+        newline_fingerprint = uniform[2][:40] + "\n" + uniform[2][41:]
+        with_newline = uniform[:2] + [newline_fingerprint] + uniform[3:]
+        self.assertEqual(validate_many(fingerprints=with_newline), [2])
+        self.assertEqual(validate_many(fingerprints=with_newline), decode_many(fingerprints=with_newline, structured=True).invalid)
+        for buffer_with_newline in ("\n".join(with_newline), "\n".join(with_newline).encode("utf-8")):
+            invalid_lines = decode_many(fingerprints=buffer_with_newline, structured=True).invalid
+            self.assertTrue(invalid_lines)
+            self.assertEqual(validate_many(fingerprints=buffer_with_newline), invalid_lines)
+
+        for fingerprint in invalid:
+            with self.assertRaises(exceptions.FingerprintPattern):
+                decode_many(fingerprints=fingerprints + [fingerprint])
+            if fingerprint is not None:
+                with self.assertRaises(exceptions.FingerprintPattern):
+                    decode(fingerprint=fingerprint)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,116 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+
+from json_fingerprint import Deduplicator, create, exceptions, hash_functions
+from json_fingerprint.tests.utils import random_json
+
+
+class TestDeduplicator(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        rng = random.Random(20)
+        unique = [json.dumps(random_json(rng)) for _ in range(60)]
+        self.inputs = [rng.choice(unique) for _ in range(200)]
+        self.expected = []
+        fingerprints = set()
+        for input in self.inputs:
+            fingerprint = create(input=input, hash_function=hash_functions.SHA256, version=1)
+            if fingerprint not in fingerprints:
+                fingerprints.add(fingerprint)
+                self.expected.append(input)
+
+    def test_deduplicator_filter(self):
+        """Test duplicate detection.
+
+        Verify that:
+        - Only the first occurrence of each fingerprint is yielded, in input order, with and without worker processes
+        - Documents with identical data but different formatting or ordering are duplicates
+        - The statistics count the documents, unique documents and duplicates
+        """
+        for workers in (1, 2):
+            deduplicator = Deduplicator(hash_function=hash_functions.SHA256, version=1, workers=workers, chunksize=7)
+            self.assertEqual(list(deduplicator.filter(self.inputs)), self.expected)
+            stats = deduplicator.stats
+            self.assertEqual((stats.documents, stats.unique, stats.duplicates), (200, len(self.expected), 200 - len(self.expected)))
+            self.assertEqual(stats.memory_digests, len(self.expected))
+            self.assertEqual(len(deduplicator), len(self.expected))
+
+        deduplicator = Deduplicator(hash_function=hash_functions.SHA256, version=1)
+        self.assertTrue(deduplicator.add('{"a": [1, 2], "b": null}'))
+        self.assertFalse(deduplicator.add(b'{"b":null,"a":[2,1]}'))
+        self.assertTrue(deduplicator.add('{"a": [1, 2]}'))
+
+    def test_deduplicator_spill(self):
+        """Test duplicate detection with spilled digests.
+
+        Verify that:
+        - Results are identical to the in-memory seen-set when digests are spilled into files and the files are merged
+        - At most max_digests digests are kept in memory
+        - The spilled files are removed when the deduplicator is closed
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            for max_digests in (1, 5, 1000):
+                with Deduplicator(hash_function=hash_functions.SHA256, version=1, max_digests=max_digests, spill_directory=directory) as deduplicator:
+                    self.assertEqual(list(deduplicator.filter(self.inputs)), self.expected)
+                    stats = deduplicator.stats
+                    self.assertLess(stats.memory_digests, max_digests)
+                    self.assertEqual(stats.memory_digests + stats.spilled_digests, len(self.expected))
+                    self.assertLessEqual(stats.spill_runs, 8)
+                self.assertEqual(os.listdir(directory), [])
+
+    def test_deduplicator_bloom(self):
+        """Test duplicate detection with a Bloom filter.
+
+        Verify that:
+        - Duplicates are always detected
+        - The estimated false positive rate stays below the configured rate under capacity
+        - Unique documents are rarely reported as duplicates
+        """
+        deduplicator = Deduplicator(hash_function=hash_functions.SHA256, version=1, mode="bloom", capacity=1000, false_positive_rate=0.01)
+        first = list(deduplicator.filter(self.inputs))
+        self.assertTrue(set(first) <= set(self.expected))
+        self.assertEqual(deduplicator.stats.documents, 200)
+        self.assertLess(deduplicator.stats.false_positive_rate, 0.01)
+        self.assertEqual(list(deduplicator.filter(self.inputs)), [])
+
+        inputs = [json.dumps({"id": i}) for i in range(1000)]
+        deduplicator = Deduplicator(hash_function=hash_functions.SHA256, version=1, mode="bloom", capacity=1000, false_positive_rate=0.01)
+        self.assertGreater(len(list(deduplicator.filter(inputs))), 970)
+        self.assertLess(deduplicator.stats.memory_bytes, 2000)
+
+    async def test_deduplicator_afilter(self):
+        """Test duplicate detection with an asynchronous stream.
+
+        Verify that:
+        - Results are identical to filter()
+        """
+
+        async def stream():
+            for input in self.inputs:
+                yield input
+
+        deduplicator = Deduplicator(hash_function=hash_functions.SHA256, version=1, chunksize=16)
+        self.assertEqual([input async for input in deduplicator.afilter(stream())], self.expected)
+        self.assertEqual(deduplicator.stats.documents, 200)
+
+    def test_deduplicator_errors(self):
+        """Test deduplicator errors.
+
+        Verify that:
+        - Invalid hash functions and options are rejected
+        - Invalid JSON documents raise JSONLoad
+        """
+        with self.assertRaises(exceptions.HashFunction):
+            Deduplicator(hash_function="md5", version=1)
+        for options in ({"mode": "lossy"}, {"max_digests": 0}, {"capacity": 0}, {"false_positive_rate": 1}, {"chunksize": 0}):
+            with self.assertRaises(ValueError):
+                Deduplicator(hash_function=hash_functions.SHA256, version=1, **options)
+        deduplicator = Deduplicator(hash_function=hash_functions.SHA256, version=1)
+        with self.assertRaises(exceptions.JSONLoad):
+            list(deduplicator.filter(["[1]", "not json"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
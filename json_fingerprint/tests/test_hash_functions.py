@@ -1,20 +1,118 @@
+import hashlib
 import json
 import unittest
 
-from json_fingerprint import _validators, create, exceptions, hash_functions
+from json_fingerprint import (
+    _hash_registry,
+    _validators,
+    available_hash_functions,
+    create,
+    create_multi,
+    decode,
+    decode_many,
+    exceptions,
+    from_bytes,
+    hash_functions,
+    register_hash_function,
+    to_bytes,
+    validate_many,
+)
 
 
 class TestHashFunctions(unittest.TestCase):
     def test_hash_function_module_options(self):
-        """Test the 'hash_functions' module's SHA-2 options.
+        """Test the 'hash_functions' module's SHA-2 and BLAKE2 options.
 
         Verify that:
-        - Each supported hash function string is available ("sha256", "sha384", and "sha512")
+        - Each supported hash function string is available ("sha256", "sha384", "sha512", "blake2b", and "blake2s")
         - The options are all-lowercase (exact match)
         """
         self.assertEqual(hash_functions.SHA256, "sha256")
         self.assertEqual(hash_functions.SHA384, "sha384")
         self.assertEqual(hash_functions.SHA512, "sha512")
+        self.assertEqual(hash_functions.BLAKE2B, "blake2b")
+        self.assertEqual(hash_functions.BLAKE2S, "blake2s")
+
+    def test_blake2(self):
+        """Test JSON fingerprints with BLAKE2 hash functions.
+
+        Verify that:
+        - Fingerprints have the hash function's identifier and digest size, and differ from each other
+        - The fingerprints are decoded, validated, and converted into the binary format and back
+        """
+        input = json.dumps([3, 2, 1, [True, False], {"foo": "bar"}])
+        fingerprints = create_multi(input=input, hash_functions=[hash_functions.BLAKE2B, hash_functions.BLAKE2S], version=1)
+        self.assertEqual(fingerprints[0], create(input=input, hash_function=hash_functions.BLAKE2B, version=1))
+        for fingerprint, hash_function, digest_size in zip(fingerprints, (hash_functions.BLAKE2B, hash_functions.BLAKE2S), (64, 32)):
+            version, decoded_hash_function, hex_digest = decode(fingerprint=fingerprint)
+            self.assertEqual((version, decoded_hash_function, len(hex_digest)), (1, hash_function, 2 * digest_size))
+            self.assertEqual(from_bytes(to_bytes(fingerprint=fingerprint)), fingerprint)
+        self.assertEqual(validate_many(fingerprints=fingerprints + ["jfpv1$blake2s$00"]), [2])
+
+    def test_register_hash_function(self):
+        """Test registering hash functions.
+
+        Verify that:
+        - Fingerprints of a registered hash function are created, decoded, validated and converted like the built-in ones
+        - Fingerprints of hash functions without a binary id aren't converted into the binary format
+        - ValueError is raised with invalid or registered names, and with invalid or used binary ids
+        - Unregistered hash functions are removed from decoding, validation and the binary format
+        """
+        register_hash_function("sha3_256", hashlib.sha3_256, binary_id=200)
+        self.addCleanup(_hash_registry._unregister_hash_function, "sha3_256")
+        register_hash_function("sha3_224", hashlib.sha3_224)
+        self.addCleanup(_hash_registry._unregister_hash_function, "sha3_224")
+        self.assertIn("sha3_256", available_hash_functions())
+
+        fingerprint = create(input="[1, 2]", hash_function="sha3_256", version=1)
+        self.assertRegex(fingerprint, "^jfpv1\\$sha3_256\\$[0-9a-f]{64}$")
+        self.assertEqual(decode(fingerprint=fingerprint)[1], "sha3_256")
+        self.assertEqual(decode_many(fingerprints=[fingerprint]), [decode(fingerprint=fingerprint)])
+        self.assertEqual(validate_many(fingerprints=[fingerprint, fingerprint[:-1]]), [1])
+        self.assertEqual(to_bytes(fingerprint=fingerprint)[:2], bytes((1, 200)))
+        self.assertEqual(from_bytes(to_bytes(fingerprint=fingerprint)), fingerprint)
+
+        fingerprint = create(input="[1, 2]", hash_function="sha3_224", version=1)
+        self.assertIn("sha3_224", _validators.JFPV1_REGEX_PATTERNS)
+        with self.assertRaises(exceptions.HashFunction):
+            to_bytes(fingerprint=fingerprint)
+
+        for name in ("SHA3", "sha3$256", "", None, "sha256"):
+            with self.assertRaises(ValueError):
+                register_hash_function(name, hashlib.sha3_512)
+        for binary_id in (0, 256, 1, 200):
+            with self.assertRaises(ValueError):
+                register_hash_function("sha3_512", hashlib.sha3_512, binary_id=binary_id)
+        self.assertNotIn("sha3_512", available_hash_functions())
+
+    def test_unregister_hash_function(self):
+        """Test removing registered hash functions.
+
+        Verify that:
+        - Fingerprints of an unregistered hash function are no longer created, decoded, validated or converted
+        - The hash function's name and binary id can be registered again
+        - ValueError is raised with built-in and unknown hash functions
+        """
+        register_hash_function("sha3_512", hashlib.sha3_512, binary_id=201)
+        fingerprint = create(input="[1, 2]", hash_function="sha3_512", version=1)
+        data = to_bytes(fingerprint=fingerprint)
+        _hash_registry._unregister_hash_function("sha3_512")
+
+        self.assertNotIn("sha3_512", available_hash_functions())
+        with self.assertRaises(exceptions.HashFunction):
+            create(input="[1, 2]", hash_function="sha3_512", version=1)
+        with self.assertRaises(exceptions.FingerprintPattern):
+            decode(fingerprint=fingerprint)
+        self.assertEqual(validate_many(fingerprints=[fingerprint]), [0])
+        with self.assertRaises(exceptions.HashFunction):
+            from_bytes(data)
+
+        register_hash_function("sha3_512", hashlib.sha3_512, binary_id=201)
+        self.addCleanup(_hash_registry._unregister_hash_function, "sha3_512")
+        self.assertEqual(from_bytes(data), fingerprint)
+        for name in (hash_functions.SHA256, hash_functions.BLAKE2S, "sha3_384"):
+            with self.assertRaises(ValueError):
+                _hash_registry._unregister_hash_function(name)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,130 @@
+import json
+import random
+import sys
+import unittest
+
+from json_fingerprint import (
+    IncrementalFingerprint,
+    create,
+    create_from_object,
+    exceptions,
+    hash_functions,
+)
+from json_fingerprint.tests.utils import random_json
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _random_operation(rng: random.Random, data):
+    """Generate a random valid JSON Patch operation for the data."""
+    tokens = []
+    target = data
+    while True:
+        candidates = list(target.items()) if type(target) is dict else list(enumerate(target)) if type(target) is list else []
+        if not candidates or rng.random() < 0.3:
+            break
+        key, child = rng.choice(candidates)
+        tokens.append(str(key))
+        target = child
+
+    if type(target) in (dict, list) and rng.random() < 0.5:
+        # Add a value into the container
+        if type(target) is dict:
+            token = rng.choice(("a", "b", "new", "~/"))
+        else:
+            token = rng.choice(("-", str(rng.randint(0, len(target)))))
+        return {"op": "add", "path": "".join(f"/{_escape(token)}" for token in tokens + [token]), "value": random_json(rng, max_depth=2)}
+    pointer = "".join(f"/{_escape(token)}" for token in tokens)
+    if tokens and rng.random() < 0.4:
+        return {"op": "remove", "path": pointer}
+    return {"op": "replace", "path": pointer, "value": random_json(rng, max_depth=2)}
+
+
+class TestIncremental(unittest.TestCase):
+    def test_incremental_differential(self):
+        """Test incremental fingerprints with random JSON data and random JSON Patch operations.
+
+        Verify that:
+        - Fingerprints are identical to create() from the patched JSON data after each operation
+        - Patched JSON data is identical to the JSON data patched with the same operations
+        """
+        rng = random.Random(7)
+        for hash_function in (hash_functions.SHA256, hash_functions.SHA512):
+            for _ in range(60):
+                data = random_json(rng)
+                incremental = IncrementalFingerprint(input=json.dumps(data), hash_function=hash_function, version=1)
+                self.assertEqual(incremental.fingerprint, create(input=json.dumps(data), hash_function=hash_function, version=1))
+                for _ in range(8):
+                    operation = _random_operation(rng, incremental.data)
+                    fingerprint = incremental.patch([operation])
+                    expected = create(input=json.dumps(incremental.data), hash_function=hash_function, version=1)
+                    self.assertEqual(fingerprint, expected, msg=f"{operation}")
+
+    def test_incremental_operations(self):
+        """Test incremental fingerprint operations.
+
+        Verify that:
+        - add(), replace() and remove() update the JSON data and the fingerprint
+        - Patch values are copied, so modifying them afterwards doesn't affect the JSON data
+        """
+        incremental = IncrementalFingerprint(input=json.dumps({"foo": [1, 2]}), hash_function=hash_functions.SHA256, version=1)
+        value = {"bar": [3]}
+        incremental.add("/foo/-", value)
+        value["bar"].append(4)
+        incremental.replace("/foo/0", "baz")
+        fingerprint = incremental.remove("/foo/1")
+        self.assertEqual(incremental.data, {"foo": ["baz", {"bar": [3]}]})
+        self.assertEqual(fingerprint, create(input=json.dumps({"foo": ["baz", {"bar": [3]}]}), hash_function=hash_functions.SHA256, version=1))
+        self.assertEqual(incremental.replace("", [3, 2, 1]), create(input="[1, 2, 3]", hash_function=hash_functions.SHA256, version=1))
+
+    def test_incremental_errors(self):
+        """Test incremental fingerprint errors.
+
+        Verify that:
+        - JSONPatch is raised with invalid operations and JSON pointers that don't match the JSON data
+        - InputDataType and ValueError are raised with values that aren't JSON-compatible
+        """
+        incremental = IncrementalFingerprint(input=json.dumps({"foo": [1, 2]}), hash_function=hash_functions.SHA256, version=1)
+        invalid_operations = (
+            {"op": "move", "path": "/foo", "from": "/bar"},
+            {"op": "add", "path": "/bar"},
+            {"op": "remove"},
+            {"op": "remove", "path": ""},
+            {"op": "remove", "path": "/bar"},
+            {"op": "replace", "path": "foo", "value": 1},
+            {"op": "replace", "path": "/foo/2", "value": 1},
+            {"op": "replace", "path": "/foo/01", "value": 1},
+            {"op": "add", "path": "/foo/3", "value": 1},
+            {"op": "add", "path": "/foo/0/bar", "value": 1},
+        )
+        for operation in invalid_operations:
+            with self.assertRaises(exceptions.JSONPatch):
+                incremental.patch([operation])
+        with self.assertRaises(exceptions.InputDataType):
+            incremental.add("/bar", (1, 2))
+        with self.assertRaises(ValueError):
+            incremental.add("/bar", float("nan"))
+        self.assertEqual(incremental.data, {"foo": [1, 2]})
+
+    def test_incremental_deep_documents(self):
+        """Test incremental fingerprints of documents nested deeper than the recursion limit.
+
+        Verify that:
+        - Deep JSON input and deep patch values are hashed without RecursionError, and fingerprints are identical to
+          the ones created with create() and create_from_object()
+        """
+        depth = 10 * sys.getrecursionlimit()
+        input = "[" * depth + "1" + "]" * depth
+        incremental = IncrementalFingerprint(input=input, hash_function=hash_functions.SHA256, version=1)
+        self.assertEqual(incremental.fingerprint, create(input=input, hash_function=hash_functions.SHA256, version=1))
+        value = "bottom"
+        for _ in range(depth):
+            value = {"next": value}
+        fingerprint = incremental.replace("/0", value)
+        self.assertEqual(fingerprint, create_from_object(input=incremental.data, hash_function=hash_functions.SHA256, version=1))
+
+
+if __name__ == "__main__":
+    unittest.main()
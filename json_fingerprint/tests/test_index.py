@@ -0,0 +1,63 @@
+import json
+import unittest
+
+from json_fingerprint import (
+    FingerprintIndex,
+    create,
+    exceptions,
+    find_matches,
+    hash_functions,
+)
+
+
+class TestIndex(unittest.TestCase):
+    def setUp(self):
+        self.test_input = json.dumps({"foo": "bar"})
+        self.jfpv1_sha256 = create(input=self.test_input, hash_function=hash_functions.SHA256, version=1)
+        self.jfpv1_sha384 = create(input=self.test_input, hash_function=hash_functions.SHA384, version=1)
+        self.jfpv1_sha512 = create(input=self.test_input, hash_function=hash_functions.SHA512, version=1)
+        self.chaff_jfpv1_sha256 = create(input=json.dumps({"bar": "foo"}), hash_function=hash_functions.SHA256, version=1)
+
+    def test_fingerprint_index(self):
+        """Test fingerprint index contents.
+
+        Verify that:
+        - Duplicate fingerprints are stored once, grouped by variant
+        - Fingerprints are restored losslessly from the index
+        - FingerprintPattern exception is properly raised with invalid fingerprints
+        """
+        fingerprints = [self.jfpv1_sha256, self.jfpv1_sha256, self.jfpv1_sha512, self.chaff_jfpv1_sha256]
+        index = FingerprintIndex(fingerprints)
+        self.assertEqual(len(index), 3)
+        self.assertEqual(sorted(index), sorted(set(fingerprints)))
+        self.assertEqual(index.variants, [(1, hash_functions.SHA256), (1, hash_functions.SHA512)])
+        self.assertIn(self.chaff_jfpv1_sha256, index)
+        self.assertNotIn(self.jfpv1_sha384, index)
+
+        index.add(self.jfpv1_sha384)
+        self.assertIn(self.jfpv1_sha384, index)
+
+        with self.assertRaises(exceptions.FingerprintPattern):
+            FingerprintIndex(["invalid fingerprint string"])
+
+    def test_fingerprint_index_find_matches(self):
+        """Test fingerprint index matching.
+
+        Verify that:
+        - Matches are identical to deduplicated find_matches() results
+        - Exceptions are properly raised with invalid input
+        """
+        fingerprints = [self.jfpv1_sha256, self.jfpv1_sha384, self.jfpv1_sha512, self.jfpv1_sha512, self.chaff_jfpv1_sha256]
+        index = FingerprintIndex(fingerprints)
+        matches = index.find_matches(input=self.test_input)
+        self.assertCountEqual(matches, find_matches(input=self.test_input, fingerprints=fingerprints, deduplicate=True))
+        self.assertTrue(index.contains(input=self.test_input))
+        self.assertFalse(index.contains(input=json.dumps({"foo": "baz"})))
+        self.assertEqual(FingerprintIndex().find_matches(input=self.test_input), [])
+
+        with self.assertRaises(exceptions.JSONLoad):
+            index.contains(input='{"invalid": json string}')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,19 @@
 import hashlib
+import io
 import json
+import random
+import sys
 import unittest
 
-from json_fingerprint import _jfpv1, hash_functions
+from json_fingerprint import (
+    SubtreeCache,
+    _jfpv1,
+    create,
+    create_from_object,
+    create_from_stream,
+    hash_functions,
+)
+from json_fingerprint.tests.utils import random_json
 
 
 class TestJfpv1(unittest.TestCase):
@@ -245,6 +256,131 @@ class TestJfpv1(unittest.TestCase):
         expected_empty_dict_out_raw = [{"path": "", "value": empty_dict_val}]
         self.assertEqual(empty_dict_out_raw, expected_empty_dict_out_raw)
 
+    def test_jfpv1_hash_elements(self):
+        """Test jfpv1 single-pass element hashing.
+
+        Verify that:
+        - The raw element digests are identical to the hex digests of the reference flattener's elements
+        - The raw digests sort in the same order as their hex digests
+        """
+        obj_in = [1, {"foo": [2, [3, {"bar": 4}]]}, [[5], []], {}, {"|{a}": "ä\n"}]
+        hashes = _jfpv1._hash_elements(data=obj_in, hash_function=hash_functions.SHA256)
+        expected_elements = _jfpv1._flatten_json(data=obj_in, hash_function=hash_functions.SHA256)
+        expected_hashes = _jfpv1._create_sorted_hash_list(data=expected_elements, hash_function=hash_functions.SHA256)
+        self.assertEqual([hash.hex() for hash in sorted(hashes)], expected_hashes)
+
+    def test_jfpv1_encode_value(self):
+        """Test jfpv1 element value encoding.
+
+        Verify that:
+        - Values are encoded identically to the json-converted values in `_create_json_hash`
+        - Out of range float values are rejected like in `_create_json_hash`
+        """
+        values = ["", "ä€𝄞", 'q"\\\n\x00\x7f', 0, -1, 2**100, 0.1, -0.0, 1e-300, 1.5e300, 1e16, True, False, None, [], {}]
+        for value in values:
+            self.assertEqual(_jfpv1._encode_value(value), json.dumps(value, **_jfpv1._JSON_DUMPS_OPTIONS))
+
+        for value in (float("nan"), float("inf"), float("-inf")):
+            with self.assertRaises(ValueError):
+                _jfpv1._encode_value(value)
+
+    def test_jfpv1_hash_digest_list(self):
+        """Test jfpv1 hash creation from sorted raw digests.
+
+        Verify that:
+        - The hash is identical to the hash of the json-converted hex digest list, also across block boundaries
+        """
+        for count in (0, 1, 1024, 2500):
+            digests = sorted(hashlib.sha256(str(i).encode("utf-8")).digest() for i in range(count))
+            hex_digest = _jfpv1._hash_digest_list(digests=digests, hash_constructor=hashlib.sha256)
+            expected_hex_digest = _jfpv1._create_json_hash(data=[digest.hex() for digest in digests], hash_function=hash_functions.SHA256)
+            self.assertEqual(hex_digest, expected_hex_digest)
+
+    def test_jfpv1_fingerprint_differential(self):
+        """Test jfpv1 fingerprints against the reference flattener with random data.
+
+        Verify that:
+        - Fingerprints are identical to the ones created from the reference flattener output
+        """
+        rng = random.Random(1)
+        for hash_function in (hash_functions.SHA256, hash_functions.SHA384, hash_functions.SHA512):
+            for _ in range(100):
+                data = random_json(rng)
+                flattened_json = _jfpv1._flatten_json(data=data, hash_function=hash_function)
+                sorted_hash_list = _jfpv1._create_sorted_hash_list(data=flattened_json, hash_function=hash_function)
+                expected = f"jfpv1${hash_function}${_jfpv1._create_json_hash(data=sorted_hash_list, hash_function=hash_function)}"
+                self.assertEqual(_jfpv1._create_jfpv1_fingerprint(data=data, hash_function=hash_function), expected)
+
+    def test_jfpv1_multi_hash_fingerprints(self):
+        """Test jfpv1 fingerprint creation with multiple hash functions in one pass with random data.
+
+        Verify that:
+        - Fingerprints are identical to the ones created with each hash function separately
+        """
+        rng = random.Random(6)
+        selected_hash_functions = (hash_functions.SHA384, hash_functions.SHA256, hash_functions.SHA512)
+        for _ in range(100):
+            data = random_json(rng)
+            expected = [_jfpv1._create_jfpv1_fingerprint(data=data, hash_function=hash_function) for hash_function in selected_hash_functions]
+            self.assertEqual(_jfpv1._create_jfpv1_fingerprints(data=data, hash_functions=selected_hash_functions), expected)
+
+    def test_jfpv1_subtree_cache_differential(self):
+        """Test jfpv1 fingerprints with a subtree cache with random data with repeated sub-structures.
+
+        Verify that:
+        - Fingerprints are identical with and without a subtree cache, also when the cache is shared and full
+        - Cached list subtrees are reused within a document
+        """
+        rng = random.Random(10)
+        selected_hash_functions = (hash_functions.SHA256, hash_functions.SHA512)
+        subtree_cache = SubtreeCache(maxsize=8)
+        for _ in range(100):
+            subtree = random_json(rng, max_depth=3)
+            data = [{"item": i % 3, "subtree": subtree, "list": [subtree, [subtree]]} for i in range(rng.randint(1, 6))]
+            expected = _jfpv1._create_jfpv1_fingerprints(data=data, hash_functions=selected_hash_functions)
+            fingerprints = _jfpv1._create_jfpv1_fingerprints(data=data, hash_functions=selected_hash_functions, subtree_cache=subtree_cache)
+            self.assertEqual(fingerprints, expected)
+            self.assertLessEqual(len(subtree_cache), 8)
+        self.assertGreater(subtree_cache.hits, 0)
+
+        data = {"items": [{"tags": ["a", "b"], "currency": {"code": "EUR", "locale": "fi-FI"}} for _ in range(10)]}
+        subtree_cache = SubtreeCache()
+        fingerprint = _jfpv1._create_jfpv1_fingerprint(data=data, hash_function=hash_functions.SHA256, subtree_cache=subtree_cache)
+        self.assertEqual(fingerprint, _jfpv1._create_jfpv1_fingerprint(data=data, hash_function=hash_functions.SHA256))
+        self.assertEqual((subtree_cache.hits, subtree_cache.misses), (9, 2))
+
+    def test_jfpv1_deep_documents(self):
+        """Test jfpv1 fingerprints of documents nested deeper than the recursion limit.
+
+        Verify that:
+        - Fingerprints of moderately deep data are identical to the ones created from the reference flattener output
+        - Deep JSON input is parsed and fingerprinted without RecursionError, and fingerprints are identical to the ones
+          created from the JSON data as a stream and as a Python object
+        """
+        # The reference flattener is exponential in the depth of nested lists, so it's compared at a moderate depth
+        data = "bottom"
+        for level in range(20):
+            data = [data, level] if level % 2 else {"level": level, "next": data}
+        flattened_json = _jfpv1._flatten_json(data=data, hash_function=hash_functions.SHA256)
+        sorted_hash_list = _jfpv1._create_sorted_hash_list(data=flattened_json, hash_function=hash_functions.SHA256)
+        expected = f"jfpv1$sha256${_jfpv1._create_json_hash(data=sorted_hash_list, hash_function=hash_functions.SHA256)}"
+        self.assertEqual(_jfpv1._create_jfpv1_fingerprint(data=data, hash_function=hash_functions.SHA256), expected)
+
+        depth = 10 * sys.getrecursionlimit()
+        inputs = (
+            '{"k":' * depth + '["x",[1,{}]]' + "}" * depth,
+            '[{"a":[1,' * 300 + "2" + "]}]" * 300,
+        )
+        for input in inputs:
+            fingerprint = create(input=input, hash_function=hash_functions.SHA256, version=1)
+            self.assertEqual(fingerprint, create_from_stream(stream=io.StringIO(input), hash_function=hash_functions.SHA256, version=1))
+
+        data = 1
+        for _ in range(depth):
+            data = [data]
+        fingerprint = create_from_object(input=data, hash_function=hash_functions.SHA256, version=1)
+        self.assertEqual(fingerprint, create(input="[" * depth + "1" + "]" * depth, hash_function=hash_functions.SHA256, version=1))
+
 
 if __name__ == "__main__":
     unittest.main()
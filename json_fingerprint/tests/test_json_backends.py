@@ -0,0 +1,126 @@
+import json
+import unittest
+
+from json_fingerprint import (
+    _json_backends,
+    available_json_backends,
+    create,
+    exceptions,
+    get_json_backend,
+    hash_functions,
+    register_json_backend,
+    set_json_backend,
+)
+
+# Input that JSON parsers tend to disagree on: float formatting, large integers, NaN, non-ASCII and escaped strings,
+# duplicate keys, deep nesting, and invalid JSON
+CONFORMANCE_INPUTS = (
+    "[0.1, 1.0, -0.0, 1E2, 1.5e+3, 5e-324, 4.9e-324, 2.2250738585072014e-308, 1.7976931348623157e308]",
+    "[1e400]",
+    "[-1e400]",
+    "[1.00000000000000000000001, 0.12345678901234567890123]",
+    "[9223372036854775807, -9223372036854775808, 18446744073709551615]",
+    "[18446744073709551616, -9223372036854775809, 123456789012345678901234567890]",
+    '{"a": 1234567890123456789, "b": "1234567890123456789"}',
+    "[NaN]",
+    "[Infinity, -Infinity]",
+    '["äöå€", "\\u00e4", "\\ud83d\\ude00", "😀", "\\u0000", "\x7f"]',
+    '["\\ud800"]',
+    '["\ud800"]',
+    '["\\"[[", "\\\\", "]]\\\\\\"", "[{}]", "a\\nb"]',
+    '{"a": 1, "a": [2], "b": {"c": 3, "c": 4}}',
+    " \t\n\r[1] \t\n\r",
+    "[" * 256 + "]" * 256,
+    "[" * 257 + "]" * 257,
+    '[{"a": ' * 2000 + "1" + "}]" * 2000,
+    "[" * 100000 + "]" * 100000,
+    '["]", ["]", [], "["], "["]',
+    "[1,]",
+    '{"a": 1,}',
+    "[01]",
+    "[.5]",
+    "[1] x",
+    '["a',
+    "[1",
+    "\ufeff[1]",
+    '["\x01"]',
+    "[1, \\]",
+    "",
+)
+
+
+def _reference_results():
+    results = []
+    for input in CONFORMANCE_INPUTS:
+        try:
+            results.append(create(input=input, hash_function=hash_functions.SHA256, version=1))
+        except (exceptions.JSONLoad, ValueError) as exc:
+            results.append(type(exc))
+    return results
+
+
+class TestJsonBackends(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(set_json_backend, get_json_backend())
+
+    def test_conformance(self):
+        """Test fingerprint conformance of all JSON parser backends.
+
+        Verify that:
+        - Each backend creates the same fingerprints as the standard library, and rejects the same input
+        """
+        self.assertIn("json", available_json_backends())
+        set_json_backend("json")
+        expected = _reference_results()
+        for backend in available_json_backends():
+            set_json_backend(backend)
+            with self.subTest(backend=backend):
+                self.assertEqual(_reference_results(), expected)
+
+    def test_registry(self):
+        """Test registering and selecting JSON parser backends.
+
+        Verify that:
+        - A registered backend parses the input, and the standard library parses the input that the backend rejects
+        - Input with long runs of digits, deep nesting or lone surrogates isn't passed to a backend
+        - ValueError is raised with unknown backends, with the name "json" and with parsers that aren't callable
+        """
+        calls = []
+
+        def loads(data):
+            calls.append(data)
+            if b"NaN" in data:
+                raise ValueError("NaN")
+            return json.loads(data)
+
+        register_json_backend("test", loads)
+        self.addCleanup(_json_backends._BACKENDS.pop, "test")
+        self.assertIn("test", available_json_backends())
+        set_json_backend("test")
+        self.assertEqual(get_json_backend(), "test")
+
+        fingerprint = create(input='{"a": [1]}', hash_function=hash_functions.SHA256, version=1)
+        self.assertEqual(fingerprint, create(input='{"a":[1]}', hash_function=hash_functions.SHA256, version=1))
+        self.assertEqual(calls, [b'{"a": [1]}', b'{"a":[1]}'])
+        with self.assertRaises(ValueError):
+            create(input="[NaN]", hash_function=hash_functions.SHA256, version=1)
+        self.assertEqual(len(calls), 3)
+        for input in ("[12345678901234567890]", "[" * 300 + "]" * 300):
+            create(input=input, hash_function=hash_functions.SHA256, version=1)
+        with self.assertRaises(ValueError):
+            # Lone surrogates are parsed, but can't be hashed
+            create(input='["\ud800"]', hash_function=hash_functions.SHA256, version=1)
+        with self.assertRaises(exceptions.JSONLoad):
+            create(input="[[1]", hash_function=hash_functions.SHA256, version=1)
+        self.assertEqual(len(calls), 3)
+
+        with self.assertRaises(ValueError):
+            set_json_backend("unknown")
+        with self.assertRaises(ValueError):
+            register_json_backend("json", loads)
+        with self.assertRaises(ValueError):
+            register_json_backend("test", None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+
+from json_fingerprint import (
+    FingerprintCache,
+    Limits,
+    create,
+    create_from_bytes,
+    create_from_file,
+    create_from_object,
+    create_multi,
+    exceptions,
+    find_matches,
+    hash_functions,
+    match,
+)
+from json_fingerprint.tests.utils import random_json
+
+
+class TestLimits(unittest.TestCase):
+    def test_limits(self):
+        """Test admission limits.
+
+        Verify that:
+        - Fingerprints within the limits are identical to fingerprints without limits
+        - LimitExceeded is raised when the input size, the nesting depth, the number of data elements or the work
+          exceeds its limit, including data too deep for recursive traversal
+        """
+        input = json.dumps({"foo": [1, [2, 3]], "bar": {}})
+        fingerprint = create(input=input, hash_function=hash_functions.SHA256, version=1)
+        # Depth 3, 4 data elements and 2 + 3 + 3 + 1 = 9 work units
+        within = Limits(max_depth=3, max_elements=4, max_input_size=len(input), max_work=9)
+        self.assertEqual(create(input=input, hash_function=hash_functions.SHA256, version=1, limits=within), fingerprint)
+
+        exceeding = (
+            Limits(max_depth=2),
+            Limits(max_elements=3),
+            Limits(max_input_size=len(input) - 1),
+            Limits(max_work=8),
+        )
+        for limits in exceeding:
+            with self.assertRaises(exceptions.LimitExceeded):
+                create(input=input, hash_function=hash_functions.SHA256, version=1, limits=limits)
+
+        deep_input = "[" * 100000 + "]" * 100000
+        with self.assertRaises(exceptions.LimitExceeded):
+            create(input=deep_input, hash_function=hash_functions.SHA256, version=1, limits=Limits(max_input_size=1000))
+        # Input deeper than json.loads can parse is rejected while it's parsed iteratively
+        deep_input = "[" * 1000000 + "]" * 1000000
+        with self.assertRaisesRegex(exceptions.LimitExceeded, "depth"):
+            create(input=deep_input, hash_function=hash_functions.SHA256, version=1, limits=Limits(max_depth=32))
+        deep_data = []
+        for _ in range(100000):
+            deep_data = [deep_data]
+        with self.assertRaises(exceptions.LimitExceeded):
+            create_from_object(input=[1], hash_function=hash_functions.SHA256, version=1, limits=Limits(max_work=1))
+        with self.assertRaises(exceptions.LimitExceeded):
+            Limits(max_depth=64)._check_data(data=deep_data)
+
+        for name in ("max_depth", "max_elements", "max_input_size", "max_work"):
+            with self.assertRaises(ValueError):
+                Limits(**{name: 0})
+
+    def test_limits_with_fingerprint_cache(self):
+        """Test admission limits with a fingerprint cache.
+
+        Verify that:
+        - LimitExceeded is raised for cached input that exceeds the limits of the current call
+        - Fingerprints created within the same limits are reused
+        """
+        input = json.dumps([[1, 2], [3]])
+        fingerprint_cache = FingerprintCache()
+        fingerprint = create(input=input, hash_function=hash_functions.SHA256, version=1, fingerprint_cache=fingerprint_cache)
+        for limits in (Limits(max_depth=1), Limits(max_elements=2), Limits(max_work=5)):
+            with self.assertRaises(exceptions.LimitExceeded):
+                create(input=input, hash_function=hash_functions.SHA256, version=1, fingerprint_cache=fingerprint_cache, limits=limits)
+            with self.assertRaises(exceptions.LimitExceeded):
+                create_from_bytes(
+                    input=input.encode("utf-8"), hash_function=hash_functions.SHA256, version=1, fingerprint_cache=fingerprint_cache, limits=limits
+                )
+            with self.assertRaises(exceptions.LimitExceeded):
+                match(input=input, target_fingerprint=fingerprint, fingerprint_cache=fingerprint_cache, limits=limits)
+
+        limits = Limits(max_depth=2)
+        for _ in range(2):
+            cached = create(input=input, hash_function=hash_functions.SHA256, version=1, fingerprint_cache=fingerprint_cache, limits=limits)
+            self.assertEqual(cached, fingerprint)
+        self.assertEqual(fingerprint_cache.hits, 1)
+
+    def test_limits_differential(self):
+        """Test admission limits with random JSON data.
+
+        Verify that:
+        - Limits set to the exact statistics of the data never raise, and limits one below always raise
+        """
+        rng = random.Random(17)
+        for _ in range(100):
+            data = random_json(rng)
+            depth, elements, work = _statistics(data)
+            input = json.dumps(data)
+            limits = Limits(max_depth=max(depth, 1), max_elements=elements, max_work=work)
+            create(input=input, hash_function=hash_functions.SHA256, version=1, limits=limits)
+            for name, value in (("max_depth", depth), ("max_elements", elements), ("max_work", work)):
+                if value > 1:
+                    with self.assertRaises(exceptions.LimitExceeded):
+                        create(input=input, hash_function=hash_functions.SHA256, version=1, limits=Limits(**{name: value - 1}))
+
+    def test_limits_entry_points(self):
+        """Test admission limits with all fingerprint creation and matching functions.
+
+        Verify that:
+        - LimitExceeded is raised by create_multi(), create_from_bytes(), create_from_file(), match() and find_matches()
+        """
+        input = json.dumps([[1, 2], [3]])
+        fingerprint = create(input=input, hash_function=hash_functions.SHA256, version=1)
+        limits = Limits(max_depth=1)
+        with self.assertRaises(exceptions.LimitExceeded):
+            create_multi(input=input, hash_functions=[hash_functions.SHA256], version=1, limits=limits)
+        with self.assertRaises(exceptions.LimitExceeded):
+            create_from_bytes(input=input.encode("utf-8"), hash_function=hash_functions.SHA256, version=1, limits=limits)
+        with self.assertRaises(exceptions.LimitExceeded):
+            match(input=input, target_fingerprint=fingerprint, limits=limits)
+        with self.assertRaises(exceptions.LimitExceeded):
+            find_matches(input=input, fingerprints=[fingerprint], limits=limits)
+        self.assertTrue(match(input=input, target_fingerprint=fingerprint, limits=Limits(max_depth=2)))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "data.json")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(input)
+            with self.assertRaises(exceptions.LimitExceeded):
+                create_from_file(path=path, hash_function=hash_functions.SHA256, version=1, limits=Limits(max_input_size=len(input) - 1))
+
+
+def _statistics(data):
+    """Compute the nesting depth, the number of data elements and the work units of JSON data recursively."""
+    if type(data) in (dict, list) and data:
+        values = data.values() if type(data) is dict else data
+        statistics = [_statistics(value) for value in values]
+        nested = 1 if type(data) is list else 0
+        depth = 1 + max(statistic[0] for statistic in statistics)
+        elements = sum(statistic[1] for statistic in statistics)
+        work = sum(statistic[2] + nested * statistic[1] for statistic in statistics)
+        return depth, elements, work
+    return (1 if type(data) in (dict, list) else 0), 1, 1
+
+
+if __name__ == "__main__":
+    unittest.main()
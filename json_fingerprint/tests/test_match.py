@@ -1,7 +1,7 @@
 import json
 import unittest
 
-from json_fingerprint import create, exceptions, hash_functions, match
+from json_fingerprint import FingerprintCache, create, exceptions, hash_functions, match
 
 
 class TestMatch(unittest.TestCase):
@@ -32,6 +32,21 @@ class TestMatch(unittest.TestCase):
         with self.assertRaises(exceptions.FingerprintPattern):
             match(input=input, target_fingerprint="invalid fingerprint string")
 
+    def test_jfpv1_match_with_fingerprint_cache(self):
+        """Test json fingerprint matcher with a fingerprint cache.
+
+        Verify that:
+        - Matches are identical with and without a fingerprint cache
+        - Repeated matches of an identical input reuse the cached fingerprint
+        """
+        input = json.dumps({"foo": "bar"})
+        jfpv1_sha256 = create(input=input, hash_function=hash_functions.SHA256, version=1)
+        fingerprint_cache = FingerprintCache()
+        self.assertEqual(match(input=input, target_fingerprint=jfpv1_sha256, fingerprint_cache=fingerprint_cache), True)
+        self.assertEqual(match(input=input, target_fingerprint=jfpv1_sha256, fingerprint_cache=fingerprint_cache), True)
+        self.assertEqual(match(input=json.dumps([]), target_fingerprint=jfpv1_sha256, fingerprint_cache=fingerprint_cache), False)
+        self.assertEqual((fingerprint_cache.hits, fingerprint_cache.misses), (1, 2))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,156 @@
+import contextlib
+import io
+import json
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from json_fingerprint import (
+    _hash_registry,
+    create,
+    create_from_ndjson,
+    exceptions,
+    from_bytes_many,
+    hash_functions,
+)
+from json_fingerprint.__main__ import main
+from json_fingerprint.tests.utils import random_json
+
+
+class _Stdout:
+    def __init__(self):
+        self.buffer = io.BytesIO()
+
+
+class TestNdjson(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(19)
+        self.records = [json.dumps(random_json(rng)) for _ in range(40)]
+        self.expected = [create(input=record, hash_function=hash_functions.SHA256, version=1) for record in self.records]
+        self.ndjson = "\n".join(self.records) + "\n"
+
+    def _run_main(self, argv):
+        stdout = _Stdout()
+        stderr = io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            status = main(argv)
+        return status, stdout.buffer.getvalue(), stderr.getvalue()
+
+    def test_create_from_ndjson(self):
+        """Test NDJSON fingerprint creation.
+
+        Verify that:
+        - Fingerprints are identical to create() of each line, with line numbers, with binary and text streams
+        - Lines split across buffer boundaries are reassembled, with and without worker processes
+        """
+        expected = list(enumerate(self.expected, start=1))
+        for buffer_size in (1, 7, 1024 * 1024):
+            for workers in (1, 2):
+                stream = io.BytesIO(self.ndjson.encode("utf-8"))
+                results = create_from_ndjson(stream, hash_function="sha256", version=1, workers=workers, chunksize=3, buffer_size=buffer_size)
+                self.assertEqual(list(results), expected)
+        results = create_from_ndjson(io.StringIO(self.ndjson), hash_function="sha256", version=1, buffer_size=5)
+        self.assertEqual(list(results), expected)
+
+    def test_create_from_ndjson_lines(self):
+        """Test NDJSON line handling.
+
+        Verify that:
+        - Blank lines are skipped but counted in the line numbers
+        - A last line without a line feed, and CRLF line endings are handled
+        - UTF-16 and UTF-32 encoded streams are detected and split into records after decoding
+        """
+        stream = io.BytesIO(b'\n{"a": 1}\r\n  \n[1, 2]')
+        results = list(create_from_ndjson(stream, hash_function="sha256", version=1, buffer_size=3))
+        expected = [
+            (2, create(input='{"a": 1}', hash_function="sha256", version=1)),
+            (4, create(input="[1, 2]", hash_function="sha256", version=1)),
+        ]
+        self.assertEqual(results, expected)
+
+        ndjson = '{"a": "\u010a"}\n[1, 2]\n"\U0001f600"'
+        expected = [(line_no, create(input=line, hash_function="sha256", version=1)) for line_no, line in enumerate(ndjson.split("\n"), start=1)]
+        for encoding in ("utf-8-sig", "utf-16", "utf-16-le", "utf-16-be", "utf-32", "utf-32-le", "utf-32-be"):
+            for buffer_size in (1, 5, 1024):
+                stream = io.BytesIO(ndjson.encode(encoding))
+                results = create_from_ndjson(stream, hash_function="sha256", version=1, buffer_size=buffer_size)
+                self.assertEqual(list(results), expected)
+
+    def test_create_from_ndjson_errors(self):
+        """Test NDJSON error handling.
+
+        Verify that:
+        - Invalid records raise JSONLoad with the line number by default
+        - Invalid records produce None with errors="skip"
+        - Invalid options are rejected before the stream is read
+        """
+        ndjson = b'{"a": 1}\nnot json\n[1]\n'
+        with self.assertRaisesRegex(exceptions.JSONLoad, "on line 2"):
+            list(create_from_ndjson(io.BytesIO(ndjson), hash_function="sha256", version=1))
+        results = list(create_from_ndjson(io.BytesIO(ndjson), hash_function="sha256", version=1, errors="skip"))
+        self.assertEqual([line_no for line_no, _ in results], [1, 2, 3])
+        self.assertIsNone(results[1][1])
+
+        with self.assertRaises(ValueError):
+            create_from_ndjson(io.BytesIO(ndjson), hash_function="sha256", version=1, errors="ignore")
+        with self.assertRaises(ValueError):
+            create_from_ndjson(io.BytesIO(ndjson), hash_function="sha256", version=1, buffer_size=0)
+        with self.assertRaises(exceptions.HashFunction):
+            create_from_ndjson(io.BytesIO(ndjson), hash_function="md5", version=1)
+
+    def test_main(self):
+        """Test the command-line entry point.
+
+        Verify that:
+        - Line numbers and fingerprints are written for each record, prefixed with file names with multiple files
+        - Fingerprints are written in the binary format with --binary
+        - A throughput report is written into the standard error with --report
+        - Invalid records fail with exit status 1, or are skipped with --errors skip
+        - Hash functions without a binary id fail with exit status 1 with --binary, which can't be combined with --errors skip
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "records.ndjson")
+            with open(path, "w") as file:
+                file.write(self.ndjson)
+
+            status, output, _ = self._run_main([path])
+            self.assertEqual(status, 0)
+            expected = "".join(f"{line_no}\t{fingerprint}\n" for line_no, fingerprint in enumerate(self.expected, start=1))
+            self.assertEqual(output.decode(), expected)
+
+            status, output, _ = self._run_main([path, path, "--workers", "2", "--chunksize", "5"])
+            self.assertEqual(status, 0)
+            self.assertEqual(output.decode(), "".join(f"{path}\t{line}\n" for line in expected.splitlines() * 2))
+
+            status, output, report = self._run_main([path, "--binary", "--report"])
+            self.assertEqual(status, 0)
+            self.assertEqual(from_bytes_many(output), self.expected)
+            self.assertIn(f"{len(self.records)} records (0 invalid), {len(self.ndjson)} bytes", report)
+
+            invalid_path = os.path.join(directory, "invalid.ndjson")
+            with open(invalid_path, "w") as file:
+                file.write('{"a": 1}\n{"a": \n')
+            status, output, error = self._run_main([invalid_path])
+            self.assertEqual(status, 1)
+            self.assertIn("on line 2", error)
+            status, output, _ = self._run_main([invalid_path, "--errors", "skip"])
+            self.assertEqual(status, 0)
+            self.assertEqual(len(output.splitlines()), 1)
+
+            status, _, error = self._run_main([os.path.join(directory, "missing.ndjson")])
+            self.assertEqual(status, 1)
+            self.assertIn("Error:", error)
+
+            with mock.patch.dict(_hash_registry.HASH_FUNCTION_IDS):
+                del _hash_registry.HASH_FUNCTION_IDS["sha256"]
+                status, _, error = self._run_main([path, "--binary"])
+            self.assertEqual(status, 1)
+            self.assertIn("Error: Expected one of hash functions with a binary id", error)
+            with self.assertRaises(SystemExit):
+                self._run_main([invalid_path, "--binary", "--errors", "skip"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import json
+import random
+import threading
+import unittest
+from unittest import mock
+
+from json_fingerprint import (
+    Limits,
+    _parallel,
+    create,
+    create_parallel,
+    exceptions,
+    hash_functions,
+)
+from json_fingerprint.tests.utils import random_json
+
+
+class TestParallel(unittest.TestCase):
+    def test_create_parallel(self):
+        """Test parallel fingerprint creation of single documents.
+
+        Verify that:
+        - Fingerprints are identical to create() with random top-level arrays and objects, and any number of workers
+        - Top-level arrays with and without elements of their own, and nested arrays of arrays are handled
+        - Keys and values with line feeds are handled
+        """
+        rng = random.Random(23)
+        documents = [
+            [[1, 2], [3, [4, 5]]],
+            [1, "a", {"b": [2, None]}, [], {}],
+            {"a": 1, "b": [2, {"c": 3}], "d": {"e": [4]}, "|{f}": "g"},
+            [{"id": i, "tags": ["x", "y"][: i % 3]} for i in range(50)],
+            ["line\nfeed", {"key\nwith": "line\nfeeds"}, ["\n"]],
+        ]
+        for _ in range(20):
+            data = random_json(rng)
+            documents.extend([[data, 1, [data]], {"x": data, "y": [data, 2]}])
+        for document in documents:
+            input = json.dumps(document)
+            expected = create(input=input, hash_function=hash_functions.SHA256, version=1)
+            for workers in (1, 2, 3):
+                self.assertEqual(create_parallel(input=input, hash_function=hash_functions.SHA256, version=1, workers=workers), expected)
+
+    def test_create_parallel_concurrent_calls(self):
+        """Test concurrent parallel fingerprint creation from multiple threads.
+
+        Verify that:
+        - Each call fingerprints its own document, and no call fails or returns the fingerprint of another call
+        """
+        inputs = [json.dumps([{"thread": thread, "id": i, "values": [i, [thread]]} for i in range(200)]) for thread in range(4)]
+        expected = [create(input=input, hash_function=hash_functions.SHA256, version=1) for input in inputs]
+        results = [[] for _ in inputs]
+
+        def fingerprint(index):
+            for _ in range(5):
+                try:
+                    results[index].append(create_parallel(input=inputs[index], hash_function=hash_functions.SHA256, version=1, workers=2))
+                except Exception as exc:
+                    results[index].append(exc)
+
+        threads = [threading.Thread(target=fingerprint, args=(index,)) for index in range(len(inputs))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [[fingerprint] * 5 for fingerprint in expected])
+
+    def test_create_parallel_pickled_items(self):
+        """Test parallel fingerprint creation where the worker processes aren't forked.
+
+        Verify that:
+        - Fingerprints are identical to create() when the items are pickled to the worker processes
+        """
+        input = json.dumps([{"id": i, "values": [i, [i + 1]]} for i in range(20)] + [{"a": {"b": 1}}])
+        expected = create(input=input, hash_function=hash_functions.SHA512, version=1)
+        with mock.patch.object(_parallel, "_FORK_ITEMS", False):
+            self.assertEqual(create_parallel(input=input, hash_function=hash_functions.SHA512, version=1, workers=2), expected)
+
+    def test_create_parallel_scalars(self):
+        """Test parallel fingerprint creation of documents that can't be split.
+
+        Verify that:
+        - Fingerprints of scalars and empty containers are identical to create()
+        """
+        for input in ("1", '"a"', "null", "[]", "{}"):
+            expected = create(input=input, hash_function=hash_functions.SHA256, version=1)
+            self.assertEqual(create_parallel(input=input, hash_function=hash_functions.SHA256, version=1, workers=2), expected)
+
+    def test_create_parallel_errors(self):
+        """Test parallel fingerprint creation errors.
+
+        Verify that:
+        - Invalid inputs, hash functions and numbers of workers are rejected, and limits are enforced
+        """
+        with self.assertRaises(exceptions.JSONLoad):
+            create_parallel(input="[1,", hash_function=hash_functions.SHA256, version=1, workers=2)
+        with self.assertRaises(exceptions.InputDataType):
+            create_parallel(input=b"[1]", hash_function=hash_functions.SHA256, version=1)
+        with self.assertRaises(exceptions.HashFunction):
+            create_parallel(input="[1]", hash_function="md5", version=1)
+        with self.assertRaises(ValueError):
+            create_parallel(input="[1]", hash_function=hash_functions.SHA256, version=1, workers=0)
+        with self.assertRaises(exceptions.LimitExceeded):
+            create_parallel(input="[[1]]", hash_function=hash_functions.SHA256, version=1, workers=2, limits=Limits(max_depth=1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import json
+import threading
+import unittest
+
+from json_fingerprint import (
+    SubtreeCache,
+    add_profile_hook,
+    create,
+    create_from_bytes,
+    create_from_object,
+    hash_functions,
+    profile,
+    remove_profile_hook,
+)
+
+
+class TestProfile(unittest.TestCase):
+    def test_profile_context(self):
+        """Test per-phase profiling of fingerprint creation in a context.
+
+        Verify that:
+        - Fingerprints are identical with and without profiling
+        - A profile is recorded for each created fingerprint, with the element, list and depth statistics of the data
+        - Profiles are not recorded outside of the context
+        """
+        input = json.dumps({"a": [1, 2, [3, {"b": []}]], "c": "x"})
+        expected = create(input=input, hash_function=hash_functions.SHA256, version=1)
+        hooked = []
+        with profile(hook=hooked.append) as profiles:
+            self.assertEqual(create(input=input, hash_function=hash_functions.SHA256, version=1), expected)
+            self.assertEqual(create_from_bytes(input=input.encode("utf-8"), hash_function=hash_functions.SHA256, version=1), expected)
+            self.assertEqual(create_from_object(input=json.loads(input), hash_function=hash_functions.SHA256, version=1), expected)
+        create(input=input, hash_function=hash_functions.SHA256, version=1)
+        self.assertEqual(hooked, profiles)
+        self.assertEqual(len(profiles), 3)
+
+        record = profiles[0]
+        self.assertEqual((record.hash_function, record.input_size), (hash_functions.SHA256, len(input)))
+        self.assertEqual((record.elements, record.lists, record.max_depth), (5, 2, 5))
+        self.assertGreater(record.bytes_hashed, 0)
+        phases = record.parse + record.flatten_and_hash + record.sort + record.final_hash
+        self.assertAlmostEqual(record.total, phases, places=6)
+        self.assertIn("flatten_and_hash", record._asdict())
+        self.assertEqual(profiles[1].input_size, len(input.encode("utf-8")))
+        self.assertIsNone(profiles[2].input_size)
+
+    def test_profile_hooks(self):
+        """Test global profile hooks.
+
+        Verify that:
+        - Hooks are called for fingerprints created in any thread until they're removed
+        - Elements reused from a subtree cache are not counted as hashed bytes
+        """
+        profiles = []
+        add_profile_hook(profiles.append)
+        try:
+            input = json.dumps([[1, 2], [1, 2]])
+            subtree_cache = SubtreeCache()
+            thread = threading.Thread(target=create, kwargs={"input": input, "hash_function": "sha256", "version": 1, "subtree_cache": subtree_cache})
+            thread.start()
+            thread.join()
+            create(input=input, hash_function=hash_functions.SHA256, version=1, subtree_cache=subtree_cache)
+        finally:
+            remove_profile_hook(profiles.append)
+        create(input=input, hash_function=hash_functions.SHA256, version=1)
+        self.assertEqual(len(profiles), 2)
+        self.assertLess(profiles[1].bytes_hashed, profiles[0].bytes_hashed)
+
+
+if __name__ == "__main__":
+    unittest.main()
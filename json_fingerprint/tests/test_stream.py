@@ -0,0 +1,143 @@
+import io
+import json
+import os
+import random
+import unittest
+
+from json_fingerprint import (
+    _stream,
+    create,
+    create_from_stream,
+    exceptions,
+    hash_functions,
+)
+from json_fingerprint.tests.utils import random_json
+
+TESTS_DIR = os.path.dirname(__file__)
+TESTDATA_DIR = os.path.join(TESTS_DIR, "testdata")
+
+
+class NonSeekableStream(io.RawIOBase):
+    def __init__(self, data: bytes):
+        self._stream = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        return self._stream.readinto(buffer)
+
+
+class ReadSizeStream(io.BytesIO):
+    """A seekable stream that records the largest read."""
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.max_read_size = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.max_read_size = max(self.max_read_size, len(data))
+        return data
+
+
+class TestStream(unittest.TestCase):
+    def test_event_reader(self):
+        """Test the incremental JSON parser.
+
+        Verify that:
+        - Parse events are produced in document order, with keys and values identical to json.loads
+        - Values spanning chunk boundaries are parsed correctly
+        """
+        data = '{"a": [1, -2.5e3, "x\\u00e4\\ud83d\\ude00", true, null], "b": {}, "c": []}'
+        expected_events = [
+            (_stream.START_MAP, None),
+            (_stream.MAP_KEY, "a"),
+            (_stream.START_ARRAY, None),
+            (_stream.VALUE, 1),
+            (_stream.VALUE, -2.5e3),
+            (_stream.VALUE, "xä😀"),
+            (_stream.VALUE, True),
+            (_stream.VALUE, None),
+            (_stream.END_ARRAY, None),
+            (_stream.MAP_KEY, "b"),
+            (_stream.START_MAP, None),
+            (_stream.END_MAP, None),
+            (_stream.MAP_KEY, "c"),
+            (_stream.START_ARRAY, None),
+            (_stream.END_ARRAY, None),
+            (_stream.END_MAP, None),
+        ]
+        for chunk_size in (1, 2, 3, 1024):
+            events = list(_stream._EventReader(stream=io.StringIO(data), chunk_size=chunk_size).events())
+            self.assertEqual(events, expected_events)
+
+    def test_jfpv1_create_from_stream(self):
+        """Test jfpv1 fingerprint creation from streams.
+
+        Verify that:
+        - Fingerprints created from text, binary and non-seekable streams match the known valid fingerprint
+        """
+        expected = "jfpv1$sha256$b182c755347a6884fd11f1194cbe0961f548e5ac62be78a56c48c3c05eb56650"
+        with open(os.path.join(TESTDATA_DIR, "jfpv1_test_obj_1.json"), "rb") as file:
+            self.assertEqual(create_from_stream(file, hash_function=hash_functions.SHA256, version=1), expected)
+            file.seek(0)
+            raw = file.read()
+
+        with open(os.path.join(TESTDATA_DIR, "jfpv1_test_obj_2.json"), "r", encoding="utf-8") as file:
+            self.assertEqual(create_from_stream(file, hash_function=hash_functions.SHA256, version=1), expected)
+
+        stream = NonSeekableStream(raw)
+        self.assertEqual(create_from_stream(stream, hash_function=hash_functions.SHA256, version=1, chunk_size=7), expected)
+
+    def test_jfpv1_stream_fingerprint_differential(self):
+        """Test jfpv1 stream fingerprints against create() with random data.
+
+        Verify that:
+        - Fingerprints are identical to the ones created with create(), regardless of chunk sizes and encodings
+        - Objects with duplicate keys produce identical fingerprints
+        """
+        rng = random.Random(2)
+        for _ in range(100):
+            input = json.dumps(random_json(rng), ensure_ascii=rng.random() < 0.5, indent=rng.choice((None, 1)))
+            hash_function = rng.choice((hash_functions.SHA256, hash_functions.SHA384, hash_functions.SHA512))
+            expected = create(input=input, hash_function=hash_function, version=1)
+            for chunk_size in (1, 5, 4096):
+                fp = create_from_stream(io.StringIO(input), hash_function=hash_function, version=1, chunk_size=chunk_size)
+                self.assertEqual(fp, expected)
+            fp = create_from_stream(io.BytesIO(input.encode("utf-16")), hash_function=hash_function, version=1, chunk_size=3)
+            self.assertEqual(fp, expected)
+
+        duplicate_inputs = (
+            '{"a": 1, "a": [2]}',
+            '[{"a": [1, 2], "b": 2, "a": 3}]',
+            '{"a": [[1], {"a": [2, 3], "a": 4}], "b": [5, 6], "a": {"c": [7], "c": [8, 9, 10]}}',
+            '[{"a": {"b": [1]}, "a": {}, "b": [{"a": 1, "a": [2, [3]], "a": [4]}]}, [5, 6]]',
+        )
+        for input in duplicate_inputs:
+            expected = create(input=input, hash_function=hash_functions.SHA256, version=1)
+            for chunk_size in (1, 4096):
+                stream = ReadSizeStream(input.encode("utf-8"))
+                fp = create_from_stream(stream, hash_function=hash_functions.SHA256, version=1, chunk_size=chunk_size)
+                self.assertEqual(fp, expected)
+                # The stream is never read as a whole
+                self.assertLessEqual(stream.max_read_size, chunk_size)
+
+    def test_jfpv1_stream_errors(self):
+        """Test jfpv1 stream fingerprint errors.
+
+        Verify that:
+        - JSONLoad exception is properly raised with invalid JSON input
+        - Out of range float values are rejected like with create()
+        """
+        for input in ("", "[1,]", '{"a": 1,}', "[1] x", '["a', '{"a" 1}', "[01]", "\ufeff[1]", b"[\xff]"):
+            stream = io.BytesIO(input) if type(input) is bytes else io.StringIO(input)
+            with self.assertRaises(exceptions.JSONLoad):
+                create_from_stream(stream, hash_function=hash_functions.SHA256, version=1, chunk_size=2)
+
+        with self.assertRaises(ValueError):
+            create_from_stream(io.StringIO("[1, NaN]"), hash_function=hash_functions.SHA256, version=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
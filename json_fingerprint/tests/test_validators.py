@@ -39,6 +39,24 @@ class TestValidators(unittest.TestCase):
         with self.assertRaises(exceptions.InputDataType):
             _validators._validate_input_type(input=123)
 
+    def test_bytes_input_data_type(self):
+        """Test bytes-like input data type error.
+
+        Verify that:
+        - InputDataType exception is not raised with bytes-like inputs
+        - InputDataType exception is properly raised with non-bytes-like inputs
+        """
+        for input in (b"abc", bytearray(b"abc"), memoryview(b"abc")):
+            try:
+                _validators._validate_bytes_input_type(input=input)
+            except Exception as exc:
+                err = "_validate_bytes_input_type() failed with a valid bytes-like input"
+                self.fail(f"{err}: {exc}")
+
+        for input in ("abc", 123, None):
+            with self.assertRaises(exceptions.InputDataType):
+                _validators._validate_bytes_input_type(input=input)
+
     def test_jfpv1_hash_function(self):
         """Test JSON fingerprint HashFunction exception.
 
@@ -0,0 +1,24 @@
+import random
+from typing import Any
+
+PRIMITIVES = (
+    lambda rng: rng.randint(-1000, 1000),
+    lambda rng: rng.randint(-(2**80), 2**80),
+    lambda rng: rng.uniform(-1e6, 1e6),
+    lambda rng: rng.choice((0.1, -0.0, 1e-300, 1.5e300)),
+    lambda rng: rng.choice((True, False, None)),
+    lambda rng: rng.choice(("", "a", "b", "x y", "ä€", "𝄞", 'quo"te', "back\\slash", "ctrl\n\t\x01", "|{[]}|")),
+    lambda rng: [],
+    lambda rng: {},
+)
+
+
+def random_json(rng: random.Random, max_depth: int = 5, max_width: int = 4) -> Any:
+    """Generate a random JSON-compatible data structure for differential testing."""
+    choice = rng.random()
+    if max_depth > 0 and choice < 0.3:
+        return [random_json(rng, max_depth - 1, max_width) for _ in range(rng.randint(1, max_width))]
+    if max_depth > 0 and choice < 0.6:
+        keys = ("a", "b", "c", "ä", "|", "[1]", "{x}", 'q"k')
+        return {rng.choice(keys): random_json(rng, max_depth - 1, max_width) for _ in range(rng.randint(1, max_width))}
+    return rng.choice(PRIMITIVES)(rng)